@@ -0,0 +1,358 @@
+"""Asynchronous Triangulator API Service.
+
+This module provides an ASGI variant of the Triangulator API. The PointSet
+is fetched from the PointSet Manager with non-blocking I/O and the
+triangulation runs in a bounded pool of worker processes, so that a single
+event loop keeps serving requests while every core triangulates. When too
+many triangulations already wait for a worker, new ones are rejected with
+503 instead of queueing without bound.
+
+The application is served by any ASGI server, for instance
+``uvicorn AsyncTriangulator:app`` from the src directory.
+"""
+
+import asyncio
+import json
+import mmap
+import os
+import urllib.parse
+import uuid
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any
+
+from classes.pointset import PointSet
+from services.ApiService import (
+    CACHE_MAX_BYTES,
+    CACHE_TTL,
+    CHUNK_SIZE,
+    DISK_CACHE_DIR,
+    DISK_CACHE_MAX_BYTES,
+    POINTSET_MANAGER_URL,
+    PROCESS_CONTEXT,
+    WORKERS,
+    cache_variant,
+    error_status,
+    max_points_limit,
+    merge_tolerance,
+    triangulate_bytes,
+)
+from services.CacheService import DiskCache, TriangulationCache
+from services.CoalescingService import AsyncSingleFlight
+from services.PointSetManagerService import (
+    AsyncPointSetManagerClient,
+    CircuitOpenError,
+)
+
+# Nombre de triangulations acceptées à la fois (en cours ou en attente d'un
+# processus) avant de répondre 503
+MAX_PENDING = int(os.environ.get("TRIANGULATION_MAX_PENDING", 4 * WORKERS))
+
+# Délai conseillé au client quand les processus sont saturés
+OVERLOAD_RETRY_AFTER = 1
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class OverloadedError(Exception):
+    """Raised when too many triangulations wait for a worker process."""
+
+
+class AsyncTriangulator:
+    """Represents the ASGI application of the Triangulator API.
+
+    Attributes:
+        manager (AsyncPointSetManagerClient): The PointSet Manager client.
+        cache (TriangulationCache): The in-memory triangulation cache.
+        disk_cache (DiskCache | None): The optional on-disk cache.
+        max_pending (int): The number of triangulations accepted at once.
+        pending (int): The number of triangulations running or waiting for
+            a worker.
+        in_flight (AsyncSingleFlight): The coalescing group of requests.
+
+    """
+
+    def __init__(
+        self,
+        manager: AsyncPointSetManagerClient,
+        cache: TriangulationCache,
+        disk_cache: DiskCache | None = None,
+        workers: int = 1,
+        max_pending: int = 4,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize an AsyncTriangulator.
+
+        Args:
+            manager (AsyncPointSetManagerClient): The PointSet Manager client.
+            cache (TriangulationCache): The in-memory triangulation cache.
+            disk_cache (DiskCache | None): The optional on-disk cache.
+            workers (int): The number of worker processes, created on the
+                first triangulation.
+            max_pending (int): The number of triangulations accepted at once.
+            executor (Executor | None): The executor running triangulations,
+                instead of a process pool owned by the application.
+
+        """
+        self.manager = manager
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.max_pending = max_pending
+        self.pending = 0
+        self.in_flight = AsyncSingleFlight()
+        self._workers = workers
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            status, headers, body = await self.handle(
+                scope["method"], scope["path"], scope.get("query_string", b"")
+            )
+            await self._respond(send, status, headers, body)
+
+    async def close(self) -> None:
+        """Stop the worker processes and close the manager connections."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        await self.manager.close()
+
+    async def handle(
+        self, method: str, path: str, query_string: bytes
+    ) -> tuple[int, dict[str, str], bytes | mmap.mmap]:
+        """Route a request and return its response.
+
+        Only ``GET /triangulation/<pointSetId>`` is served, with the same
+        validation, caches and errors as the Flask API, plus 503 when the
+        worker processes are saturated.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path.
+            query_string (bytes): The raw query string.
+
+        Returns:
+            tuple[int, dict[str, str], bytes | mmap.mmap]: The status, the
+                headers and the body of the response.
+
+        """
+        prefix, _, pointSetId = path.partition("/triangulation/")
+        if prefix or not pointSetId or "/" in pointSetId:
+            return json_response(404, "Not found")
+        if method != "GET":
+            return json_response(405, "Method not allowed", {"Allow": "GET"})
+
+        # Valide l'id du pointset
+        try:
+            uuid.UUID(pointSetId)
+        except ValueError:
+            return json_response(400, "Invalid UUID")
+
+        # Valide le moteur de triangulation demandé
+        query = urllib.parse.parse_qs(query_string.decode("latin-1"))
+        engine = query.get("engine", ["bowyer-watson"])[0]
+        if engine not in PointSet.ENGINES:
+            return json_response(400, f"Unknown triangulation engine: {engine}")
+        try:
+            tolerance = merge_tolerance(query.get("tolerance", [None])[0])
+            max_points = max_points_limit(query.get("maxPoints", [None])[0])
+        except ValueError as e:
+            return json_response(400, str(e))
+
+        # Un id déjà vu est servi sans interroger le pointset manager
+        variant = cache_variant(engine, tolerance, max_points=max_points)
+        cached = self.cache.get_by_id(pointSetId, variant)
+        if cached is not None:
+            return binary_response(cached)
+
+        try:
+            payload = await self.in_flight.do(
+                (pointSetId, variant),
+                partial(
+                    self.load_triangulation, pointSetId, engine, tolerance, max_points
+                ),
+            )
+        except OverloadedError:
+            # Les processus sont saturés : on déleste plutôt que d'attendre
+            return json_response(
+                503, "Service overloaded", {"Retry-After": str(OVERLOAD_RETRY_AFTER)}
+            )
+        except Exception as e:
+            headers = {}
+            if isinstance(e, CircuitOpenError):
+                # Le manager est considéré hors service : on répond tout de suite
+                headers["Retry-After"] = str(int(self.manager.breaker.reset_timeout))
+            return json_response(*error_status(e), headers)
+        return binary_response(payload)
+
+    async def load_triangulation(
+        self,
+        pointSetId: str,
+        engine: str,
+        tolerance: float | None = None,
+        max_points: int | None = None,
+    ) -> bytes | mmap.mmap:
+        """Fetch a PointSet and return its triangulation, from a cache if possible.
+
+        Args:
+            pointSetId (str): The UUID of the PointSet to triangulate.
+            engine (str): The triangulation engine.
+            tolerance (float | None): The merge tolerance of duplicated
+                points, None to reject them.
+            max_points (int | None): The number of points the PointSet is
+                decimated to, None to triangulate every point.
+
+        Returns:
+            bytes | mmap.mmap: The serialized Triangles.
+
+        Raises:
+            PointSetNotFoundError: If the PointSet does not exist.
+            ManagerUnavailableError: If the PointSet Manager cannot be reached.
+            ManagerResponseError: If the PointSet Manager answers an error.
+            OverloadedError: If too many triangulations are pending.
+            ValueError: If the PointSet cannot be decoded or triangulated.
+
+        """
+        point_set_bytes = await self.manager.fetch_pointset(pointSetId)
+
+        # Le hachage et les accès au disque passent par des threads, pour ne
+        # pas bloquer la boucle pendant les autres requêtes
+        loop = asyncio.get_running_loop()
+
+        # Un contenu déjà triangulé sous un autre id partage le résultat
+        digest = await loop.run_in_executor(None, self.cache.digest, point_set_bytes)
+        variant = cache_variant(engine, tolerance, max_points=max_points)
+        cached = self.cache.get(digest, variant, pointSetId)
+        if cached is not None:
+            return cached
+        if self.disk_cache is not None:
+            mapped = await loop.run_in_executor(
+                None, self.disk_cache.get, digest, variant
+            )
+            if mapped is not None:
+                return mapped
+
+        payload = await self.run_triangulation(
+            point_set_bytes, engine, tolerance, max_points
+        )
+        self.cache.put(pointSetId, digest, variant, payload)
+        if self.disk_cache is not None:
+            await loop.run_in_executor(
+                None, self.disk_cache.put, digest, variant, payload
+            )
+        return payload
+
+    async def run_triangulation(
+        self,
+        point_set_bytes: bytes,
+        engine: str,
+        tolerance: float | None = None,
+        max_points: int | None = None,
+    ) -> bytes:
+        """Triangulate a serialized PointSet in the worker pool.
+
+        Args:
+            point_set_bytes (bytes): The byte representation of the PointSet.
+            engine (str): The triangulation engine.
+            tolerance (float | None): The merge tolerance of duplicated
+                points, None to reject them.
+            max_points (int | None): The number of points the PointSet is
+                decimated to, None to triangulate every point.
+
+        Returns:
+            bytes: The serialized Triangles.
+
+        Raises:
+            OverloadedError: If max_pending triangulations are already
+                running or waiting for a worker.
+            ValueError: If the PointSet cannot be decoded or triangulated.
+
+        """
+        if self.pending >= self.max_pending:
+            raise OverloadedError("Too many pending triangulations")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, mp_context=PROCESS_CONTEXT
+            )
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                triangulate_bytes,
+                point_set_bytes,
+                engine,
+                tolerance,
+                max_points,
+            )
+        finally:
+            self.pending -= 1
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Release the workers and connections when the server stops."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _respond(
+        send: Send, status: int, headers: dict[str, str], body: bytes | mmap.mmap
+    ) -> None:
+        """Send a response, by chunks for a memory-mapped payload."""
+        headers = {**headers, "Content-Length": str(len(body))}
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in headers.items()
+                ],
+            }
+        )
+        for start in range(0, len(body), CHUNK_SIZE):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": body[start : start + CHUNK_SIZE],
+                    "more_body": start + CHUNK_SIZE < len(body),
+                }
+            )
+        if not body:
+            await send({"type": "http.response.body", "body": b""})
+
+
+def json_response(
+    status: int, error: str, headers: dict[str, str] | None = None
+) -> tuple[int, dict[str, str], bytes]:
+    """Return an error response with a JSON body."""
+    body = json.dumps({"error": error}).encode()
+    return status, {"Content-Type": "application/json", **(headers or {})}, body
+
+
+def binary_response(
+    payload: bytes | mmap.mmap,
+) -> tuple[int, dict[str, str], bytes | mmap.mmap]:
+    """Return a successful response with serialized Triangles."""
+    return 200, {"Content-Type": "application/octet-stream"}, payload
+
+
+app = AsyncTriangulator(
+    AsyncPointSetManagerClient(POINTSET_MANAGER_URL),
+    TriangulationCache(CACHE_MAX_BYTES, CACHE_TTL),
+    DiskCache(DISK_CACHE_DIR, DISK_CACHE_MAX_BYTES) if DISK_CACHE_DIR else None,
+    workers=WORKERS,
+    max_pending=MAX_PENDING,
+)
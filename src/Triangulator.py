@@ -4,21 +4,294 @@ This module provides a Flask API to triangulate a PointSet retrieved from
 a PointSet Manager service.
 """
 
-import urllib.error
-import urllib.request
+import json
+import mmap
+import struct
 import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
-from flask import Flask, Response, jsonify
+from flask import Flask, Response, jsonify, request
 
-from classes.pointset import PointSet
+from classes.pointset import PointSet, constrained_from_bytes
+from classes.triangles import Triangles, little_endian_bytes
+from services.ApiService import (
+    CACHE_MAX_BYTES,
+    CACHE_TTL,
+    CHUNK_SIZE,
+    DISK_CACHE_DIR,
+    DISK_CACHE_MAX_BYTES,
+    POINTSET_MANAGER_URL,
+    PROCESS_CONTEXT,
+    WORKERS,
+    cache_variant,
+    error_status,
+    max_points_limit,
+    merge_tolerance,
+    triangulate_bytes,
+)
+from services.CacheService import DiskCache, TriangulationCache
+from services.CoalescingService import SingleFlight
+from services.PointSetManagerService import (
+    CircuitOpenError,
+    PointSetManagerClient,
+    decode_pointset,
+)
 
 app = Flask(__name__)
 
+# Client du pointset manager : connexions persistantes, timeouts, tentatives
+# et disjoncteur
+manager = PointSetManagerClient(POINTSET_MANAGER_URL)
+
+# Cache des triangulations en mémoire, et cache disque optionnel
+cache = TriangulationCache(CACHE_MAX_BYTES, CACHE_TTL)
+disk_cache = DiskCache(DISK_CACHE_DIR, DISK_CACHE_MAX_BYTES) if DISK_CACHE_DIR else None
+
+# Les requêtes simultanées pour le même pointset partagent un seul calcul
+in_flight = SingleFlight()
+
+# Lots : nombre maximal de pointsets, threads qui les chargent en parallèle
+# (autant que de connexions gardées vers le pointset manager), et processus
+# qui les triangulent hors du GIL (démarrés au premier lot par le serveur de
+# fork, jamais forkés depuis les threads du serveur)
+BATCH_MAX_SIZE = 1000
+BATCH_WORKERS = 8
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS)
+batch_processes = ProcessPoolExecutor(max_workers=WORKERS, mp_context=PROCESS_CONTEXT)
+
+# Clé des enveloppes convexes dans le cache, à côté des moteurs
+HULL_VARIANT = "hull"
+
+
+def stream_response(chunks: Iterable[bytes], length: int) -> Response:
+    """Stream a binary payload chunk by chunk.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the payload.
+        length (int): The total length of the chunks.
+
+    Returns:
+        Response: The binary response.
+
+    """
+    return Response(
+        chunks,
+        mimetype="application/octet-stream",
+        headers={"Content-Length": str(length)},
+        status=200,
+    )
+
+
+def mapped_response(mapped: mmap.mmap) -> Response:
+    """Stream a memory-mapped payload.
+
+    The mapping may be shared by several responses of coalesced requests:
+    it is not closed explicitly but released with its last reference.
+
+    Args:
+        mapped (mmap.mmap): The serialized Triangles.
+
+    Returns:
+        Response: The binary response.
+
+    """
+    chunks = (
+        mapped[start : start + CHUNK_SIZE]
+        for start in range(0, len(mapped), CHUNK_SIZE)
+    )
+    return stream_response(chunks, len(mapped))
+
+
+def load_triangulation(
+    pointSetId: str,
+    engine: str,
+    tolerance: float | None = None,
+    max_points: int | None = None,
+    executor: Executor | None = None,
+) -> bytes | mmap.mmap | Triangles:
+    """Fetch a PointSet and return its triangulation, from a cache if possible.
+
+    Args:
+        pointSetId (str): The UUID of the PointSet to triangulate.
+        engine (str): The triangulation engine.
+        tolerance (float | None): The merge tolerance of duplicated points,
+            None to reject them.
+        max_points (int | None): The number of points the PointSet is
+            decimated to, None to triangulate every point.
+        executor (Executor | None): The worker processes running the
+            triangulation, None to run it in the calling thread.
+
+    Returns:
+        bytes | mmap.mmap | Triangles: The serialized Triangles, or the
+            Triangles to serialize while sending them.
+
+    Raises:
+        PointSetNotFoundError: If the PointSet does not exist.
+        ManagerUnavailableError: If the PointSet Manager cannot be reached.
+        ManagerResponseError: If the PointSet Manager answers an error.
+        ValueError: If the PointSet cannot be decoded or triangulated.
+
+    """
+    # Récupère le pointset depuis le pointset manager, décodé à la réception
+    point_set, digest = manager.fetch_decoded_pointset(pointSetId)
+    return triangulate_content(
+        point_set,
+        digest,
+        engine,
+        pointSetId,
+        tolerance,
+        max_points=max_points,
+        executor=executor,
+    )
+
+
+def triangulate_content(
+    point_set: PointSet,
+    digest: bytes,
+    engine: str,
+    pointSetId: str | None = None,
+    tolerance: float | None = None,
+    segments: list[tuple[int, int]] | None = None,
+    max_points: int | None = None,
+    executor: Executor | None = None,
+) -> bytes | mmap.mmap | Triangles:
+    """Return the triangulation of a PointSet content, from a cache if possible.
+
+    A triangulation too large for the memory cache is never serialized as
+    a whole: it is written to the disk cache chunk by chunk, or returned
+    as Triangles to be streamed. A triangulation run by worker processes
+    comes back serialized, and is stored as it is.
+
+    Args:
+        point_set (PointSet): The PointSet to triangulate.
+        digest (bytes): The digest of the PointSet bytes.
+        engine (str): The triangulation engine.
+        pointSetId (str | None): The UUID the PointSet was fetched with, or
+            None for an uploaded PointSet.
+        tolerance (float | None): The merge tolerance of duplicated points,
+            None to reject them.
+        segments (list[tuple[int, int]] | None): The pairs of point indices
+            that must be edges of the triangulation.
+        max_points (int | None): The number of points the PointSet is
+            decimated to, None to triangulate every point.
+        executor (Executor | None): The worker processes running the
+            triangulation without segments, None to run it in the calling
+            thread.
+
+    Returns:
+        bytes | mmap.mmap | Triangles: The serialized Triangles, or the
+            Triangles to serialize while sending them.
+
+    Raises:
+        ValueError: If the PointSet cannot be triangulated.
+
+    """
+    # Un contenu déjà triangulé sous un autre id partage le résultat
+    variant = cache_variant(engine, tolerance, segments is not None, max_points)
+    cached = cache.get(digest, variant, pointSetId)
+    if cached is not None:
+        return cached
+    if disk_cache is not None:
+        mapped = disk_cache.get(digest, variant)
+        if mapped is not None:
+            return mapped
+
+    if executor is not None:
+        # Le calcul tourne dans un autre processus, sans le GIL du serveur
+        payload = executor.submit(
+            triangulate_bytes, point_set.to_bytes(), engine, tolerance, max_points
+        ).result()
+        if len(payload) <= cache.max_bytes:
+            cache.put(pointSetId, digest, variant, payload)
+        if disk_cache is not None:
+            disk_cache.put(digest, variant, payload)
+        return payload
+
+    if max_points is not None:
+        # Niveau de détail : seuls les points gardés sont triangulés et renvoyés
+        point_set, _ = point_set.decimate(max_points)
+
+    # Triangule le pointset
+    triangles = point_set.triangulate(
+        engine=engine, merge_tolerance=tolerance, segments=segments
+    )
+    if triangles.byte_length > cache.max_bytes:
+        if disk_cache is not None:
+            disk_cache.put(
+                digest, variant, triangles.iter_bytes(CHUNK_SIZE), triangles.byte_length
+            )
+            mapped = disk_cache.get(digest, variant)
+            if mapped is not None:
+                return mapped
+        return triangles
+
+    payload = triangles.to_bytes()  # Transforme les triangles en bytes
+    cache.put(pointSetId, digest, variant, payload)
+    if disk_cache is not None:
+        disk_cache.put(digest, variant, payload)
+    return payload
+
+
+def triangulation_response(payload: bytes | mmap.mmap | Triangles) -> Response:
+    """Return the response of a successful triangulation.
+
+    Args:
+        payload (bytes | mmap.mmap | Triangles): The serialized Triangles,
+            or the Triangles to serialize while sending them.
+
+    Returns:
+        Response: The binary response.
+
+    """
+    if isinstance(payload, mmap.mmap):
+        return mapped_response(payload)
+    if isinstance(payload, Triangles):
+        return stream_response(payload.iter_bytes(CHUNK_SIZE), payload.byte_length)
+    return Response(
+        payload,
+        # Indique que le contenu est en bytes
+        mimetype="application/octet-stream",
+        status=200,
+    )
+
+
+def error_response(error: Exception) -> tuple[Response, int, dict[str, str]]:
+    """Return the JSON response of a failure to serve a PointSet.
+
+    Args:
+        error (Exception): The exception raised while loading the result.
+
+    Returns:
+        tuple[Response, int, dict[str, str]]: The body, the HTTP status and
+            the headers of the response.
+
+    """
+    status, message = error_status(error)
+    headers = {}
+    if isinstance(error, CircuitOpenError):
+        # Le manager est considéré hors service : on répond tout de suite
+        headers["Retry-After"] = str(int(manager.breaker.reset_timeout))
+    return jsonify({"error": message}), status, headers
+
 
 @app.route("/triangulation/<string:pointSetId>", methods=["GET"])
 def triangulation(pointSetId: str):
     """Retrieve a PointSet by ID and return its triangulation.
 
+    The optional ``engine`` query parameter selects the Delaunay algorithm
+    (one of PointSet.ENGINES, 'bowyer-watson' by default). The optional
+    ``tolerance`` query parameter merges the points closer than it (0 for
+    exact duplicates) instead of rejecting duplicated points; the triangles
+    then refer to the first point of each merged group. The optional
+    ``maxPoints`` query parameter asks for a level of detail: the PointSet
+    is thinned out on a grid to at most that many points, and the result
+    holds only the points kept. Results are cached in memory by PointSet
+    ID and by PointSet content, and on disk by PointSet content when
+    TRIANGULATION_CACHE_DIR is set. Concurrent requests for the same
+    PointSet and options share one computation.
+
     Args:
         pointSetId (str): The UUID of the PointSet to triangulate.
 
@@ -32,45 +305,285 @@ def triangulation(pointSetId: str):
     except ValueError:
         return jsonify({"error": "Invalid UUID"}), 400
 
+    # Valide le moteur de triangulation demandé
+    engine = request.args.get("engine", "bowyer-watson")
+    if engine not in PointSet.ENGINES:
+        return jsonify({"error": f"Unknown triangulation engine: {engine}"}), 400
+    try:
+        tolerance = merge_tolerance(request.args.get("tolerance"))
+        max_points = max_points_limit(request.args.get("maxPoints"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Un id déjà vu est servi sans interroger le pointset manager
+    variant = cache_variant(engine, tolerance, max_points=max_points)
+    cached = cache.get_by_id(pointSetId, variant)
+    if cached is not None:
+        return Response(cached, mimetype="application/octet-stream", status=200)
+
     try:
-        # Récupère le pointset depuis le pointset manager en partant du principe
-        # que le pointset manager est en localhost:5000
-        url = f"http://localhost:5000/pointset/{pointSetId}"
-        with urllib.request.urlopen(url) as response:
-            if response.getcode() == 200:
-                point_set_bytes = (
-                    response.read()
-                )  # Récupère le pointset sous forme de bytes
-                point_set = PointSet.from_bytes(
-                    point_set_bytes
-                )  # Transforme les bytes en pointset
-
-                try:
-                    triangles = point_set.triangulate()  # Triangule le pointset
-                    return Response(
-                        triangles.to_bytes(),  # Transforme les triangles en bytes
-                        # Indique que le contenu est en bytes
-                        mimetype="application/octet-stream",
-                        status=200,
-                    )
-                except ValueError as e:
-                    return jsonify(
-                        {"error": str(e)}
-                    ), 500  # Retourne une erreur si la triangulation echoue
-            else:
-                # Retourne une erreur si le pointset n'est pas trouvé
-                return jsonify(
-                    {"error": "Failed to retrieve PointSet"}
-                ), response.getcode()
-
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return jsonify({"error": "PointSet not found"}), 404
+        payload = in_flight.do(
+            (pointSetId, variant),
+            partial(load_triangulation, pointSetId, engine, tolerance, max_points),
+        )
+    except Exception as e:
+        return error_response(e)
+
+    return triangulation_response(payload)
+
+
+@app.route("/triangulation", methods=["POST"])
+def triangulation_upload():
+    """Triangulate a PointSet sent in the request body.
+
+    The body is the PointSet binary representation, decoded while it is
+    received, so the PointSet Manager is not involved. The optional
+    ``engine`` and ``tolerance`` query parameters are those of the GET
+    route. Results are cached by PointSet content, like those of the GET
+    route.
+
+    Returns:
+        Response: The triangulated Triangles as bytes or an error message.
+
+    """
+    # Valide le moteur de triangulation demandé
+    engine = request.args.get("engine", "bowyer-watson")
+    if engine not in PointSet.ENGINES:
+        return jsonify({"error": f"Unknown triangulation engine: {engine}"}), 400
+
+    # Les erreurs viennent ici du pointset envoyé : c'est une requête invalide
+    try:
+        tolerance = merge_tolerance(request.args.get("tolerance"))
+        point_set, digest = decode_pointset(request.stream, request.content_length)
+        payload = in_flight.do(
+            (digest, cache_variant(engine, tolerance)),
+            partial(
+                triangulate_content, point_set, digest, engine, tolerance=tolerance
+            ),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
         return jsonify({"error": str(e)}), 500
-    except (urllib.error.URLError, ConnectionError):
-        return jsonify({"error": "Service unavailable"}), 500
+    return triangulation_response(payload)
+
+
+@app.route("/triangulation/constrained", methods=["POST"])
+def triangulation_constrained():
+    """Triangulate a PointSet sent with segments that must be edges.
+
+    The result is the constrained Delaunay triangulation, computed by the
+    Bowyer-Watson engine, in the binary representation of the other
+    routes. Results are cached by body content.
+
+    Binary Representation of the body:
+    - Part 1: PointSet
+      * 4 bytes: number of points (unsigned long)
+      * For each point: 8 bytes (4 bytes float X + 4 bytes float Y)
+    - Part 2: Segments
+      * 4 bytes: number of segments (unsigned long)
+      * For each segment: 8 bytes
+        (2 x 4 bytes unsigned long = indices of the 2 points)
+
+    Returns:
+        Response: The triangulated Triangles as bytes or an error message.
+
+    """
+    engine = "bowyer-watson"
+
+    # Les erreurs viennent ici du corps envoyé : c'est une requête invalide
+    try:
+        data = request.get_data()
+        point_set, segments = constrained_from_bytes(data)
+        digest = cache.digest(data)
+        payload = in_flight.do(
+            (digest, cache_variant(engine, None, constrained=True)),
+            partial(triangulate_content, point_set, digest, engine, segments=segments),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+    return triangulation_response(payload)
+
+
+def load_hull(pointSetId: str) -> bytes:
+    """Fetch a PointSet and return its serialized convex hull.
+
+    Args:
+        pointSetId (str): The UUID of the PointSet.
+
+    Returns:
+        bytes: The serialized hull, cached like triangulations.
+
+    Raises:
+        PointSetNotFoundError: If the PointSet does not exist.
+        ManagerUnavailableError: If the PointSet Manager cannot be reached.
+        ManagerResponseError: If the PointSet Manager answers an error.
+        ValueError: If the PointSet cannot be decoded.
+
+    """
+    point_set, digest = manager.fetch_decoded_pointset(pointSetId)
+    cached = cache.get(digest, HULL_VARIANT, pointSetId)
+    if cached is not None:
+        return cached
+
+    hull = point_set.convex_hull()
+    payload = struct.pack("<L", len(hull)) + little_endian_bytes(hull, "I")
+    cache.put(pointSetId, digest, HULL_VARIANT, payload)
+    return payload
+
+
+@app.route("/hull/<string:pointSetId>", methods=["GET"])
+def hull(pointSetId: str):
+    """Retrieve a PointSet by ID and return its convex hull.
+
+    The hull is computed without triangulating the PointSet and cached like
+    triangulations.
+
+    Binary Representation of the response:
+    - 4 bytes: number of hull points (unsigned long)
+    - For each hull point, counter-clockwise: 4 bytes, its index in the
+      PointSet (unsigned long)
+
+    Args:
+        pointSetId (str): The UUID of the PointSet.
+
+    Returns:
+        Response: The hull indices as bytes or an error message.
+
+    """
+    # Valide l'id du pointset
+    try:
+        uuid.UUID(pointSetId)
+    except ValueError:
+        return jsonify({"error": "Invalid UUID"}), 400
+
+    payload = cache.get_by_id(pointSetId, HULL_VARIANT)
+    if payload is None:
+        try:
+            payload = in_flight.do(
+                (pointSetId, HULL_VARIANT), partial(load_hull, pointSetId)
+            )
+        except Exception as e:
+            return error_response(e)
+    return Response(payload, mimetype="application/octet-stream", status=200)
+
+
+def batch_item(
+    pointSetId: str, engine: str, tolerance: float | None = None
+) -> tuple[int, bytes | mmap.mmap | Triangles]:
+    """Load the triangulation of one PointSet of a batch.
+
+    Args:
+        pointSetId (str): The UUID of the PointSet to triangulate.
+        engine (str): The triangulation engine.
+        tolerance (float | None): The merge tolerance of duplicated points,
+            None to reject them.
+
+    Returns:
+        tuple[int, bytes | mmap.mmap | Triangles]: The HTTP status of the
+            item and its payload, a JSON error message if it failed.
+
+    """
+    try:
+        uuid.UUID(pointSetId)
+    except ValueError:
+        return 400, json.dumps({"error": "Invalid UUID"}).encode()
+
+    variant = cache_variant(engine, tolerance)
+    cached = cache.get_by_id(pointSetId, variant)
+    if cached is not None:
+        return 200, cached
+    try:
+        return 200, in_flight.do(
+            (pointSetId, variant),
+            partial(
+                load_triangulation,
+                pointSetId,
+                engine,
+                tolerance,
+                executor=batch_processes,
+            ),
+        )
+    except Exception as e:
+        status, message = error_status(e)
+        return status, json.dumps({"error": message}).encode()
+
+
+def batch_chunks(
+    results: list[tuple[int, bytes | mmap.mmap | Triangles]],
+) -> Iterator[bytes]:
+    """Frame the results of a batch, chunk by chunk.
+
+    Args:
+        results (list[tuple[int, bytes | mmap.mmap | Triangles]]): The
+            status and the payload of each item.
+
+    Yields:
+        bytes: The next chunk of the framed body.
+
+    """
+    yield struct.pack("<L", len(results))
+    for status, payload in results:
+        if isinstance(payload, Triangles):
+            yield struct.pack("<LL", status, payload.byte_length)
+            yield from payload.iter_bytes(CHUNK_SIZE)
+        else:
+            yield struct.pack("<LL", status, len(payload))
+            for start in range(0, len(payload), CHUNK_SIZE):
+                yield payload[start : start + CHUNK_SIZE]
+
+
+@app.route("/triangulation/batch", methods=["POST"])
+def triangulation_batch():
+    """Triangulate several PointSets in one call.
+
+    The JSON body lists the PointSets as ``{"pointSetIds": [...]}`` (at
+    most BATCH_MAX_SIZE) and the optional ``engine`` and ``tolerance``
+    query parameters apply to all of them. The PointSets are fetched
+    concurrently by threads and triangulated in parallel by worker
+    processes, with the caches and the coalescing of the single route.
+
+    Binary Representation of the response, items in the request order:
+    - 4 bytes: number of items (unsigned long)
+    - For each item:
+      * 4 bytes: HTTP status of the item (unsigned long)
+      * 4 bytes: length of the payload (unsigned long)
+      * The payload: the Triangles binary representation if the status is
+        200, else a JSON error message
+
+    Returns:
+        Response: The framed results or an error message.
+
+    """
+    body = request.get_json(silent=True)
+    pointSetIds = body.get("pointSetIds") if isinstance(body, dict) else None
+    if not isinstance(pointSetIds, list) or not all(
+        isinstance(pointSetId, str) for pointSetId in pointSetIds
+    ):
+        return jsonify({"error": "Expected a JSON list of pointSetIds"}), 400
+    if len(pointSetIds) > BATCH_MAX_SIZE:
+        return jsonify({"error": f"At most {BATCH_MAX_SIZE} pointSetIds"}), 400
+
+    engine = request.args.get("engine", "bowyer-watson")
+    if engine not in PointSet.ENGINES:
+        return jsonify({"error": f"Unknown triangulation engine: {engine}"}), 400
+    try:
+        tolerance = merge_tolerance(request.args.get("tolerance"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    results = list(
+        batch_executor.map(
+            partial(batch_item, engine=engine, tolerance=tolerance), pointSetIds
+        )
+    )
+    length = 4 + sum(
+        8 + (payload.byte_length if isinstance(payload, Triangles) else len(payload))
+        for _, payload in results
+    )
+    return stream_response(batch_chunks(results), length)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""Mesh class.
+
+This module defines the compact triangle mesh used by the triangulation
+engine: vertices are integer indices into coordinate lists and triangles
+are stored in flat lists with one neighbor slot per edge.
+"""
+
+from services.GeometryService import incircle
+
+NO_NEIGHBOR = -1
+REMOVED = -1
+
+
+class Mesh:
+    """Represents a triangle mesh with adjacency information.
+
+    Triangle ``t`` owns the slots ``3 * t`` to ``3 * t + 2`` of ``vertices``
+    and ``neighbors``. Edge ``i`` of a triangle goes from vertex slot ``i`` to
+    vertex slot ``(i + 1) % 3`` and ``neighbors[3 * t + i]`` is the triangle on
+    the other side of that edge (``NO_NEIGHBOR`` on the border). Triangles
+    are stored counter-clockwise. Removed triangles are put on a free list
+    and their slots are reused.
+
+    Attributes:
+        xs (list[float]): The x-coordinates of the vertices.
+        ys (list[float]): The y-coordinates of the vertices.
+        vertices (list[int]): The 3 vertex indices of each triangle.
+        neighbors (list[int]): The 3 neighbor triangles of each triangle.
+        free (list[int]): Indices of the removed triangles.
+        triangle_count (int): The number of live triangles.
+
+    """
+
+    def __init__(self, xs: list[float], ys: list[float]) -> None:
+        """Initialize a Mesh.
+
+        Args:
+            xs (list[float]): The x-coordinates of the vertices.
+            ys (list[float]): The y-coordinates of the vertices.
+
+        """
+        self.xs = xs
+        self.ys = ys
+        self.vertices: list[int] = []
+        self.neighbors: list[int] = []
+        self.free: list[int] = []
+        self.triangle_count = 0
+
+    def add_vertex(self, x: float, y: float) -> int:
+        """Add a vertex to the mesh.
+
+        Args:
+            x (float): The x-coordinate.
+            y (float): The y-coordinate.
+
+        Returns:
+            int: The index of the new vertex.
+
+        """
+        self.xs.append(x)
+        self.ys.append(y)
+        return len(self.xs) - 1
+
+    def add_triangle(self, a: int, b: int, c: int) -> int:
+        """Add a triangle without neighbors to the mesh.
+
+        Args:
+            a (int): The first vertex index.
+            b (int): The second vertex index.
+            c (int): The third vertex index.
+
+        Returns:
+            int: The index of the new triangle.
+
+        """
+        if self.free:
+            t = self.free.pop()
+            self.vertices[3 * t : 3 * t + 3] = (a, b, c)
+            self.neighbors[3 * t : 3 * t + 3] = (NO_NEIGHBOR,) * 3
+        else:
+            t = len(self.vertices) // 3
+            self.vertices.extend((a, b, c))
+            self.neighbors.extend((NO_NEIGHBOR,) * 3)
+        self.triangle_count += 1
+        return t
+
+    def remove_triangle(self, t: int) -> None:
+        """Remove a triangle and make its slot available for reuse.
+
+        Args:
+            t (int): The index of the triangle.
+
+        """
+        self.vertices[3 * t] = REMOVED
+        self.free.append(t)
+        self.triangle_count -= 1
+
+    def is_alive(self, t: int) -> bool:
+        """Check if a triangle index refers to a live triangle."""
+        return self.vertices[3 * t] != REMOVED
+
+    def in_circumcircle(self, t: int, x: float, y: float) -> bool:
+        """Check if a point is strictly inside the circumcircle of a triangle.
+
+        Args:
+            t (int): The index of the triangle.
+            x (float): The x-coordinate of the point.
+            y (float): The y-coordinate of the point.
+
+        Returns:
+            bool: True if the point is inside, False otherwise.
+
+        """
+        vertices, xs, ys = self.vertices, self.xs, self.ys
+        a, b, c = vertices[3 * t], vertices[3 * t + 1], vertices[3 * t + 2]
+        return incircle(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], x, y) > 0
+
+    def triangles(self) -> list[tuple[int, int, int]]:
+        """Return the vertex indices of every live triangle."""
+        vertices = self.vertices
+        return [
+            (vertices[i], vertices[i + 1], vertices[i + 2])
+            for i in range(0, len(vertices), 3)
+            if vertices[i] != REMOVED
+        ]
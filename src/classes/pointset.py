@@ -5,15 +5,28 @@ This module defines the Point and PointSet classes used for triangulation.
 
 import math
 import struct
+import sys
+from array import array
+from collections.abc import Hashable, Iterator
+from functools import partial
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # Avoid circular import issues
     from triangles import Triangles
 
+# Représentation de -0.0 en float32 natif, égal à 0.0 avec d'autres bits
+NEGATIVE_ZERO = array("f", [-0.0]).tobytes()
+
+# Décimation : affinements de la grille au plus (atteint seulement quand il y
+# a moins de positions distinctes que de points demandés)
+DECIMATION_REFINEMENTS = 32
+
 
 class Point:
     """Represents a point in 2D space."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float) -> None:
         """Initialize a Point.
 
@@ -48,7 +61,15 @@ class Point:
 
 
 class PointSet:
-    """Represents a set of points."""
+    """Represents a set of points.
+
+    A PointSet is backed either by a list of Point objects or by a flat array
+    of interleaved coordinates (x0, y0, x1, y1, ...). The other
+    representation is built lazily on first access, so a PointSet decoded
+    from bytes never creates Point objects unless they are asked for.
+    """
+
+    ENGINES = ("bowyer-watson", "divide-and-conquer")
 
     def __init__(self, points: list[Point]) -> None:
         """Initialize a PointSet.
@@ -57,29 +78,73 @@ class PointSet:
             points (list[Point]): The list of points.
 
         """
-        self.points = points
+        self._points: list[Point] | None = points
+        self._coords: array | None = None
         self.point_count = len(points)
 
+    @classmethod
+    def from_coords(cls, coords: array) -> "PointSet":
+        """Create a PointSet backed by a flat array of coordinates.
+
+        Args:
+            coords (array): Interleaved coordinates (x0, y0, x1, y1, ...).
+
+        Returns:
+            PointSet: The PointSet using the array as storage.
+
+        """
+        pointset = cls.__new__(cls)
+        pointset._points = None
+        pointset._coords = coords
+        pointset.point_count = len(coords) // 2
+        return pointset
+
+    @property
+    def points(self) -> list[Point]:
+        """The list of points, built from the coordinates if needed."""
+        if self._points is None:
+            coords = self._coords
+            self._points = [
+                Point(coords[i], coords[i + 1]) for i in range(0, len(coords), 2)
+            ]
+        return self._points
+
+    @property
+    def coords(self) -> array:
+        """The interleaved coordinates, built from the points if needed."""
+        if self._coords is None:
+            self._coords = array(
+                "d", [c for point in self._points for c in (point.x, point.y)]
+            )
+        return self._coords
+
     @classmethod
     def from_bytes(cls, data: bytes) -> "PointSet":
         """Deserialize a PointSet from bytes.
 
+        The coordinates are copied in one block into a float32 array
+        (8 bytes per point) without creating any Point object.
+
         Args:
             data (bytes): The byte representation of the PointSet.
 
         Returns:
             PointSet: The deserialized PointSet.
 
+        Raises:
+            ValueError: If the data is shorter than the declared point count.
+
         """
-        offset = 0
-        (point_count,) = struct.unpack_from("<L", data, offset)
-        offset += 4
-        points = []
-        for _ in range(point_count):
-            x, y = struct.unpack_from("<ff", data, offset)
-            points.append(Point(x, y))
-            offset += 8
-        return cls(points)
+        (point_count,) = struct.unpack_from("<L", data, 0)
+        end = 4 + 8 * point_count
+        if len(data) < end:
+            raise ValueError("PointSet bytes are shorter than the point count")
+
+        coords = array("f")
+        coords.frombytes(memoryview(data)[4:end])
+        if sys.byteorder == "big":  # Le format binaire est little-endian
+            coords.byteswap()
+        return cls.from_coords(coords)
 
     def to_bytes(self) -> bytes:
         """Serialize the PointSet to bytes.
@@ -88,27 +153,41 @@ class PointSet:
             bytes: The byte representation of the PointSet.
 
         """
-        data = bytearray()
-        data.extend(struct.pack("<L", self.point_count))
-        for point in self.points:
-            data.extend(struct.pack("<ff", point.x, point.y))
-        return bytes(data)
+        coords = self.coords
+        if coords.typecode != "f" or sys.byteorder == "big":
+            coords = array("f", coords)  # Arrondi en float32 comme struct "<f"
+            if sys.byteorder == "big":
+                coords.byteswap()
+        return struct.pack("<L", self.point_count) + coords.tobytes()
 
     # Fonction qui vérifie si tous les points sont colinéaires
     def check_colinearity(self) -> bool:
         """Check if all points in the set are collinear.
 
+        The line is defined by the first point and the first point distinct
+        from it; a set whose points all coincide is collinear.
+
         Returns:
             bool: True if all points are collinear, False otherwise.
 
         """
-        p1 = self.points[0]
-        p2 = self.points[1]
-
-        for i in range(2, self.point_count):
-            p = self.points[i]
-            # Calcul du déterminant pour vérifier la colinéarité
-            if (p2.x - p1.x) * (p.y - p1.y) != (p.x - p1.x) * (p2.y - p1.y):
+        from services.GeometryService import orient2d
+
+        coords = self.coords
+        end = 2 * self.point_count
+        x1, y1 = coords[0], coords[1]
+
+        # Deux points confondus ne définissent pas de droite
+        start = 2
+        while start < end and coords[start] == x1 and coords[start + 1] == y1:
+            start += 2
+        if start >= end:
+            return True
+        x2, y2 = coords[start], coords[start + 1]
+
+        for i in range(start + 2, end, 2):
+            # Signe exact du déterminant pour vérifier la colinéarité
+            if orient2d(x1, y1, x2, y2, coords[i], coords[i + 1]) != 0:
                 return False  # Trouvé un point non colinéaire
 
         return True  # Tous les points sont colinéaires
@@ -120,29 +199,186 @@ class PointSet:
             bool: True if duplicates exist, False otherwise.
 
         """
-        seen = set()
-        for point in self.points:
-            if point in seen:
-                return True
-            seen.add(point)
-        return False
+        return len(set(self._point_keys())) != self.point_count
+
+    def deduplicate(self, tolerance: float = 0.0) -> tuple["PointSet", array]:
+        """Merge the duplicated points of the set.
+
+        Each point is merged into the first point kept before it that is
+        at most tolerance away. Exact duplicates are found by hashing, close
+        points by hashing them in a grid and comparing them with the points
+        kept in at most four cells.
+
+        Args:
+            tolerance (float): The distance under which two points are
+                merged, 0 to merge exact duplicates only.
+
+        Returns:
+            tuple[PointSet, array]: The points kept, in their order in the
+                set, and the index in the set of each point kept (unsigned
+                32-bit, increasing).
+
+        Raises:
+            ValueError: If the tolerance is negative or not finite.
+
+        """
+        if not 0 <= tolerance < math.inf:
+            raise ValueError(f"Invalid merge tolerance: {tolerance}")
+
+        kept = array("I")
+        if tolerance == 0:
+            seen = set()
+            for index, key in enumerate(self._point_keys()):
+                if key not in seen:
+                    seen.add(key)
+                    kept.append(index)
+        else:
+            xs = self.coords[0::2].tolist()
+            ys = self.coords[1::2].tolist()
+            squared = tolerance * tolerance
+            # Cellules de côté 2 * tolerance : un point proche est dans la
+            # cellule du point ou dans l'une des trois voisines de son coin
+            size = 2 * tolerance
+            cells: dict[tuple[int, int], list[tuple[float, float]]] = {}
+            for index, (x, y) in enumerate(zip(xs, ys, strict=True)):
+                fx, fy = x / size, y / size
+                i, j = math.floor(fx), math.floor(fy)
+                di = -1 if fx - i < 0.5 else 1
+                dj = -1 if fy - j < 0.5 else 1
+                close = False
+                for cell in ((i, j), (i + di, j), (i, j + dj), (i + di, j + dj)):
+                    for kx, ky in cells.get(cell, ()):
+                        if (kx - x) * (kx - x) + (ky - y) * (ky - y) <= squared:
+                            close = True
+                            break
+                    if close:
+                        break
+                else:
+                    cells.setdefault((i, j), []).append((x, y))
+                    kept.append(index)
+
+        if len(kept) == self.point_count:
+            return self, kept
+        coords = self.coords
+        unique = array(coords.typecode)
+        for index in kept:
+            unique.extend(coords[2 * index : 2 * index + 2])
+        return PointSet.from_coords(unique), kept
+
+    def decimate(self, max_points: int) -> tuple["PointSet", array]:
+        """Thin the set out to at most max_points points spread over its extent.
+
+        The bounding box is divided in a grid of square cells and the first
+        point of each occupied cell is kept. The grid starts with at most
+        max_points cells and is refined until at least max_points cells are
+        occupied; the points of the last grid under the limit are kept, and
+        completed up to max_points with points of the finer grid, taken
+        evenly in the order of the set. Unless every point of the set is on
+        one line, the points kept are not all on one line either.
 
-    def triangulate(self) -> "Triangles":
-        """Triangulate the PointSet using the Bowyer-Watson algorithm.
+        Args:
+            max_points (int): The maximum number of points kept.
 
         Returns:
-            Triangles: The resulting triangulation.
+            tuple[PointSet, array]: The points kept, in their order in the
+                set, and the index in the set of each point kept (unsigned
+                32-bit, increasing).
 
         Raises:
-            ValueError: If the PointSet is invalid
-                (empty, <3 points, collinear, duplicates).
+            ValueError: If max_points is less than 3.
+
+        """
+        if max_points < 3:
+            raise ValueError("The maximum number of points must be at least 3")
+        if self.point_count <= max_points:
+            return self, array("I", range(self.point_count))
+
+        xs = self.coords[0::2].tolist()
+        ys = self.coords[1::2].tolist()
+        bbox = (min(xs), min(ys), max(xs), max(ys))
+
+        # Grille de (columns + 1)² cellules au plus max_points, affinée selon
+        # la part des cellules occupées jusqu'à en occuper max_points
+        columns = math.isqrt(max_points) - 1
+        kept = finer = grid_sample(xs, ys, bbox, columns)
+        for _ in range(DECIMATION_REFINEMENTS):
+            if len(finer) >= max_points:
+                break
+            kept = finer
+            scale = max(2.0, math.sqrt(max_points / len(finer)))
+            columns = math.ceil((columns + 1) * scale) - 1
+            finer = grid_sample(xs, ys, bbox, columns)
+        if len(finer) <= max_points:
+            kept = finer
+        else:
+            # Complète la grille grossière avec des points de la plus fine,
+            # répartis régulièrement parmi ceux qui n'y sont pas encore
+            coarse = set(kept)
+            extra = [index for index in finer if index not in coarse]
+            missing = max_points - len(kept)
+            chosen = [extra[k * len(extra) // missing] for k in range(missing)]
+            kept = array("I", sorted([*kept, *chosen]))
+        kept = with_off_line_point(xs, ys, kept, max_points)
+
+        coords = self.coords
+        points = array(coords.typecode)
+        for index in kept:
+            points.extend(coords[2 * index : 2 * index + 2])
+        return PointSet.from_coords(points), kept
+
+    def _point_keys(self) -> Iterator[Hashable]:
+        """Return a hashable key per point, equal only for equal points.
+
+        A float32 point is packed in one 8-byte integer, much faster to hash
+        than a pair of floats. Only 0.0 and -0.0 are equal with different
+        bits: sets holding -0.0 are keyed by pairs of floats.
+        """
+        coords = self.coords
+        if coords.typecode == "f":
+            data = coords.tobytes()
+            # Recherche de -0.0 à une position alignée sur un float32
+            position = data.find(NEGATIVE_ZERO)
+            while position > 0 and position % 4:
+                position = data.find(NEGATIVE_ZERO, position + 1)
+            if position < 0:
+                return iter(memoryview(data).cast("Q"))
+
+        coords = iter(coords)
+        return zip(coords, coords, strict=False)
+
+    def check_segments(self, segments: list[tuple[int, int]]) -> None:
+        """Check that segments join two distinct points of the set.
+
+        Args:
+            segments (list[tuple[int, int]]): Pairs of point indices.
+
+        Raises:
+            ValueError: If a segment does not join two distinct points.
 
         """
-        from classes.triangles import Triangle, Triangles
-        from services import BowerWatsonService
+        for a, b in segments:
+            if not (0 <= a < self.point_count and 0 <= b < self.point_count):
+                raise ValueError(f"Segment ({a}, {b}) refers to a missing point")
+            if a == b:
+                raise ValueError(f"Segment ({a}, {b}) must join distinct points")
+
+    def validate(self) -> tuple[float, float, float, float]:
+        """Check that the PointSet can be triangulated.
 
+        The cheap checks come first; the bounding box is returned so that
+        the triangulation does not scan the points for it again.
+
+        Returns:
+            tuple[float, float, float, float]: The bounding box of the
+                points (min x, min y, max x, max y).
+
+        Raises:
+            ValueError: If the PointSet is empty, has less than 3 points,
+                only collinear points or duplicated points.
+
+        """
         # On vérifie que le PointSet est valide pour la triangulation
-        if self == PointSet([]):
+        if self.point_count == 0:
             raise ValueError("Cannot triangulate an empty PointSet")
 
         if self.point_count < 3:
@@ -154,18 +390,119 @@ class PointSet:
         if self.check_duplicates():
             raise ValueError("Cannot triangulate a PointSet with duplicated points")
 
-        super_triangle = BowerWatsonService.super_triangle(self.points)
-        triangulation: list[Triangle] = [super_triangle]
+        xs, ys = self.coords[0::2], self.coords[1::2]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def triangulate(
+        self,
+        order: str = "hilbert",
+        engine: str = "bowyer-watson",
+        workers: int = 1,
+        merge_tolerance: float | None = None,
+        segments: list[tuple[int, int]] | None = None,
+    ) -> "Triangles":
+        """Triangulate the PointSet.
+
+        Args:
+            order (str): The order in which the Bowyer-Watson engine inserts
+                the points: 'hilbert' (along a Hilbert curve), 'brio'
+                (biased randomized insertion order) or 'input' (order of
+                the PointSet).
+            engine (str): The Delaunay algorithm, one of ENGINES:
+                'bowyer-watson' (incremental) or 'divide-and-conquer'
+                (Guibas-Stolfi, O(n log n) in the worst case).
+            workers (int): The number of processes. Above 1, the points are
+                split in tiles triangulated in parallel then merged (small
+                PointSets are still triangulated in the calling process).
+            merge_tolerance (float | None): None to reject duplicated
+                points, else the distance under which points are merged
+                (0 for exact duplicates only). The triangles then refer to
+                the first point of each merged group, in this PointSet.
+            segments (list[tuple[int, int]] | None): Pairs of point indices
+                that must be edges of the triangulation, which is then the
+                constrained Delaunay triangulation. Only supported by the
+                'bowyer-watson' engine in a single process, without merging.
+
+        Returns:
+            Triangles: The resulting triangulation.
 
-        # Boucle sur tous les points du PointSet pour trouver les triangles
-        # qui ne respectent pas la condition du cercle circonscrit
-        for point in self.points:
-            BowerWatsonService.add_point_to_triangulation(point, triangulation)
+        Raises:
+            ValueError: If the PointSet is invalid
+                (empty, <3 points, collinear, duplicates)
+                or if the order, the engine, the number of workers,
+                the merge tolerance or the segments are invalid.
 
-        final_triangles = BowerWatsonService.remove_super_triangle_vertices(
-            triangulation, super_triangle
+        """
+        from classes.triangles import Triangles
+        from services import (
+            BowerWatsonService,
+            DivideAndConquerService,
+            ParallelService,
         )
-        return Triangles(self, final_triangles)
+
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown triangulation engine: {engine}")
+
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+
+        if segments is not None:
+            self.check_segments(segments)
+            if engine != "bowyer-watson" or workers > 1 or merge_tolerance is not None:
+                raise ValueError(
+                    "Segments are only supported by the bowyer-watson engine"
+                    " in a single process, without merging"
+                )
+
+        if merge_tolerance is not None:
+            unique, kept = self.deduplicate(merge_tolerance)
+            if unique is not self:
+                triangles = unique.triangulate(order, engine, workers)
+                # Les indices gardés sont croissants : chaque triangle reste trié
+                indices = array("I", [kept[i] for i in triangles.indices])
+                return Triangles.from_indices(self, indices)
+
+        bbox = self.validate()
+
+        xs = self.coords[0::2].tolist()
+        ys = self.coords[1::2].tolist()
+        match engine:
+            case "bowyer-watson":
+                # Les tuiles calculent leur propre boîte englobante
+                triangulate = partial(
+                    BowerWatsonService.triangulate,
+                    order=order,
+                    bbox=bbox if workers == 1 else None,
+                    segments=segments,
+                )
+            case "divide-and-conquer":
+                triangulate = DivideAndConquerService.triangulate
+
+        if workers > 1:
+            final_triangles = ParallelService.triangulate(xs, ys, triangulate, workers)
+        else:
+            final_triangles = triangulate(xs, ys)
+
+        # Les triangles portent directement les indices de leurs sommets
+        indices = array("I")
+        for triangle in final_triangles:
+            indices.extend(sorted(triangle))
+        return Triangles.from_indices(self, indices)
+
+    def convex_hull(self) -> array:
+        """Compute the convex hull of the PointSet, without triangulating it.
+
+        Returns:
+            array: The unsigned 32-bit indices of the hull corners,
+                counter-clockwise. Collinear and duplicated points on the
+                hull are left out.
+
+        """
+        from services import HullService
+
+        xs = self.coords[0::2].tolist()
+        ys = self.coords[1::2].tolist()
+        return array("I", HullService.convex_hull(xs, ys))
 
     # Overriding equality operator for testing purposes
     def __eq__(self, other) -> bool:
@@ -175,3 +512,248 @@ class PointSet:
             and self.point_count == other.point_count
             and self.points == other.points
         )
+
+
+def grid_sample(
+    xs: list[float],
+    ys: list[float],
+    bbox: tuple[float, float, float, float],
+    columns: int,
+) -> array:
+    """Keep the first point of each cell of a square grid over a bounding box.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        bbox (tuple[float, float, float, float]): The bounding box of the
+            points (min x, min y, max x, max y).
+        columns (int): The grid has columns + 1 cells per row and column.
+
+    Returns:
+        array: The unsigned 32-bit indices of the points kept, increasing.
+
+    """
+    min_x, min_y, max_x, max_y = bbox
+    scale = columns / (max(max_x - min_x, max_y - min_y) or 1.0)
+    stride = columns + 1
+    cells = [
+        int((x - min_x) * scale) * stride + int((y - min_y) * scale)
+        for x, y in zip(xs, ys, strict=True)
+    ]
+    # Le premier indice de chaque cellule, dans l'ordre croissant des indices
+    first: dict[int, int] = {}
+    for index, cell in enumerate(cells):
+        first.setdefault(cell, index)
+    return array("I", first.values())
+
+
+def with_off_line_point(
+    xs: list[float], ys: list[float], kept: array, max_points: int
+) -> array:
+    """Make sure that the points kept by a decimation are not all on one line.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        kept (array): The increasing indices of the points kept, at least
+            two of them distinct.
+        max_points (int): The maximum number of points kept.
+
+    Returns:
+        array: The indices kept, where the last one that does not define
+            the line is replaced by (or, under the limit, completed with) a
+            point off the line, if the set has one.
+
+    """
+    from services.GeometryService import orient2d
+
+    a = kept[0]
+    ax, ay = xs[a], ys[a]
+    b = next((i for i in kept if xs[i] != ax or ys[i] != ay), None)
+    if b is None:
+        return kept
+    bx, by = xs[b], ys[b]
+    if any(orient2d(ax, ay, bx, by, xs[i], ys[i]) != 0 for i in kept):
+        return kept
+
+    # Tous les points gardés sont alignés : on en cherche un hors de la droite
+    off = next(
+        (
+            i
+            for i, (x, y) in enumerate(zip(xs, ys, strict=True))
+            if orient2d(ax, ay, bx, by, x, y) != 0
+        ),
+        None,
+    )
+    if off is None:
+        return kept  # Le pointset entier est aligné
+    indices = list(kept)
+    if len(indices) >= max_points:
+        indices.remove(next(i for i in reversed(indices) if i not in (a, b)))
+    return array("I", sorted([*indices, off]))
+
+
+class PointSetDecoder:
+    """Represents an incremental decoder of serialized PointSet bytes.
+
+    The bytes are fed in chunks as they are received. As soon as the point
+    count is known, it is checked against the expected length of the body
+    and the coordinates array is allocated once, then filled in place, so
+    the whole body is never buffered next to the decoded coordinates. When
+    the length is unknown (chunked body), the point count of the header is
+    not trusted for the allocation: the array grows with the received bytes.
+
+    Attributes:
+        content_length (int | None): The announced length of the body.
+        received (int): The number of bytes fed so far.
+
+    """
+
+    HEADER_SIZE = 4
+
+    def __init__(self, content_length: int | None = None) -> None:
+        """Initialize a PointSetDecoder.
+
+        Args:
+            content_length (int | None): The announced length of the body,
+                or None if it is unknown.
+
+        """
+        self.content_length = content_length
+        self.received = 0
+        self._header = bytearray()
+        self._size = 0
+        self._coords: array | None = None
+        self._buffer: memoryview | None = None
+        self._tail = b""  # Octets d'une coordonnée coupée entre deux morceaux
+
+    def feed(self, chunk: bytes) -> None:
+        """Decode the next chunk of the body.
+
+        Args:
+            chunk (bytes): The next bytes of the body.
+
+        Raises:
+            ValueError: If the point count does not match the announced
+                length, or if the body is longer than the point count.
+
+        """
+        chunk = memoryview(chunk)
+        if self._coords is None:
+            missing = self.HEADER_SIZE - len(self._header)
+            self._header += chunk[:missing]
+            self.received += min(missing, len(chunk))
+            chunk = chunk[missing:]
+            if len(self._header) < self.HEADER_SIZE:
+                return
+            self._allocate()
+
+        end = self.received + len(chunk)
+        if end > self._size:
+            raise ValueError("PointSet bytes are longer than the point count")
+        if self._buffer is None:
+            self._extend(chunk)
+        else:
+            start = self.received - self.HEADER_SIZE
+            self._buffer[start : end - self.HEADER_SIZE] = chunk
+        self.received = end
+
+    def finish(self) -> PointSet:
+        """Return the decoded PointSet once the whole body was fed.
+
+        Returns:
+            PointSet: The decoded PointSet, backed by a float32 array.
+
+        Raises:
+            ValueError: If the body is shorter than the point count.
+
+        """
+        if self._coords is None or self.received < self._size:
+            raise ValueError("PointSet bytes are shorter than the point count")
+        if self._buffer is not None:
+            self._buffer.release()  # Le tableau redevient redimensionnable
+        if sys.byteorder == "big":  # Le format binaire est little-endian
+            self._coords.byteswap()
+        return PointSet.from_coords(self._coords)
+
+    def _allocate(self) -> None:
+        """Check the point count and allocate the coordinates."""
+        (point_count,) = struct.unpack("<L", self._header)
+        self._size = self.HEADER_SIZE + 8 * point_count
+        # Un corps tronqué ou trop long est refusé avant d'être reçu
+        if self.content_length is None:
+            # L'en-tête d'un corps découpé peut mentir : rien n'est préalloué
+            self._coords = array("f")
+            return
+        if self.content_length != self._size:
+            raise ValueError("PointSet length does not match the point count")
+        self._coords = array("f", [0.0]) * (2 * point_count)
+        self._buffer = memoryview(self._coords).cast("B")
+
+    def _extend(self, chunk: memoryview) -> None:
+        """Append the whole coordinates of a chunk to the growing array."""
+        if self._tail:
+            chunk = memoryview(self._tail + chunk)
+        whole = len(chunk) - len(chunk) % 4
+        self._coords.frombytes(chunk[:whole])
+        self._tail = bytes(chunk[whole:])
+
+
+def constrained_to_bytes(point_set: PointSet, segments: list[tuple[int, int]]) -> bytes:
+    """Serialize a PointSet and its segments to bytes.
+
+    Binary Representation:
+    - Part 1: PointSet, as PointSet.to_bytes
+    - Part 2: Segments
+      * 4 bytes: number of segments (unsigned long)
+      * For each segment: 8 bytes
+        (2 x 4 bytes unsigned long = indices of the 2 points)
+
+    Args:
+        point_set (PointSet): The points.
+        segments (list[tuple[int, int]]): Pairs of point indices.
+
+    Returns:
+        bytes: The byte representation of the constrained PointSet.
+
+    """
+    indices = array("I", [index for segment in segments for index in segment])
+    if sys.byteorder == "big":  # Le format binaire est little-endian
+        indices.byteswap()
+    return b"".join(
+        (point_set.to_bytes(), struct.pack("<L", len(segments)), indices.tobytes())
+    )
+
+
+def constrained_from_bytes(data: bytes) -> tuple[PointSet, list[tuple[int, int]]]:
+    """Deserialize a PointSet and its segments from bytes.
+
+    Args:
+        data (bytes): The byte representation written by
+            constrained_to_bytes.
+
+    Returns:
+        tuple[PointSet, list[tuple[int, int]]]: The PointSet and the pairs
+            of point indices.
+
+    Raises:
+        ValueError: If the length of the data does not match the point and
+            segment counts.
+
+    """
+    if len(data) < 4:
+        raise ValueError("PointSet bytes are shorter than the point count")
+    point_set = PointSet.from_bytes(data)
+    offset = 4 + 8 * point_set.point_count
+    if len(data) < offset + 4:
+        raise ValueError("Constrained PointSet bytes have no segment count")
+    (segment_count,) = struct.unpack_from("<L", data, offset)
+    if len(data) != offset + 4 + 8 * segment_count:
+        raise ValueError("Segment bytes do not match the segment count")
+
+    indices = array("I")
+    indices.frombytes(memoryview(data)[offset + 4 :])
+    if sys.byteorder == "big":  # Le format binaire est little-endian
+        indices.byteswap()
+    indices = iter(indices)
+    return point_set, list(zip(indices, indices, strict=True))
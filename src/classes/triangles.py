@@ -3,13 +3,49 @@
 This module defines the Triangle and Triangles classes used for triangulation.
 """
 
+import math
 import struct
+import sys
+from array import array
+from collections.abc import Iterator
 
 from classes.pointset import Point, PointSet
+from services.GeometryService import incircle, orient2d
+
+
+def circumcircle(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> tuple[float, float, float]:
+    """Calculate the circumcircle center and squared radius of 3 points.
+
+    Returns:
+        tuple[float, float, float]: Center x, center y and squared radius.
+            The radius is infinite for collinear points.
+
+    """
+    bx, by = bx - ax, by - ay
+    cx, cy = cx - ax, cy - ay
+    d = 2 * (bx * cy - by * cx)
+    if d == 0:
+        return ax, ay, float("inf")
+
+    # Centre calculé dans le repère du premier sommet pour limiter
+    # les erreurs d'arrondi
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+    return ax + ux, ay + uy, ux * ux + uy * uy
 
 
 class Triangle:
-    """Represents a triangle defined by 3 points."""
+    """Represents a triangle defined by 3 points.
+
+    The circumcircle is only calculated the first time it is needed and is
+    stored as plain floats (center and squared radius).
+    """
+
+    __slots__ = ("p1", "p2", "p3", "_circumcircle")
 
     def __init__(self, p1: Point, p2: Point, p3: Point) -> None:
         """Initialize a Triangle.
@@ -23,35 +59,36 @@ class Triangle:
         self.p1 = p1
         self.p2 = p2
         self.p3 = p3
+        self._circumcircle: tuple[float, float, float] | None = None
+
+    @property
+    def edges(self) -> list[tuple[Point, Point]]:
+        """The 3 edges of the triangle."""
+        return [(self.p1, self.p2), (self.p2, self.p3), (self.p3, self.p1)]
+
+    def calculate_circumcircle(self) -> tuple[float, float, float]:
+        """Calculate the circumcircle center and squared radius (cached).
+
+        Returns:
+            tuple[float, float, float]: Center x, center y and squared radius.
 
-        # Calcul du cercle circonscrit pour la triangulation de Bowyer-Watson
-        self.edges = [(p1, p2), (p2, p3), (p3, p1)]
-        self.circumcenter = None
-        self.circumradius = 0
-        self.calculate_circumcircle()
-
-    def calculate_circumcircle(self) -> None:
-        """Calculate the circumcircle center and radius."""
-        ax, ay = self.p1.x, self.p1.y
-        bx, by = self.p2.x, self.p2.y
-        cx, cy = self.p3.x, self.p3.y
-        d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
-
-        # Calcul des coordonnées du centre du cercle circonscrit
-        # avec la formule du déterminant
-        ux = (
-            (ax**2 + ay**2) * (by - cy)
-            + (bx**2 + by**2) * (cy - ay)
-            + (cx**2 + cy**2) * (ay - by)
-        ) / d
-        uy = (
-            (ax**2 + ay**2) * (cx - bx)
-            + (bx**2 + by**2) * (ax - cx)
-            + (cx**2 + cy**2) * (bx - ax)
-        ) / d
-
-        self.circumcenter = Point(ux, uy)
-        self.circumradius = self.circumcenter.distance_to(self.p1)
+        """
+        if self._circumcircle is None:
+            self._circumcircle = circumcircle(
+                self.p1.x, self.p1.y, self.p2.x, self.p2.y, self.p3.x, self.p3.y
+            )
+        return self._circumcircle
+
+    @property
+    def circumcenter(self) -> Point:
+        """The center of the circumcircle."""
+        ux, uy, _ = self.calculate_circumcircle()
+        return Point(ux, uy)
+
+    @property
+    def circumradius(self) -> float:
+        """The radius of the circumcircle."""
+        return math.sqrt(self.calculate_circumcircle()[2])
 
     def is_point_in_circumcircle(self, point: Point) -> bool:
         """Check if a point is inside the circumcircle.
@@ -63,14 +100,13 @@ class Triangle:
             bool: True if the point is inside, False otherwise.
 
         """
-        if self.circumradius == float("inf"):
+        p1, p2, p3 = self.p1, self.p2, self.p3
+        orientation = orient2d(p1.x, p1.y, p2.x, p2.y, p3.x, p3.y)
+        if orientation == 0:
             return False  # Pas de cercle circonscrit défini pour les points colinéaires
-        distance = self.circumcenter.distance_to(
-            point
-        )  # Distance entre le Point a vérifier et le centre du cercle circonscrit
-        return (
-            distance < self.circumradius
-        )  # Si la distance est > rayon, le point est en dehors du cercle circonscrit
+        # Prédicat exact : le signe dépend de l'orientation du triangle
+        side = incircle(p1.x, p1.y, p2.x, p2.y, p3.x, p3.y, point.x, point.y)
+        return side * orientation > 0
 
     # Overriding equality operator for testing purposes
     def __eq__(self, other) -> bool:
@@ -94,6 +130,9 @@ class Triangles:
       * 4 bytes: number of triangles (unsigned long)
       * For each triangle: 12 bytes
         (3 x 4 bytes unsigned long = indices of the 3 vertices)
+
+    The triangles are stored either as Triangle objects or as a flat array of
+    vertex indices; the other representation is built lazily on first access.
     """
 
     def __init__(self, pointset: PointSet, triangles: list[Triangle]) -> None:
@@ -105,9 +144,130 @@ class Triangles:
 
         """
         self.pointset = pointset
-        self.triangles = triangles
+        self._triangles: list[Triangle] | None = triangles
+        self._indices: array | None = None
         self.triangle_count = len(triangles)
 
+    @classmethod
+    def from_indices(cls, pointset: PointSet, indices: array) -> "Triangles":
+        """Create Triangles from the vertex indices of each triangle.
+
+        Args:
+            pointset (PointSet): The set of vertices.
+            indices (array): Unsigned 32-bit indices, 3 per triangle,
+                sorted within each triangle.
+
+        Returns:
+            Triangles: The triangulation using the array as storage.
+
+        """
+        triangles = cls.__new__(cls)
+        triangles.pointset = pointset
+        triangles._triangles = None
+        triangles._indices = indices
+        triangles.triangle_count = len(indices) // 3
+        return triangles
+
+    @property
+    def triangles(self) -> list[Triangle]:
+        """The list of triangles, built from the indices if needed."""
+        if self._triangles is None:
+            points = self.pointset.points
+            indices = self._indices
+            self._triangles = [
+                Triangle(
+                    points[indices[i]], points[indices[i + 1]], points[indices[i + 2]]
+                )
+                for i in range(0, len(indices), 3)
+            ]
+        return self._triangles
+
+    @property
+    def indices(self) -> array:
+        """The sorted vertex indices of each triangle, built if needed."""
+        if self._indices is None:
+            # Dictionnaire point -> indice (première occurrence) au lieu de
+            # list.index qui parcourt tous les points pour chaque sommet
+            index_of: dict[Point, int] = {}
+            for index, point in enumerate(self.pointset.points):
+                index_of.setdefault(point, index)
+            self._indices = array("I")
+            for triangle in self._triangles:
+                self._indices.extend(
+                    sorted(
+                        (
+                            index_of[triangle.p1],
+                            index_of[triangle.p2],
+                            index_of[triangle.p3],
+                        )
+                    )
+                )
+        return self._indices
+
+    def boundary_edges(self) -> list[tuple[int, int]]:
+        """Return the edges of the triangulation that bound a single triangle.
+
+        Returns:
+            list[tuple[int, int]]: The vertex indices of each boundary edge,
+                oriented so that the triangulation lies on its left (the
+                boundary runs counter-clockwise).
+
+        """
+        coords = self.pointset.coords
+        indices = self.indices
+        # Arête (a, b) avec a < b -> troisième sommet de son unique triangle ;
+        # une arête vue deux fois est intérieure
+        opposite: dict[tuple[int, int], int] = {}
+        for i in range(0, len(indices), 3):
+            a, b, c = indices[i], indices[i + 1], indices[i + 2]
+            for edge, other in (((a, b), c), ((b, c), a), ((a, c), b)):
+                if opposite.pop(edge, None) is None:
+                    opposite[edge] = other
+
+        edges = []
+        for (a, b), c in opposite.items():
+            turn = orient2d(
+                coords[2 * a],
+                coords[2 * a + 1],
+                coords[2 * b],
+                coords[2 * b + 1],
+                coords[2 * c],
+                coords[2 * c + 1],
+            )
+            edges.append((a, b) if turn > 0 else (b, a))
+        return edges
+
+    @property
+    def byte_length(self) -> int:
+        """The length of the serialized triangulation in bytes."""
+        return 4 + 8 * self.pointset.point_count + 4 + 12 * self.triangle_count
+
+    def iter_bytes(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Serialize Triangles to bytes, chunk by chunk.
+
+        The chunks join into the same bytes as to_bytes, but the whole
+        serialization is never held in memory at once.
+
+        Args:
+            chunk_size (int): The maximum length of the coordinate and
+                index chunks in bytes.
+
+        Yields:
+            bytes: The next chunk of the byte representation.
+
+        """
+        step = max(1, chunk_size // 4)  # Coordonnées et indices font 4 octets
+
+        yield struct.pack("<L", self.pointset.point_count)
+        coords = self.pointset.coords
+        for start in range(0, len(coords), step):
+            yield little_endian_bytes(coords[start : start + step], "f")
+
+        yield struct.pack("<L", self.triangle_count)
+        indices = self.indices
+        for start in range(0, len(indices), step):
+            yield little_endian_bytes(indices[start : start + step], "I")
+
     def to_bytes(self) -> bytes:
         """Serialize Triangles to bytes.
 
@@ -115,12 +275,33 @@ class Triangles:
             bytes: The byte representation of the triangulation.
 
         """
-        data = bytearray(self.pointset.to_bytes())
-        data.extend(struct.pack("<L", self.triangle_count))
-        for triangle in self.triangles:
-            idx1 = self.pointset.points.index(triangle.p1)
-            idx2 = self.pointset.points.index(triangle.p2)
-            idx3 = self.pointset.points.index(triangle.p3)
-            indices = sorted([idx1, idx2, idx3])
-            data.extend(struct.pack("<LLL", *indices))
-        return bytes(data)
+        indices = self.indices
+        if sys.byteorder == "big":  # Le format binaire est little-endian
+            indices = array("I", indices)
+            indices.byteswap()
+        return b"".join(
+            (
+                self.pointset.to_bytes(),
+                struct.pack("<L", self.triangle_count),
+                indices.tobytes(),
+            )
+        )
+
+
+def little_endian_bytes(values: array, typecode: str) -> bytes:
+    """Return the little-endian bytes of values stored with a typecode.
+
+    Args:
+        values (array): The values, converted if stored with another
+            typecode (e.g. float64 coordinates rounded to float32).
+        typecode (str): The typecode of the binary format.
+
+    Returns:
+        bytes: The byte representation of the values.
+
+    """
+    if values.typecode != typecode:
+        values = array(typecode, values)
+    if sys.byteorder == "big":  # Le format binaire est little-endian
+        values.byteswap()  # Les tranches sont des copies, modifiables
+    return values.tobytes()
@@ -0,0 +1,169 @@
+"""Service shared by the Triangulator APIs.
+
+This module holds the configuration read from the environment, the parsing
+of the query parameters, the cache keys and the mapping of failures to HTTP
+statuses, and the triangulation run by worker processes. It is used by the
+Flask API and by the ASGI API, and imports neither of them, so that each one
+only builds its own application and the worker processes build neither.
+"""
+
+import math
+import multiprocessing
+import os
+
+from classes.pointset import PointSet
+from services.PointSetManagerService import (
+    CircuitOpenError,
+    ManagerResponseError,
+    ManagerUnavailableError,
+    PointSetNotFoundError,
+)
+
+# Le pointset manager est en localhost:5000 par défaut
+POINTSET_MANAGER_URL = os.environ.get("POINTSET_MANAGER_URL", "http://localhost:5000")
+
+# Cache des triangulations : 64 Mo de résultats, valables 5 minutes
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_TTL = 300.0
+
+# Cache disque optionnel, partagé entre les workers et conservé au redémarrage
+DISK_CACHE_DIR = os.environ.get("TRIANGULATION_CACHE_DIR")
+DISK_CACHE_MAX_BYTES = int(
+    os.environ.get("TRIANGULATION_CACHE_MAX_BYTES", 1024 * 1024 * 1024)
+)
+
+# Taille des morceaux envoyés depuis un fichier du cache disque
+CHUNK_SIZE = 64 * 1024
+
+# Processus de triangulation, un par cœur par défaut. Ils sont créés par un
+# serveur de fork : forker le serveur lui-même, dont d'autres threads tiennent
+# des verrous, pourrait laisser un verrou pris à jamais dans le processus fils
+WORKERS = int(os.environ.get("TRIANGULATION_WORKERS", os.cpu_count() or 1))
+PROCESS_CONTEXT = multiprocessing.get_context("forkserver")
+
+
+def merge_tolerance(value: str | None) -> float | None:
+    """Parse the tolerance query parameter.
+
+    Args:
+        value (str | None): The parameter, None when it is absent.
+
+    Returns:
+        float | None: None to reject duplicated points, else the distance
+            under which points are merged.
+
+    Raises:
+        ValueError: If the parameter is not a finite non-negative number.
+
+    """
+    if value is None:
+        return None
+    try:
+        tolerance = float(value)
+    except ValueError:
+        tolerance = math.nan
+    if not 0 <= tolerance < math.inf:
+        raise ValueError(f"Invalid merge tolerance: {value}")
+    return tolerance
+
+
+def max_points_limit(value: str | None) -> int | None:
+    """Parse the maxPoints query parameter.
+
+    Args:
+        value (str | None): The parameter, None when it is absent.
+
+    Returns:
+        int | None: None to triangulate every point, else the maximum
+            number of points kept by the decimation.
+
+    Raises:
+        ValueError: If the parameter is not an integer of at least 3.
+
+    """
+    if value is None:
+        return None
+    if not value.isdigit() or int(value) < 3:
+        raise ValueError(f"Invalid maximum number of points: {value}")
+    return int(value)
+
+
+def cache_variant(
+    engine: str,
+    tolerance: float | None,
+    constrained: bool = False,
+    max_points: int | None = None,
+) -> str:
+    """Return the key of a triangulation variant in the caches.
+
+    Args:
+        engine (str): The triangulation engine.
+        tolerance (float | None): The merge tolerance, None if duplicated
+            points are rejected.
+        constrained (bool): Whether the triangulation has segments.
+        max_points (int | None): The decimation limit, None if every point
+            is triangulated.
+
+    Returns:
+        str: The engine, followed by the merge tolerance, the constrained
+            mark and the decimation limit when they apply.
+
+    """
+    variant = engine if tolerance is None else f"{engine}-merge{tolerance!r}"
+    if constrained:
+        variant += "-constrained"
+    if max_points is not None:
+        variant += f"-lod{max_points}"
+    return variant
+
+
+def error_status(error: Exception) -> tuple[int, str]:
+    """Return the HTTP status and the message of a triangulation failure.
+
+    Args:
+        error (Exception): The exception raised while loading a triangulation.
+
+    Returns:
+        tuple[int, str]: The HTTP status and the error message.
+
+    """
+    if isinstance(error, PointSetNotFoundError):
+        return 404, "PointSet not found"
+    if isinstance(error, CircuitOpenError):
+        return 503, "Service unavailable"
+    if isinstance(error, ManagerUnavailableError):
+        return 500, "Service unavailable"
+    if isinstance(error, ManagerResponseError):
+        return 500, f"Failed to retrieve PointSet: {error}"
+    # Erreur de décodage ou de triangulation
+    return 500, str(error)
+
+
+def triangulate_bytes(
+    point_set_bytes: bytes,
+    engine: str,
+    tolerance: float | None = None,
+    max_points: int | None = None,
+) -> bytes:
+    """Triangule un pointset sérialisé dans un processus du pool.
+
+    Args:
+        point_set_bytes (bytes): The byte representation of the PointSet.
+        engine (str): The triangulation engine.
+        tolerance (float | None): The merge tolerance of duplicated points,
+            None to reject them.
+        max_points (int | None): The number of points the PointSet is
+            decimated to, None to triangulate every point.
+
+    Returns:
+        bytes: The serialized Triangles.
+
+    Raises:
+        ValueError: If the PointSet cannot be decoded or triangulated.
+
+    """
+    point_set = PointSet.from_bytes(point_set_bytes)
+    if max_points is not None:
+        point_set, _ = point_set.decimate(max_points)
+    triangles = point_set.triangulate(engine=engine, merge_tolerance=tolerance)
+    return triangles.to_bytes()
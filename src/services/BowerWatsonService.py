@@ -1,27 +1,44 @@
 """Service for the Bowyer-Watson triangulation algorithm.
 
 This module provides the implementation of the Bowyer-Watson algorithm
-for Delaunay triangulation.
+for Delaunay triangulation, and an incremental triangulation that keeps
+its mesh to insert more points later.
 """
 
-from classes.pointset import Point
-from classes.triangles import Triangle
+import math
+from array import array
 
+from classes.mesh import NO_NEIGHBOR, Mesh
+from classes.pointset import Point, PointSet
+from classes.triangles import Triangle, Triangles
+from services import SpatialSortService
+from services.GeometryService import incircle, orient2d
 
-def super_triangle(points: list[Point]) -> Triangle:
-    """Create a super-triangle that encompasses all points in the list.
+SUPER_TRIANGLE_SCALE = 1e12
+
+# Marge autour des points, en fraction de leur boîte englobante, dans
+# laquelle une triangulation incrémentale accepte des points sans être
+# reconstruite
+INSERTION_MARGIN = 0.5
+
+
+def bounding_box(xs: list[float], ys: list[float]) -> tuple[float, float, float, float]:
+    """Return the bounding box (min x, min y, max x, max y) of points."""
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def super_triangle(bbox: tuple[float, float, float, float]) -> Triangle:
+    """Create a super-triangle that encompasses a bounding box.
 
     Args:
-        points (list[Point]): The list of points to encompass.
+        bbox (tuple[float, float, float, float]): The box to encompass
+            (min x, min y, max x, max y).
 
     Returns:
-        Triangle: A triangle that contains all the points.
+        Triangle: A counter-clockwise triangle that contains the box.
 
     """
-    min_x = min(point.x for point in points)
-    max_x = max(point.x for point in points)
-    min_y = min(point.y for point in points)
-    max_y = max(point.y for point in points)
+    min_x, min_y, max_x, max_y = bbox
 
     # Calculs des dimension de la boîte qui englobe tous les points
     dx = max_x - min_x  # Largeur de la boîte
@@ -30,87 +47,739 @@ def super_triangle(points: list[Point]) -> Triangle:
     mid_x = (min_x + max_x) / 2  # Centre en x
     mid_y = (min_y + max_y) / 2  # Centre en y
 
-    # Création du super-triangle
-    p1 = Point(mid_x - 20 * delta_max, mid_y - delta_max)
-    p2 = Point(mid_x, mid_y + 20 * delta_max)
-    p3 = Point(mid_x + 20 * delta_max, mid_y - delta_max)
+    # Création du super-triangle (sens trigonométrique). Il doit rester hors
+    # des cercles circonscrits des triangles du bord, qui sont immenses pour
+    # des points presque alignés : les prédicats exacts permettent de le
+    # prendre très grand sans perte de précision.
+    scale = SUPER_TRIANGLE_SCALE * delta_max
+    p1 = Point(mid_x - scale, mid_y - delta_max)
+    p2 = Point(mid_x + scale, mid_y - delta_max)
+    p3 = Point(mid_x, mid_y + scale)
     return Triangle(p1, p2, p3)
 
 
-def add_point_to_triangulation(point: Point, triangulation: list["Triangle"]) -> None:
-    """Ajoute un point à la triangulation en utilisant l'algorithme de Bowyer-Watson."""
-    from classes.triangles import Triangle
+class TriangleLocator:
+    """Grid of recently created triangles used as starting points for walks.
+
+    Attributes:
+        min_x (float): Left bound of the grid.
+        min_y (float): Bottom bound of the grid.
+        cell_size (float): Width and height of a grid cell.
+        columns (int): Number of cells per row and per column.
+        hints (dict): Last triangle created in each cell.
+        last (int): Last triangle created anywhere.
+
+    """
+
+    NEIGHBORHOOD = [(0, 0)] + [
+        (di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)
+    ]
+
+    def __init__(
+        self, bbox: tuple[float, float, float, float], count: int, start: int
+    ) -> None:
+        """Initialize a TriangleLocator.
+
+        Args:
+            bbox (tuple[float, float, float, float]): The bounding box of the
+                points to insert (min x, min y, max x, max y).
+            count (int): The number of points to insert.
+            start (int): The initial triangle (the super-triangle).
+
+        """
+        self.min_x, self.min_y, max_x, max_y = bbox
+        width = max_x - self.min_x
+        height = max_y - self.min_y
+        # Environ quatre points par cellule une fois tous les points insérés
+        self.columns = max(1, int(math.sqrt(count / 4)))
+        self.cell_size = max(width, height) / self.columns or 1.0
+        self.hints: dict[tuple[int, int], int] = {}
+        self.last = start
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        """Return the grid cell containing a point."""
+        i = int((x - self.min_x) / self.cell_size)
+        j = int((y - self.min_y) / self.cell_size)
+        return min(max(i, 0), self.columns - 1), min(max(j, 0), self.columns - 1)
+
+    def start_for(self, mesh: Mesh, x: float, y: float) -> int:
+        """Return a live triangle close to the point to start the walk from."""
+        i, j = self._cell(x, y)
+        # On cherche d'abord dans la cellule du point, puis dans ses voisines
+        for di, dj in self.NEIGHBORHOOD:
+            hint = self.hints.get((i + di, j + dj))
+            if hint is not None and mesh.is_alive(hint):
+                return hint
+        return self.last
+
+    def remember(self, x: float, y: float, triangle: int) -> None:
+        """Record a triangle created around a freshly inserted point."""
+        self.hints[self._cell(x, y)] = triangle
+        self.last = triangle
+
+
+def locate_triangle(mesh: Mesh, x: float, y: float, start: int) -> int:
+    """Trouve le triangle qui contient le point en marchant depuis `start`.
 
-    bad_triangles = find_bad_triangles(point, triangulation)
-    polygon = find_boundary_edges(bad_triangles)
+    Les triangles étant orientés dans le sens trigonométrique, on traverse
+    toute arête qui laisse le point à sa droite jusqu'à trouver le triangle
+    qui le contient.
+    """
+    xs, ys = mesh.xs, mesh.ys
+    vertices, neighbors = mesh.vertices, mesh.neighbors
+    t = start
+    for _ in range(mesh.triangle_count + 1):
+        for i in range(3):
+            neighbor = neighbors[3 * t + i]
+            if neighbor == NO_NEIGHBOR:
+                continue
+            a = vertices[3 * t + i]
+            b = vertices[3 * t + (i + 1) % 3]
+            if orient2d(xs[a], ys[a], xs[b], ys[b], x, y) < 0:
+                t = neighbor
+                break
+        else:
+            return t
+
+    # Marche bloquée : recherche exhaustive de secours
+    for t in range(len(vertices) // 3):
+        if mesh.is_alive(t) and mesh.in_circumcircle(t, x, y):
+            return t
+    return start
+
+
+def add_point_to_triangulation(mesh: Mesh, vertex: int, start: int) -> int:
+    """Ajoute un sommet à la triangulation en utilisant l'algorithme de Bowyer-Watson.
+
+    Returns:
+        int: One of the triangles created around the vertex.
+
+    """
+    x, y = mesh.xs[vertex], mesh.ys[vertex]
+    containing = locate_triangle(mesh, x, y, start)
+    bad_triangles = find_bad_triangles(mesh, x, y, containing)
+    polygon = find_boundary_edges(mesh, bad_triangles)
+
+    # Supprimer les triangles "mauvais" (leurs emplacements seront réutilisés)
+    for t in bad_triangles:
+        mesh.remove_triangle(t)
 
-    # Supprimer les triangles "mauvais"
-    for triangle in bad_triangles:
-        triangulation.remove(triangle)
+    # Créer de nouveaux triangles avec le sommet et les relier entre eux
+    vertices, neighbors = mesh.vertices, mesh.neighbors
+    by_start: dict[int, int] = {}
+    by_end: dict[int, int] = {}
+    for a, b, outside in polygon:
+        t = mesh.add_triangle(a, b, vertex)
+        neighbors[3 * t] = outside
+        if outside != NO_NEIGHBOR:
+            # Le voisin extérieur porte la même arête dans l'autre sens (b, a)
+            for i in range(3):
+                if vertices[3 * outside + i] == b:
+                    neighbors[3 * outside + i] = t
+                    break
+        by_start[a] = t
+        by_end[b] = t
 
-    # Créer de nouveaux triangles avec le point
-    for edge in polygon:
-        new_triangle = Triangle(edge[0], edge[1], point)
-        triangulation.append(new_triangle)
+    for a, b, _ in polygon:
+        t = by_start[a]
+        neighbors[3 * t + 1] = by_start[b]  # arête (b, vertex)
+        neighbors[3 * t + 2] = by_end[a]  # arête (vertex, a)
 
+    return by_start[polygon[0][0]]
 
-def find_bad_triangles(
-    point: Point, triangulation: list["Triangle"]
-) -> list["Triangle"]:
-    """Trouve les triangles dont le cercle circonscrit contient le point."""
-    bad_triangles = []
-    for triangle in triangulation:
-        if triangle.is_point_in_circumcircle(point):
-            bad_triangles.append(triangle)
+
+def find_bad_triangles(mesh: Mesh, x: float, y: float, containing: int) -> set[int]:
+    """Trouve les triangles dont le cercle circonscrit contient le point.
+
+    La cavité est connexe : on part du triangle qui contient le point et on
+    s'étend de voisin en voisin, seuls les triangles concernés sont examinés.
+    """
+    neighbors = mesh.neighbors
+    bad_triangles = {containing}
+    stack = [containing]
+    while stack:
+        t = stack.pop()
+        for neighbor in neighbors[3 * t : 3 * t + 3]:
+            if (
+                neighbor != NO_NEIGHBOR
+                and neighbor not in bad_triangles
+                and mesh.in_circumcircle(neighbor, x, y)
+            ):
+                bad_triangles.add(neighbor)
+                stack.append(neighbor)
     return bad_triangles
 
 
-def find_boundary_edges(bad_triangles: list["Triangle"]) -> list[tuple[Point, Point]]:
-    """Trouve les arêtes frontières des triangles "mauvais"."""
+def find_boundary_edges(
+    mesh: Mesh, bad_triangles: set[int]
+) -> list[tuple[int, int, int]]:
+    """Trouve les arêtes frontières des triangles "mauvais".
+
+    Une arête est frontière quand le voisin de l'autre côté n'est pas "mauvais".
+    Chaque arête (a, b) est renvoyée avec ce voisin extérieur.
+    """
+    vertices, neighbors = mesh.vertices, mesh.neighbors
     polygon = []
-    for triangle in bad_triangles:
-        for edge in triangle.edges:
-            if not is_edge_shared(edge, triangle, bad_triangles):
-                polygon.append(edge)
+    for t in bad_triangles:
+        for i in range(3):
+            neighbor = neighbors[3 * t + i]
+            if neighbor == NO_NEIGHBOR or neighbor not in bad_triangles:
+                a = vertices[3 * t + i]
+                b = vertices[3 * t + (i + 1) % 3]
+                polygon.append((a, b, neighbor))
     return polygon
 
 
-def is_edge_shared(
-    edge: tuple[Point, Point],
-    current_triangle: "Triangle",
-    bad_triangles: list["Triangle"],
-) -> bool:
-    """Vérifie si une arête est partagée avec un autre triangle "mauvais"."""
-    for other_triangle in bad_triangles:
-        if current_triangle == other_triangle:
+def find_incident_triangle(mesh: Mesh, vertex: int, start: int) -> int:
+    """Trouve un triangle dont le sommet est `vertex`.
+
+    On marche vers la position du sommet : la marche s'arrête dans un des
+    triangles qui le contiennent, c'est-à-dire un triangle incident.
+    """
+    vertices = mesh.vertices
+    t = locate_triangle(mesh, mesh.xs[vertex], mesh.ys[vertex], start)
+    if mesh.is_alive(t) and vertex in vertices[3 * t : 3 * t + 3]:
+        return t
+
+    # Marche bloquée : recherche exhaustive de secours
+    for t in range(len(vertices) // 3):
+        if mesh.is_alive(t) and vertex in vertices[3 * t : 3 * t + 3]:
+            return t
+    raise ValueError(f"Vertex {vertex} is not in the mesh")
+
+
+def find_delaunay_ear(mesh: Mesh, ring: list[int], require_empty: bool = True) -> int:
+    """Trouve une oreille du polygone `ring` (sens trigonométrique).
+
+    Une oreille (a, b, c) est convexe en b et, si `require_empty`, son cercle
+    circonscrit ne contient aucun autre sommet du polygone : c'est alors un
+    triangle de Delaunay.
+
+    Returns:
+        int: The position of b in the ring, -1 if there is no such ear.
+
+    """
+    xs, ys = mesh.xs, mesh.ys
+    count = len(ring)
+    for j in range(count):
+        a, b, c = ring[j - 1], ring[j], ring[(j + 1) % count]
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+        if orient2d(ax, ay, bx, by, cx, cy) <= 0:
             continue
+        if not require_empty or all(
+            incircle(ax, ay, bx, by, cx, cy, xs[d], ys[d]) <= 0
+            for d in ring
+            if d != a and d != b and d != c
+        ):
+            return j
+    return -1
 
-        for other_edge in other_triangle.edges:
-            if are_edges_equal(edge, other_edge):
-                return True
-    return False
 
+def remove_point_from_triangulation(mesh: Mesh, vertex: int, start: int) -> int:
+    """Retire un sommet de la triangulation et retriangule le trou laissé.
 
-def are_edges_equal(edge1: tuple[Point, Point], edge2: tuple[Point, Point]) -> bool:
-    """Vérifie si deux arêtes sont égales, indépendamment de l'ordre des points."""
-    return (edge1[0] == edge2[0] and edge1[1] == edge2[1]) or (
-        edge1[0] == edge2[1] and edge1[1] == edge2[0]
-    )
+    Les triangles autour du sommet forment un polygone étoilé. Il est
+    retriangulé oreille par oreille en ne gardant que des oreilles de
+    Delaunay, ce qui rend la triangulation de Delaunay des sommets restants
+    en ne touchant qu'au voisinage du sommet. Le sommet ne doit pas être un
+    sommet du super-triangle.
+
+    Returns:
+        int: One of the triangles created in the hole.
+
+    """
+    vertices, neighbors = mesh.vertices, mesh.neighbors
+
+    # Tour de l'étoile du sommet dans le sens trigonométrique : chaque
+    # triangle (vertex, b, c) donne l'arête (b, c) du polygone et le voisin
+    # extérieur de cette arête
+    ring: list[int] = []
+    boundary: dict[tuple[int, int], int] = {}
+    star = []
+    first = t = find_incident_triangle(mesh, vertex, start)
+    while True:
+        i = vertices[3 * t : 3 * t + 3].index(vertex)
+        b = vertices[3 * t + (i + 1) % 3]
+        c = vertices[3 * t + (i + 2) % 3]
+        ring.append(b)
+        boundary[(b, c)] = neighbors[3 * t + (i + 1) % 3]
+        star.append(t)
+        t = neighbors[3 * t + (i + 2) % 3]  # Triangle suivant autour du sommet
+        if t == first:
+            break
+
+    for t in star:
+        mesh.remove_triangle(t)
+
+    # Retriangulation du trou, puis liaison des nouveaux triangles entre eux
+    # et avec les voisins extérieurs
+    created = []
+    while len(ring) > 3:
+        j = find_delaunay_ear(mesh, ring)
+        if j < 0:  # Cas dégénéré : une oreille convexe reste valide
+            j = find_delaunay_ear(mesh, ring, require_empty=False)
+        created.append(
+            mesh.add_triangle(ring[j - 1], ring[j], ring[(j + 1) % len(ring)])
+        )
+        del ring[j]
+    created.append(mesh.add_triangle(*ring))
+
+    link_cavity(mesh, created, boundary)
+    return created[0]
+
+
+def link_cavity(
+    mesh: Mesh, created: list[int], boundary: dict[tuple[int, int], int]
+) -> None:
+    """Relie les triangles qui remplissent une cavité.
+
+    Les arêtes partagées par deux nouveaux triangles les relient entre eux,
+    les autres sont des arêtes du bord de la cavité, reliées au voisin
+    extérieur donné par `boundary` pour l'arête (a, b) dans le même sens.
+    """
+    vertices, neighbors = mesh.vertices, mesh.neighbors
+    edges = {}
+    for t in created:
+        for i in range(3):
+            edges[(vertices[3 * t + i], vertices[3 * t + (i + 1) % 3])] = 3 * t + i
+    for (a, b), slot in edges.items():
+        twin = edges.get((b, a))
+        if twin is not None:
+            neighbors[slot] = twin // 3
+            continue
+        outside = boundary[(a, b)]
+        neighbors[slot] = outside
+        if outside != NO_NEIGHBOR:
+            # Le voisin extérieur porte la même arête dans l'autre sens (b, a)
+            for i in range(3):
+                if vertices[3 * outside + i] == b:
+                    neighbors[3 * outside + i] = slot // 3
+                    break
+
+
+def insert_segment(
+    mesh: Mesh, a: int, b: int, start: int, fixed: set[tuple[int, int]]
+) -> int:
+    """Force le segment (a, b) à être une arête de la triangulation.
+
+    Les triangles traversés par le segment sont retirés et les deux
+    pseudo-polygones laissés de part et d'autre sont retriangulés en
+    Delaunay contraint. Un sommet situé sur le segment le coupe en deux
+    segments insérés l'un après l'autre.
+
+    Args:
+        mesh (Mesh): The triangulation.
+        a (int): The first vertex of the segment.
+        b (int): The second vertex of the segment.
+        start (int): A live triangle to start the search for a from.
+        fixed (set[tuple[int, int]]): The constrained edges already
+            inserted (both directions), updated with the new ones.
+
+    Returns:
+        int: A live triangle incident to the segment.
+
+    Raises:
+        ValueError: If the segment crosses a constrained edge.
+
+    """
+    xs, ys = mesh.xs, mesh.ys
+    vertices, neighbors = mesh.vertices, mesh.neighbors
+    t = start
+    while a != b:
+        ax, ay, bx, by = xs[a], ys[a], xs[b], ys[b]
+
+        # Tour des triangles autour de a jusqu'à celui dont l'angle en a
+        # contient la direction de b : u est à droite du segment, w à gauche
+        first = t = find_incident_triangle(mesh, a, t)
+        on_segment = None
+        while True:
+            i = vertices[3 * t : 3 * t + 3].index(a)
+            u = vertices[3 * t + (i + 1) % 3]
+            w = vertices[3 * t + (i + 2) % 3]
+            side_u = orient2d(ax, ay, bx, by, xs[u], ys[u])
+            side_w = orient2d(ax, ay, bx, by, xs[w], ys[w])
+            if side_u < 0 < side_w:
+                break
+            # Un voisin de a sur le segment, du côté de b (b lui-même si
+            # l'arête existe déjà) : le segment commence par cette arête
+            for v, side in ((u, side_u), (w, side_w)):
+                if (
+                    side == 0
+                    and (xs[v] - ax) * (bx - ax) + (ys[v] - ay) * (by - ay) > 0
+                ):
+                    on_segment = v
+            if on_segment is not None:
+                break
+            t = neighbors[3 * t + (i + 2) % 3]  # Triangle suivant autour de a
+            if t == first:
+                raise ValueError(f"Cannot find segment ({a}, {b}) in the mesh")
+        if on_segment is not None:
+            fixed.update(((a, on_segment), (on_segment, a)))
+            a = on_segment
+            continue
+
+        # Marche le long du segment à travers les arêtes (u, w) qu'il coupe
+        crossed = [t]
+        right, left = [u], [w]
+        slot = 3 * t + (i + 1) % 3
+        while True:
+            if (u, w) in fixed:
+                raise ValueError("Constrained segments must not cross")
+            t = neighbors[slot]
+            crossed.append(t)
+            j = vertices[3 * t : 3 * t + 3].index(w)  # t porte l'arête (w, u)
+            v = vertices[3 * t + (j + 2) % 3]
+            side = orient2d(ax, ay, bx, by, xs[v], ys[v])
+            if side == 0:
+                break  # v est b, ou un sommet sur le segment
+            if side < 0:
+                right.append(v)
+                u, slot = v, 3 * t + (j + 2) % 3
+            else:
+                left.append(v)
+                w, slot = v, 3 * t + (j + 1) % 3
+
+        boundary: dict[tuple[int, int], int] = {}
+        inside = set(crossed)
+        for t in crossed:
+            for i in range(3):
+                if neighbors[3 * t + i] not in inside:
+                    edge = (vertices[3 * t + i], vertices[3 * t + (i + 1) % 3])
+                    boundary[edge] = neighbors[3 * t + i]
+        for t in crossed:
+            mesh.remove_triangle(t)
+
+        # Les deux côtés du segment (a, v), dans le sens trigonométrique
+        created: list[int] = []
+        triangulate_pseudo_polygon(mesh, a, v, left[::-1], created)
+        triangulate_pseudo_polygon(mesh, v, a, right, created)
+        link_cavity(mesh, created, boundary)
+
+        fixed.update(((a, v), (v, a)))
+        a, t = v, created[0]
+    return t
+
+
+def triangulate_pseudo_polygon(
+    mesh: Mesh, p: int, q: int, chain: list[int], created: list[int]
+) -> None:
+    """Triangule en Delaunay contraint le polygone (p, q, *chain).
+
+    Le polygone est orienté dans le sens trigonométrique et tous les
+    sommets de `chain` sont à gauche de la base (p, q). Le sommet de la
+    chaîne dont le cercle circonscrit avec la base ne contient aucun autre
+    sommet de la chaîne forme un triangle, puis les deux morceaux restants
+    sont traités de la même façon.
+    """
+    xs, ys = mesh.xs, mesh.ys
+    stack = [(p, q, chain)]
+    while stack:
+        p, q, chain = stack.pop()
+        if not chain:
+            continue
+        px, py, qx, qy = xs[p], ys[p], xs[q], ys[q]
+        k = 0
+        for j in range(1, len(chain)):
+            c, d = chain[k], chain[j]
+            if (
+                incircle(px, py, qx, qy, xs[c], ys[c], xs[d], ys[d]) > 0
+                and orient2d(px, py, qx, qy, xs[d], ys[d]) > 0
+            ):
+                k = j
+        c = chain[k]
+        created.append(mesh.add_triangle(p, q, c))
+        stack.append((c, q, chain[:k]))
+        stack.append((p, c, chain[k + 1 :]))
 
 
 def remove_super_triangle_vertices(
-    triangles: list[Triangle], super_triangle: Triangle
-) -> list[Triangle]:
-    """Retire les triangles qui utilisent les sommets du super-triangle."""
-    super_points = {super_triangle.p1, super_triangle.p2, super_triangle.p3}
-    final_triangles = []
-
-    for triangle in triangles:
-        if not (
-            triangle.p1 in super_points
-            or triangle.p2 in super_points
-            or triangle.p3 in super_points
+    mesh: Mesh, point_count: int
+) -> list[tuple[int, int, int]]:
+    """Retire les triangles qui utilisent les sommets du super-triangle.
+
+    Les sommets du super-triangle sont ajoutés après les points du PointSet,
+    leurs indices sont donc supérieurs ou égaux à `point_count`.
+    """
+    return [
+        (a, b, c)
+        for a, b, c in mesh.triangles()
+        if a < point_count and b < point_count and c < point_count
+    ]
+
+
+def start_mesh(
+    xs: list[float],
+    ys: list[float],
+    bbox: tuple[float, float, float, float],
+    enclosing: tuple[float, float, float, float] | None = None,
+) -> tuple[Mesh, TriangleLocator]:
+    """Crée le maillage des points réduit au super-triangle, sans les insérer.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        bbox (tuple[float, float, float, float]): The bounding box of the
+            points (min x, min y, max x, max y).
+        enclosing (tuple[float, float, float, float] | None): The box the
+            super-triangle must encompass, the bounding box by default.
+
+    Returns:
+        tuple[Mesh, TriangleLocator]: The mesh, whose vertices are the
+            points followed by the three vertices of the super-triangle,
+            and the locator of its triangles.
+
+    """
+    mesh = Mesh(xs[:], ys[:])
+    triangle = super_triangle(enclosing or bbox)
+    start = mesh.add_triangle(
+        mesh.add_vertex(triangle.p1.x, triangle.p1.y),
+        mesh.add_vertex(triangle.p2.x, triangle.p2.y),
+        mesh.add_vertex(triangle.p3.x, triangle.p3.y),
+    )
+    return mesh, TriangleLocator(bbox, len(xs), start)
+
+
+def insert_vertices(mesh: Mesh, locator: TriangleLocator, vertices: list[int]) -> None:
+    """Insère des sommets du maillage un par un, dans l'ordre donné.
+
+    Chaque point est localisé en marchant depuis un triangle proche, puis
+    la cavité est retriangulée. Un ordre spatial garde les points successifs
+    proches les uns des autres.
+    """
+    xs, ys = mesh.xs, mesh.ys
+    for vertex in vertices:
+        x, y = xs[vertex], ys[vertex]
+        start = locator.start_for(mesh, x, y)
+        created = add_point_to_triangulation(mesh, vertex, start)
+        locator.remember(x, y, created)
+
+
+def triangulate(
+    xs: list[float],
+    ys: list[float],
+    order: str = "hilbert",
+    bbox: tuple[float, float, float, float] | None = None,
+    segments: list[tuple[int, int]] | None = None,
+) -> list[tuple[int, int, int]]:
+    """Triangule des points avec l'algorithme de Bowyer-Watson.
+
+    Les segments sont insérés une fois tous les points triangulés : le
+    résultat est alors la triangulation de Delaunay contrainte.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        order (str): The insertion order ('hilbert', 'brio' or 'input').
+        bbox (tuple[float, float, float, float] | None): The bounding box
+            of the points when already known, computed otherwise.
+        segments (list[tuple[int, int]] | None): The pairs of point indices
+            that must be edges of the triangulation.
+
+    Returns:
+        list[tuple[int, int, int]]: The vertex indices of each triangle.
+
+    Raises:
+        ValueError: If two segments cross.
+
+    """
+    # Les sommets du maillage sont les indices des points,
+    # suivis des trois sommets du super-triangle
+    mesh, locator = start_mesh(xs, ys, bbox or bounding_box(xs, ys))
+    insert_vertices(mesh, locator, SpatialSortService.insertion_order(xs, ys, order))
+    if segments:
+        start = locator.last
+        fixed: set[tuple[int, int]] = set()
+        for a, b in segments:
+            start = insert_segment(mesh, a, b, start, fixed)
+    return remove_super_triangle_vertices(mesh, len(xs))
+
+
+class IncrementalTriangulation:
+    """Represents a Bowyer-Watson triangulation that points can be added to.
+
+    The mesh, super-triangle included, is kept between updates, so that
+    adding or removing points costs in proportion to their neighbourhood:
+    only the removal of the super-triangle and the building of the result
+    are repeated.
+
+    The super-triangle is built around the bounding box of the points
+    enlarged by INSERTION_MARGIN on each side. Adding a point outside this
+    box rebuilds the mesh around all the points. Removed points stay in
+    the mesh, unused, until they outnumber the points left; the mesh is
+    then rebuilt without them.
+
+    Attributes:
+        order (str): The insertion order of each batch of points.
+        point_count (int): The number of points triangulated.
+        rebuilds (int): The number of times the mesh was rebuilt.
+
+    """
+
+    def __init__(self, point_set: PointSet, order: str = "hilbert") -> None:
+        """Triangulate the initial points.
+
+        Args:
+            point_set (PointSet): The initial points.
+            order (str): The insertion order ('hilbert', 'brio' or 'input').
+
+        Raises:
+            ValueError: If the PointSet cannot be triangulated or if the
+                order is unknown.
+
+        """
+        point_set.validate()
+        self.order = order
+        self.rebuilds = 0
+        # Les points ajoutés sont stockés au format du PointSet (float32 une
+        # fois décodé), pour être triangulés tels qu'ils seront sérialisés
+        self._typecode = point_set.coords.typecode
+        self._xs = point_set.coords[0::2].tolist()
+        self._ys = point_set.coords[1::2].tolist()
+        self._dead = 0
+        self._build()
+
+    @property
+    def point_count(self) -> int:
+        """The number of points triangulated."""
+        return len(self._index_of)
+
+    def insert(self, points: PointSet | list[Point]) -> Triangles:
+        """Add points to the triangulation.
+
+        Args:
+            points (PointSet | list[Point]): The points to add, indexed
+                after the points already triangulated.
+
+        Returns:
+            Triangles: The triangulation of all the points.
+
+        Raises:
+            ValueError: If a point is already triangulated or given twice.
+
+        """
+        new_xs, new_ys = self._rounded(points)
+        if not new_xs:
+            return self.triangles()
+        first = len(self._xs)
+        added = {}
+        for k, point in enumerate(zip(new_xs, new_ys, strict=True)):
+            if point in self._index_of or point in added:
+                raise ValueError("Cannot triangulate a PointSet with duplicated points")
+            added[point] = first + k
+
+        self._xs.extend(new_xs)
+        self._ys.extend(new_ys)
+        self._alive.extend(b"\x01" * len(new_xs))
+        self._index_of.update(added)
+
+        min_x, min_y, max_x, max_y = self._box
+        if all(
+            min_x <= x <= max_x and min_y <= y <= max_y
+            for x, y in zip(new_xs, new_ys, strict=True)
         ):
-            final_triangles.append(triangle)
+            # Les nouveaux sommets suivent ceux du super-triangle dans le maillage
+            mesh = self._mesh
+            for x, y in zip(new_xs, new_ys, strict=True):
+                mesh.add_vertex(x, y)
+            order = SpatialSortService.insertion_order(new_xs, new_ys, self.order)
+            insert_vertices(mesh, self._locator, [first + 3 + k for k in order])
+        else:
+            self.rebuilds += 1
+            self._build()
+        return self.triangles()
+
+    def remove(self, points: PointSet | list[Point]) -> Triangles:
+        """Remove points from the triangulation.
+
+        The points left keep their order. If they are all collinear, the
+        triangulation has no triangle.
+
+        Args:
+            points (PointSet | list[Point]): The points to remove.
+
+        Returns:
+            Triangles: The triangulation of the points left.
+
+        Raises:
+            ValueError: If a point is not triangulated, or if less than 3
+                points would be left.
+
+        """
+        removed = {}
+        for point in zip(*self._rounded(points), strict=True):
+            if point not in self._index_of or point in removed:
+                raise ValueError(f"Point {point} is not in the triangulation")
+            removed[point] = self._index_of[point]
+        if len(self._index_of) - len(removed) < 3:
+            raise ValueError("Cannot triangulate a PointSet with less than 3 points")
+
+        for point, k in removed.items():
+            del self._index_of[point]
+            self._alive[k] = 0
+        self._dead += len(removed)
+        if self._dead > len(self._index_of):
+            self.rebuilds += 1
+            self._build()
+        else:
+            base = self._base
+            for k in removed.values():
+                x, y = self._xs[k], self._ys[k]
+                vertex = k if k < base else k + 3
+                start = self._locator.start_for(self._mesh, x, y)
+                created = remove_point_from_triangulation(self._mesh, vertex, start)
+                self._locator.remember(x, y, created)
+        return self.triangles()
+
+    def triangles(self) -> Triangles:
+        """Return the triangulation of the points triangulated so far.
+
+        Returns:
+            Triangles: The triangulation, on a copy of the points.
+
+        """
+        # Sommets du super-triangle : base, base + 1 et base + 2 ; les sommets
+        # suivants sont les points ajoutés depuis, décalés de 3. Les points
+        # retirés sont sautés dans la numérotation du résultat
+        base, alive = self._base, self._alive
+        index = [-1] * (len(self._xs) + 3)
+        coords = array(self._typecode)
+        for k, (x, y) in enumerate(zip(self._xs, self._ys, strict=True)):
+            if alive[k]:
+                index[k if k < base else k + 3] = len(coords) // 2
+                coords.append(x)
+                coords.append(y)
+
+        indices = array("I")
+        for a, b, c in self._mesh.triangles():
+            a, b, c = index[a], index[b], index[c]
+            if a >= 0 and b >= 0 and c >= 0:
+                indices.extend(sorted((a, b, c)))
+        return Triangles.from_indices(PointSet.from_coords(coords), indices)
+
+    def _rounded(self, points: PointSet | list[Point]) -> tuple[list, list]:
+        """Return the coordinates of points in the storage format."""
+        if not isinstance(points, PointSet):
+            points = PointSet(points)
+        coords = array(self._typecode, points.coords)
+        return coords[0::2].tolist(), coords[1::2].tolist()
+
+    def _build(self) -> None:
+        """Triangulate the points left in a new mesh with a new super-triangle."""
+        if self._dead:
+            alive = self._alive
+            self._xs = [x for k, x in enumerate(self._xs) if alive[k]]
+            self._ys = [y for k, y in enumerate(self._ys) if alive[k]]
+        xs, ys = self._xs, self._ys
+        self._index_of = {point: k for k, point in enumerate(zip(xs, ys, strict=True))}
+        self._alive = bytearray(b"\x01" * len(xs))
+        self._dead = 0
+
+        bbox = bounding_box(xs, ys)
+        min_x, min_y, max_x, max_y = bbox
+        margin = INSERTION_MARGIN * max(max_x - min_x, max_y - min_y)
+        self._box = (min_x - margin, min_y - margin, max_x + margin, max_y + margin)
+        self._base = len(xs)
 
-    return final_triangles
+        self._mesh, self._locator = start_mesh(xs, ys, bbox, self._box)
+        order = SpatialSortService.insertion_order(xs, ys, self.order)
+        insert_vertices(self._mesh, self._locator, order)
@@ -0,0 +1,343 @@
+"""Service for caching triangulation results.
+
+This module provides an in-process LRU cache of serialized triangulations.
+Results are stored by a digest of the PointSet bytes, so identical sets
+under different IDs share one entry, and each PointSet ID remembers the
+digest of its bytes so that a known ID is answered without fetching the
+PointSet again.
+
+It also provides a disk cache of the same payloads, shared by every worker
+process and kept across restarts.
+"""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+
+class TriangulationCache:
+    """Represents an LRU cache of serialized triangulations.
+
+    The cache is bounded by the total size of the stored payloads; the
+    least recently used entries are evicted first. Entries expire after a
+    time-to-live. All methods are thread-safe.
+
+    Attributes:
+        max_bytes (int): The maximum total size of the payloads.
+        ttl (float): The lifetime of an entry in seconds.
+        size (int): The current total size of the payloads.
+        hits (int): The number of lookups answered by the cache.
+        misses (int): The number of lookups, by ID or by content, that
+            found no live entry.
+
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty TriangulationCache.
+
+        Args:
+            max_bytes (int): The maximum total size of the payloads.
+            ttl (float): The lifetime of an entry in seconds.
+            clock (Callable[[], float]): The time source, in seconds.
+
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (digest, engine) -> (payload, expiration), du moins au plus récent
+        self._results: OrderedDict[tuple[bytes, str], tuple[bytes, float]] = (
+            OrderedDict()
+        )
+        # (id, engine) -> digest, et l'inverse pour oublier les ids à l'éviction
+        self._ids: dict[tuple[str, str], bytes] = {}
+        self._ids_of: dict[tuple[bytes, str], set[str]] = {}
+
+    @staticmethod
+    def hasher() -> hashlib.blake2b:
+        """Return a new hash object computing the content digest by chunks."""
+        return hashlib.blake2b(digest_size=16)
+
+    @classmethod
+    def digest(cls, data: bytes) -> bytes:
+        """Return the content digest of serialized PointSet bytes."""
+        hasher = cls.hasher()
+        hasher.update(data)
+        return hasher.digest()
+
+    def get_by_id(self, pointset_id: str, engine: str) -> bytes | None:
+        """Return the cached triangulation of a known PointSet ID.
+
+        Args:
+            pointset_id (str): The ID of the PointSet.
+            engine (str): The triangulation engine.
+
+        Returns:
+            bytes | None: The serialized Triangles, or None if the ID is
+                unknown or its result expired.
+
+        """
+        with self._lock:
+            digest = self._ids.get((pointset_id, engine))
+            payload = None if digest is None else self._lookup((digest, engine))
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return payload
+
+    def get(
+        self, digest: bytes, engine: str, pointset_id: str | None = None
+    ) -> bytes | None:
+        """Return the cached triangulation of a PointSet content.
+
+        On a hit, the ID is associated with the content for later lookups.
+
+        Args:
+            digest (bytes): The digest of the PointSet bytes.
+            engine (str): The triangulation engine.
+            pointset_id (str | None): The ID the PointSet was fetched with,
+                or None for a PointSet received without ID.
+
+        Returns:
+            bytes | None: The serialized Triangles, or None on a miss.
+
+        """
+        with self._lock:
+            payload = self._lookup((digest, engine))
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if pointset_id is not None:
+                self._remember_id(pointset_id, digest, engine)
+            return payload
+
+    def put(
+        self, pointset_id: str | None, digest: bytes, engine: str, payload: bytes
+    ) -> None:
+        """Store a triangulation, evicting the least recently used entries.
+
+        Payloads larger than the whole cache are not stored.
+
+        Args:
+            pointset_id (str | None): The ID the PointSet was fetched with,
+                or None for a PointSet received without ID.
+            digest (bytes): The digest of the PointSet bytes.
+            engine (str): The triangulation engine.
+            payload (bytes): The serialized Triangles.
+
+        """
+        if len(payload) > self.max_bytes:
+            return
+        key = (digest, engine)
+        with self._lock:
+            if key in self._results:
+                self._evict(key)
+            self._results[key] = (payload, self._clock() + self.ttl)
+            self.size += len(payload)
+            if pointset_id is not None:
+                self._remember_id(pointset_id, digest, engine)
+            while self.size > self.max_bytes:
+                self._evict(next(iter(self._results)))
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the cache."""
+        with self._lock:
+            return {
+                "entries": len(self._results),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self._ids.clear()
+            self._ids_of.clear()
+            self.size = self.hits = self.misses = 0
+
+    def _lookup(self, key: tuple[bytes, str]) -> bytes | None:
+        """Return a live payload and mark it as recently used (lock held)."""
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        payload, expiration = entry
+        if self._clock() >= expiration:
+            self._evict(key)
+            return None
+        self._results.move_to_end(key)
+        return payload
+
+    def _remember_id(self, pointset_id: str, digest: bytes, engine: str) -> None:
+        """Associate an ID with a stored content (lock held)."""
+        self._ids[(pointset_id, engine)] = digest
+        self._ids_of.setdefault((digest, engine), set()).add(pointset_id)
+
+    def _evict(self, key: tuple[bytes, str]) -> None:
+        """Remove an entry and the IDs pointing to it (lock held)."""
+        payload, _ = self._results.pop(key)
+        self.size -= len(payload)
+        digest, engine = key
+        for pointset_id in self._ids_of.pop(key, ()):
+            if self._ids.get((pointset_id, engine)) == digest:
+                del self._ids[(pointset_id, engine)]
+
+
+class DiskCache:
+    """Represents a directory of serialized triangulations keyed by content.
+
+    Files are written atomically (temporary file then rename), so readers in
+    other processes never see a partial payload, and are read through mmap
+    so that the processes share the pages of the system cache. The least
+    recently used files (by modification time, updated on each hit) are
+    removed when the directory grows over its size bound.
+
+    The total size is kept as a running estimate, so that a write does not
+    list the directory: it is only rescanned, which also accounts for the
+    files of the other processes, when the estimate crosses the bound. The
+    estimate and the counters are thread-safe; payloads are written outside
+    the lock.
+
+    Attributes:
+        directory (str): The directory holding the payloads.
+        max_bytes (int): The maximum total size of the payloads.
+        size (int): The estimated total size of the payloads.
+        hits (int): The number of lookups answered by this process.
+        misses (int): The number of lookups that found no payload.
+
+    """
+
+    SUFFIX = ".tri"
+    # Une éviction descend sous cette fraction de la borne, pour ne pas
+    # relister le répertoire à chaque écriture d'un cache plein
+    EVICTION_TARGET = 0.9
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """Initialize a DiskCache, creating its directory if needed.
+
+        Args:
+            directory (str): The directory holding the payloads.
+            max_bytes (int): The maximum total size of the payloads.
+
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = sum(size for _, size, _ in self._scan())
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, digest: bytes, engine: str) -> str:
+        """Return the path of the payload of a content and an engine."""
+        return os.path.join(self.directory, f"{digest.hex()}-{engine}{self.SUFFIX}")
+
+    def get(self, digest: bytes, engine: str) -> mmap.mmap | None:
+        """Return a read-only mapping of a cached triangulation.
+
+        Args:
+            digest (bytes): The digest of the PointSet bytes.
+            engine (str): The triangulation engine.
+
+        Returns:
+            mmap.mmap | None: The serialized Triangles, or None on a miss.
+                The mapping may be shared by several responses: it is
+                released with its last reference rather than closed.
+
+        """
+        path = self._path(digest, engine)
+        try:
+            with open(path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):  # Absent, ou vide
+            with self._lock:
+                self.misses += 1
+            return None
+        # Le fichier peut être évincé par un autre processus entre temps
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return mapped
+
+    def put(
+        self,
+        digest: bytes,
+        engine: str,
+        payload: bytes | Iterable[bytes],
+        size: int | None = None,
+    ) -> None:
+        """Store a triangulation atomically, then enforce the size bound.
+
+        Args:
+            digest (bytes): The digest of the PointSet bytes.
+            engine (str): The triangulation engine.
+            payload (bytes | Iterable[bytes]): The serialized Triangles, or
+                its chunks, written one after the other.
+            size (int | None): The length of the payload, required when it
+                is given as chunks.
+
+        """
+        if size is None:
+            size = len(payload)
+        if size > self.max_bytes:
+            return
+        if isinstance(payload, bytes):
+            payload = (payload,)
+        path = self._path(digest, engine)
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.writelines(payload)
+            with self._lock:
+                # Un fichier remplacé ne compte plus dans le total
+                with contextlib.suppress(FileNotFoundError):
+                    self.size -= os.stat(path).st_size
+                os.replace(temporary, path)
+                self.size += size
+                if self.size > self.max_bytes:
+                    self._evict()
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temporary)
+            raise
+
+    def _scan(self) -> list[tuple[float, int, str]]:
+        """Return the modification time, size and path of every payload."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX):
+                with contextlib.suppress(FileNotFoundError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove the least recently used payloads down to the target (lock held)."""
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * self.EVICTION_TARGET
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+        self.size = total
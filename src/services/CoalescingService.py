@@ -0,0 +1,128 @@
+"""Service for coalescing concurrent identical requests.
+
+This module provides a single-flight group: while a computation for a key
+is running, every other caller asking for the same key waits for it and
+receives its result instead of starting the same computation again.
+It is available for threads and for the coroutines of an event loop.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from functools import partial
+from typing import Any
+
+
+class SingleFlight:
+    """Represents a group of computations deduplicated by key.
+
+    Attributes:
+        calls (int): The number of computations started.
+        shared (int): The number of callers that waited for another one.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize a SingleFlight without computation in flight."""
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run a computation once for all the concurrent callers of a key.
+
+        Args:
+            key (Hashable): The key identifying the computation.
+            function (Callable[[], Any]): The computation.
+
+        Returns:
+            Any: The result of the computation, the same object for every
+                caller of the key.
+
+        Raises:
+            Exception: The exception raised by the computation, re-raised
+                in every caller.
+
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = Future()
+                self.calls += 1
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # La clé est libérée dès la fin du calcul : les appels suivants
+            # passent par les caches
+            with self._lock:
+                del self._in_flight[key]
+
+
+class AsyncSingleFlight:
+    """Represents a group of coroutines deduplicated by key.
+
+    The group must be used from a single event loop. The computation runs
+    in its own task, owned by none of the callers: cancelling any caller,
+    the first one included, leaves it running for the others.
+
+    Attributes:
+        calls (int): The number of computations started.
+        shared (int): The number of callers that waited for another one.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an AsyncSingleFlight without computation in flight."""
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """Await a computation once for all the concurrent callers of a key.
+
+        Args:
+            key (Hashable): The key identifying the computation.
+            function (Callable[[], Awaitable[Any]]): The coroutine function
+                of the computation.
+
+        Returns:
+            Any: The result of the computation, the same object for every
+                caller of the key.
+
+        Raises:
+            Exception: The exception raised by the computation, re-raised
+                in every caller.
+
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._in_flight[key] = asyncio.ensure_future(function())
+            task.add_done_callback(partial(self._finish, key))
+            self.calls += 1
+        # L'annulation d'un appelant n'annule pas le calcul partagé
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Release the key of a finished computation."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # Marque l'erreur comme lue s'il n'y a plus d'attente
@@ -0,0 +1,274 @@
+"""Service for the divide-and-conquer Delaunay triangulation.
+
+This module provides the Guibas-Stolfi algorithm: the points are sorted by
+x, each half is triangulated recursively and the two halves are merged by
+zipping them together from their lower common tangent. Its running time is
+O(n log n) whatever the distribution of the points.
+
+The triangulation is stored in a quad-edge structure made of integer edge
+identifiers: the quad-edge ``q`` owns the edges ``4 * q`` to ``4 * q + 3``
+(the edge, its dual, its symmetric and the symmetric of its dual). The
+rotation of an edge is the next edge of its quad-edge and its symmetric is
+``e ^ 2``.
+"""
+
+from services.GeometryService import incircle, orient2d
+
+DELETED = -1
+
+
+class QuadEdges:
+    """Represents a planar subdivision as a set of quad-edges.
+
+    Attributes:
+        xs (list[float]): The x-coordinates of the vertices.
+        ys (list[float]): The y-coordinates of the vertices.
+        onext (list[int]): The next edge counter-clockwise around the origin
+            of each edge.
+        origin (list[int]): The origin vertex of each primal edge
+            (``DELETED`` once the quad-edge is deleted).
+
+    """
+
+    def __init__(self, xs: list[float], ys: list[float]) -> None:
+        """Initialize an empty subdivision.
+
+        Args:
+            xs (list[float]): The x-coordinates of the vertices.
+            ys (list[float]): The y-coordinates of the vertices.
+
+        """
+        self.xs = xs
+        self.ys = ys
+        self.onext: list[int] = []
+        self.origin: list[int] = []
+
+    def make_edge(self, a: int, b: int) -> int:
+        """Create an isolated edge from vertex a to vertex b.
+
+        Returns:
+            int: The new edge.
+
+        """
+        e = len(self.onext)
+        # L'arête et sa symétrique forment chacune une boucle autour de leur
+        # origine, les deux arêtes duales se suivent
+        self.onext.extend((e, e + 3, e + 2, e + 1))
+        self.origin.extend((a, -1, b, -1))
+        return e
+
+    def splice(self, a: int, b: int) -> None:
+        """Join or split the edge rings around the origins of a and b."""
+        onext = self.onext
+        alpha = onext[a]
+        alpha = (alpha & ~3) | ((alpha + 1) & 3)  # Rotation vers l'arête duale
+        beta = onext[b]
+        beta = (beta & ~3) | ((beta + 1) & 3)
+        onext[a], onext[b] = onext[b], onext[a]
+        onext[alpha], onext[beta] = onext[beta], onext[alpha]
+
+    def connect(self, a: int, b: int) -> int:
+        """Add an edge from the destination of a to the origin of b.
+
+        The new edge shares the left face of both a and b.
+
+        Returns:
+            int: The new edge.
+
+        """
+        origin = self.origin
+        e = self.make_edge(origin[a ^ 2], origin[b])
+        self.splice(e, self.lnext(a))
+        self.splice(e ^ 2, b)
+        return e
+
+    def delete_edge(self, e: int) -> None:
+        """Remove an edge from the subdivision."""
+        self.splice(e, self.oprev(e))
+        self.splice(e ^ 2, self.oprev(e ^ 2))
+        q = e & ~3
+        self.origin[q] = self.origin[q + 2] = DELETED
+
+    def lnext(self, e: int) -> int:
+        """Return the next edge counter-clockwise around the left face of e."""
+        e = self.onext[(e & ~3) | ((e + 3) & 3)]
+        return (e & ~3) | ((e + 1) & 3)
+
+    def oprev(self, e: int) -> int:
+        """Return the next edge clockwise around the origin of e."""
+        e = self.onext[(e & ~3) | ((e + 1) & 3)]
+        return (e & ~3) | ((e + 1) & 3)
+
+    def triangles(self) -> list[tuple[int, int, int]]:
+        """Return the vertex indices of every inner triangle.
+
+        Each face is visited once from one of its edges; the outer face,
+        which runs clockwise around the convex hull, is skipped.
+        """
+        onext, origin, xs, ys = self.onext, self.origin, self.xs, self.ys
+        visited = bytearray(len(onext))
+        triangles = []
+        for e in range(0, len(onext), 2):
+            if visited[e] or origin[e & ~3] == DELETED:
+                continue
+            e1 = self.lnext(e)
+            e2 = self.lnext(e1)
+            visited[e] = visited[e1] = visited[e2] = 1
+            if self.lnext(e2) != e:
+                continue  # Face extérieure non triangulaire
+            a, b, c = origin[e], origin[e1], origin[e2]
+            if orient2d(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) > 0:
+                triangles.append((a, b, c))
+        return triangles
+
+
+def triangulate(xs: list[float], ys: list[float]) -> list[tuple[int, int, int]]:
+    """Triangule des points avec l'algorithme diviser pour régner.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+
+    Returns:
+        list[tuple[int, int, int]]: The vertex indices of each triangle.
+
+    """
+    # Tri lexicographique : chaque moitié est séparée de l'autre par une
+    # droite verticale (ou presque, en cas d'abscisses égales)
+    order = sorted(range(len(xs)), key=lambda i: (xs[i], ys[i]))
+    edges = QuadEdges(xs, ys)
+    delaunay(edges, order, 0, len(order))
+    return edges.triangles()
+
+
+def delaunay(edges: QuadEdges, order: list[int], lo: int, hi: int) -> tuple[int, int]:
+    """Triangule récursivement les points order[lo:hi].
+
+    Args:
+        edges (QuadEdges): The subdivision being built.
+        order (list[int]): The vertex indices sorted by x then y.
+        lo (int): The first position of the range.
+        hi (int): The position after the last one.
+
+    Returns:
+        tuple[int, int]: The counter-clockwise convex hull edge leaving the
+            leftmost vertex and the clockwise one leaving the rightmost
+            vertex.
+
+    """
+    xs, ys, origin = edges.xs, edges.ys, edges.origin
+
+    if hi - lo == 2:
+        a = edges.make_edge(order[lo], order[lo + 1])
+        return a, a ^ 2
+
+    if hi - lo == 3:
+        s1, s2, s3 = order[lo], order[lo + 1], order[lo + 2]
+        a = edges.make_edge(s1, s2)
+        b = edges.make_edge(s2, s3)
+        edges.splice(a ^ 2, b)
+        orientation = orient2d(xs[s1], ys[s1], xs[s2], ys[s2], xs[s3], ys[s3])
+        if orientation > 0:
+            edges.connect(b, a)
+            return a, b ^ 2
+        if orientation < 0:
+            c = edges.connect(b, a)
+            return c ^ 2, c
+        return a, b ^ 2  # Trois points colinéaires : pas de triangle
+
+    middle = (lo + hi) // 2
+    ldo, ldi = delaunay(edges, order, lo, middle)
+    rdi, rdo = delaunay(edges, order, middle, hi)
+
+    # Recherche de la tangente commune inférieure aux deux enveloppes
+    while True:
+        a, b = origin[ldi], origin[ldi ^ 2]
+        r = origin[rdi]
+        if orient2d(xs[r], ys[r], xs[a], ys[a], xs[b], ys[b]) > 0:
+            ldi = edges.lnext(ldi)
+            continue
+        a, b = origin[rdi], origin[rdi ^ 2]
+        left = origin[ldi]
+        if orient2d(xs[left], ys[left], xs[b], ys[b], xs[a], ys[a]) > 0:
+            rdi = edges.onext[rdi ^ 2]  # rprev
+            continue
+        break
+
+    base = edges.connect(rdi ^ 2, ldi)
+    if origin[ldi] == origin[ldo]:
+        ldo = base ^ 2
+    if origin[rdi] == origin[rdo]:
+        rdo = base
+
+    # Fusion : on remonte de la tangente inférieure à la tangente supérieure
+    # en choisissant à chaque étape le candidat gauche ou droit
+    onext = edges.onext
+    while True:
+        b_org, b_dest = origin[base], origin[base ^ 2]
+        bx, by = xs[b_org], ys[b_org]
+        dx, dy = xs[b_dest], ys[b_dest]
+
+        left = onext[base ^ 2]
+        left_valid = _above(edges, left, dx, dy, bx, by)
+        if left_valid:
+            # On supprime les arêtes gauches dont le cercle contient le
+            # candidat suivant ; le tour s'arrête en revenant sur la base
+            while True:
+                after = onext[left]
+                c, d = origin[left ^ 2], origin[after ^ 2]
+                if d == b_org or (
+                    incircle(dx, dy, bx, by, xs[c], ys[c], xs[d], ys[d]) <= 0
+                ):
+                    break
+                edges.delete_edge(left)
+                left = after
+
+        right = edges.oprev(base)
+        right_valid = _above(edges, right, dx, dy, bx, by)
+        if right_valid:
+            while True:
+                after = edges.oprev(right)
+                c, d = origin[right ^ 2], origin[after ^ 2]
+                if d == b_dest or (
+                    incircle(dx, dy, bx, by, xs[c], ys[c], xs[d], ys[d]) <= 0
+                ):
+                    break
+                edges.delete_edge(right)
+                right = after
+
+        if not left_valid and not right_valid:
+            break  # La base est la tangente commune supérieure
+
+        if left_valid and right_valid:
+            l_org, l_dest = origin[left], origin[left ^ 2]
+            r_org, r_dest = origin[right], origin[right ^ 2]
+            use_right = (
+                incircle(
+                    xs[l_dest],
+                    ys[l_dest],
+                    xs[l_org],
+                    ys[l_org],
+                    xs[r_org],
+                    ys[r_org],
+                    xs[r_dest],
+                    ys[r_dest],
+                )
+                > 0
+            )
+        else:
+            use_right = right_valid
+
+        if use_right:
+            base = edges.connect(right, base ^ 2)
+        else:
+            base = edges.connect(base ^ 2, left ^ 2)
+
+    return ldo, rdo
+
+
+def _above(
+    edges: QuadEdges, e: int, dx: float, dy: float, bx: float, by: float
+) -> bool:
+    """Vérifie si la destination de e est strictement au-dessus de la base."""
+    v = edges.origin[e ^ 2]
+    return orient2d(edges.xs[v], edges.ys[v], dx, dy, bx, by) > 0
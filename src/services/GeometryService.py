@@ -0,0 +1,131 @@
+"""Service for robust geometric predicates.
+
+This module provides the orientation and incircle predicates used by the
+triangulation. Each predicate first evaluates the determinant with floats
+and checks it against Shewchuk's error bound; only when the sign cannot
+be trusted is the determinant evaluated again with exact rational
+arithmetic.
+"""
+
+from fractions import Fraction
+
+EPSILON = 2.0**-53
+CCW_ERROR_BOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+INCIRCLE_ERROR_BOUND = (10.0 + 96.0 * EPSILON) * EPSILON
+
+
+def orient2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Return a value whose sign gives the orientation of the triangle (a, b, c).
+
+    Positive when the points turn counter-clockwise, negative when they turn
+    clockwise and zero when they are collinear. The sign is always exact.
+    """
+    det_left = (ax - cx) * (by - cy)
+    det_right = (ay - cy) * (bx - cx)
+    det = det_left - det_right
+
+    # Filtre rapide : si les deux termes sont de signes opposés, pas d'annulation
+    if det_left > 0:
+        if det_right <= 0:
+            return det
+        det_sum = det_left + det_right
+    elif det_left < 0:
+        if det_right >= 0:
+            return det
+        det_sum = -det_left - det_right
+    else:
+        return det
+
+    error_bound = CCW_ERROR_BOUND * det_sum
+    if det >= error_bound or -det >= error_bound:
+        return det
+    return orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def orient2d_exact(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> float:
+    """Evaluate the orientation determinant with exact arithmetic."""
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    return _to_float((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def incircle(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    dx: float,
+    dy: float,
+) -> float:
+    """Return a value whose sign tells if d lies inside the circle through a, b, c.
+
+    For a counter-clockwise triangle (a, b, c) the value is positive when d
+    is inside the circumcircle, negative when it is outside and zero when
+    the four points are cocircular. The sign is reversed for a clockwise
+    triangle. The sign is always exact.
+    """
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    alift = adx * adx + ady * ady
+
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    blift = bdx * bdx + bdy * bdy
+
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    clift = cdx * cdx + cdy * cdy
+
+    det = (
+        alift * (bdxcdy - cdxbdy)
+        + blift * (cdxady - adxcdy)
+        + clift * (adxbdy - bdxady)
+    )
+    permanent = (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift
+        + (abs(cdxady) + abs(adxcdy)) * blift
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    )
+    error_bound = INCIRCLE_ERROR_BOUND * permanent
+    if det > error_bound or -det > error_bound:
+        return det
+    return incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def incircle_exact(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    dx: float,
+    dy: float,
+) -> float:
+    """Evaluate the incircle determinant with exact arithmetic."""
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (ax, ay, bx, by, cx, cy, dx, dy))
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    return _to_float(
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+
+
+def _to_float(value: Fraction) -> float:
+    """Convert an exact determinant to a float that keeps its sign."""
+    if value == 0:
+        return 0.0
+    result = float(value)
+    if result == 0.0:  # Valeur trop petite pour un float : on garde le signe
+        return 5e-324 if value > 0 else -5e-324
+    return result
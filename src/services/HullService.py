@@ -0,0 +1,153 @@
+"""Service for convex hulls.
+
+This module computes convex hulls with Andrew's monotone chain: the points
+are sorted once by x then y, and the lower and upper chains are built in a
+single pass each, in O(n log n).
+"""
+
+import operator
+
+from services.GeometryService import orient2d
+
+
+def hull_vertices(
+    xs: list[float], ys: list[float], order: list[int], collinear: bool = True
+) -> list[int]:
+    """Return the points on the convex hull boundary, counter-clockwise.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        order (list[int]): The point indices sorted by x then y.
+        collinear (bool): Whether the points lying on the sides of the
+            hull are kept, or only its corners.
+
+    Returns:
+        list[int]: The indices of the hull points (monotone chain).
+
+    """
+
+    def chain(indices: list[int]) -> list[int]:
+        hull: list[int] = []
+        for i in indices:
+            while len(hull) >= 2:
+                turn = orient2d(
+                    xs[hull[-2]], ys[hull[-2]], xs[hull[-1]], ys[hull[-1]], xs[i], ys[i]
+                )
+                # Un virage à droite est toujours retiré, un alignement
+                # seulement pour ne garder que les sommets de l'enveloppe
+                if turn > 0 or (collinear and turn == 0):
+                    break
+                hull.pop()
+            hull.append(i)
+        return hull
+
+    lower = chain(order)
+    upper = chain(order[::-1])
+    return lower[:-1] + upper[:-1]
+
+
+def convex_hull(xs: list[float], ys: list[float]) -> list[int]:
+    """Return the corners of the convex hull of points.
+
+    The points strictly inside the octagon of the extreme points cannot be
+    on the hull: they are discarded in one pass before sorting
+    (Akl-Toussaint heuristic), which leaves only a few percent of the
+    points for the monotone chain in the usual cases.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+
+    Returns:
+        list[int]: The indices of the hull corners, counter-clockwise from
+            the lowest point of smallest x. Collinear points are left out,
+            as are duplicated ones except their first occurrence: a single
+            point remains if all the points coincide.
+
+    """
+    if not xs:
+        return []
+    candidates = outside_octagon(xs, ys)
+
+    # Tri par (x, y), stable : un point dupliqué garde sa première occurrence
+    keys = {i: (xs[i], ys[i]) for i in candidates}
+    order = sorted(candidates, key=keys.__getitem__)
+    order = [i for k, i in enumerate(order) if k == 0 or keys[i] != keys[order[k - 1]]]
+    if len(order) < 2:
+        return order
+    return hull_vertices(xs, ys, order, collinear=False)
+
+
+def outside_octagon(xs: list[float], ys: list[float]) -> list[int]:
+    """Return the points that are not safely inside the extreme octagon.
+
+    The octagon joins the extreme points in the directions of the axes and
+    of the diagonals. The test uses plain floating-point arithmetic with a
+    relative margin, so a point is only discarded when it is inside for
+    certain.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+
+    Returns:
+        list[int]: The indices of the points kept, in increasing order.
+
+    """
+    indices = range(len(xs))
+    sums = list(map(operator.add, xs, ys))
+    differences = list(map(operator.sub, xs, ys))
+    # Points extrêmes dans le sens trigonométrique, en partant du bas
+    extremes = [
+        ys.index(min(ys)),
+        differences.index(max(differences)),
+        xs.index(max(xs)),
+        sums.index(max(sums)),
+        ys.index(max(ys)),
+        differences.index(min(differences)),
+        xs.index(min(xs)),
+        sums.index(min(sums)),
+    ]
+    corners = [
+        i
+        for k, i in enumerate(extremes)
+        if (xs[i], ys[i]) != (xs[extremes[k - 1]], ys[extremes[k - 1]])
+    ]
+    if len(corners) < 3:
+        return list(indices)  # Octogone dégénéré : aucun point écarté
+    scale = max(max(map(abs, xs)), max(map(abs, ys)))
+
+    # Demi-plan intérieur de chaque côté (a, b) : nx * x + ny * y > c + marge
+    sides = []
+    for a, b in zip(corners, corners[1:] + corners[:1], strict=True):
+        nx, ny = ys[a] - ys[b], xs[b] - xs[a]
+        c = nx * xs[a] + ny * ys[a]
+        margin = 1e-12 * ((abs(nx) + abs(ny)) * scale + abs(c))
+        sides.append((nx, ny, c + margin))
+    sides = (sides * 3)[:8]  # Côtés répétés : toujours huit tests
+
+    (
+        (ax, ay, ac),
+        (bx, by, bc),
+        (cx, cy, cc),
+        (dx, dy, dc),
+        (ex, ey, ec),
+        (fx, fy, fc),
+        (gx, gy, gc),
+        (hx, hy, hc),
+    ) = sides
+    return [
+        i
+        for i, x, y in zip(indices, xs, ys, strict=True)
+        if not (
+            ax * x + ay * y > ac
+            and bx * x + by * y > bc
+            and cx * x + cy * y > cc
+            and dx * x + dy * y > dc
+            and ex * x + ey * y > ec
+            and fx * x + fy * y > fc
+            and gx * x + gy * y > gc
+            and hx * x + hy * y > hc
+        )
+    ]
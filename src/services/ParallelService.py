@@ -0,0 +1,320 @@
+"""Service for the parallel Delaunay triangulation.
+
+This module splits a point set into tiles, triangulates each tile in a
+separate process and merges the results. The coordinates are shared with
+the workers through shared memory instead of being pickled.
+
+A triangle of a tile is kept when its circumcircle lies strictly inside the
+open rectangle that contains no point of the other tiles: such a circle is
+empty of every point, so the triangle belongs to the global triangulation.
+The vertices of the other triangles and the hull vertices of each tile are
+triangulated again as a whole, and the triangles of that triangulation
+whose circumcircle is empty of every point complete the result.
+
+Only the tiles run in parallel: the border vertices of every tile are
+merged serially in the parent process, so the speedup is bounded by that
+merge and grows less than the number of workers.
+
+The workers are started by a fork server rather than forked from the
+caller, which may be a threaded server holding locks at that time.
+"""
+
+import math
+import multiprocessing
+from array import array
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from classes.triangles import circumcircle
+from services.GeometryService import incircle, orient2d
+from services.HullService import hull_vertices
+
+MIN_POINTS_PER_TILE = 1000
+SAFETY_MARGIN = 1e-9
+
+Engine = Callable[[list[float], list[float]], list[tuple[int, int, int]]]
+
+
+def triangulate(
+    xs: list[float], ys: list[float], engine: Engine, workers: int
+) -> list[tuple[int, int, int]]:
+    """Triangule des points en parallèle par tuiles.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        engine (Engine): The serial triangulation function used by each
+            worker and for the merge (must be picklable).
+        workers (int): The number of worker processes. The gain is limited
+            by the serial merge of the tile borders.
+
+    Returns:
+        list[tuple[int, int, int]]: The vertex indices of each triangle.
+
+    """
+    count = len(xs)
+    parts = min(workers, count // MIN_POINTS_PER_TILE)
+    if parts < 2:
+        return engine(xs, ys)
+
+    order = sorted(range(count), key=lambda i: (xs[i], ys[i]))
+    tiles = split_tiles(xs, ys, order, parts)
+
+    # Mémoire partagée : les xs, les ys puis les indices des points rangés
+    # tuile par tuile
+    shm = SharedMemory(create=True, size=20 * count)
+    try:
+        shm.buf[: 16 * count] = array("d", xs + ys).tobytes()
+        tile_order = array("I")
+        ranges = []
+        for tile, bounds in tiles:
+            ranges.append((len(tile_order), len(tile_order) + len(tile), bounds))
+            tile_order.extend(tile)
+        shm.buf[16 * count :] = tile_order.tobytes()
+
+        with ProcessPoolExecutor(
+            max_workers=parts, mp_context=multiprocessing.get_context("forkserver")
+        ) as executor:
+            results = list(
+                executor.map(
+                    triangulate_tile,
+                    *zip(
+                        *(
+                            (shm.name, count, start, stop, bounds, engine)
+                            for start, stop, bounds in ranges
+                        ),
+                        strict=True,
+                    ),
+                )
+            )
+    finally:
+        shm.close()
+        shm.unlink()
+
+    kept = set()
+    border = set()
+    for tile_kept, tile_border in results:
+        kept.update(zip(*[iter(tile_kept)] * 3, strict=True))
+        border.update(tile_border)
+
+    border = sorted(border, key=lambda i: (xs[i], ys[i]))
+    triangles = kept | merge_border(xs, ys, border, kept, engine)
+
+    # Contrôle d'Euler : une triangulation de n points dont h sont sur
+    # l'enveloppe convexe a 2n - 2 - h triangles. Avec des points
+    # cocirculaires la fusion peut laisser un trou : on refait tout en série.
+    # Les points de l'enveloppe sont sur l'enveloppe de leur tuile, donc
+    # dans la bordure
+    if len(triangles) != 2 * count - 2 - len(hull_vertices(xs, ys, border)):
+        return engine(xs, ys)
+    return list(triangles)
+
+
+def split_tiles(
+    xs: list[float], ys: list[float], order: list[int], parts: int
+) -> list[tuple[list[int], tuple[float, float, float, float]]]:
+    """Split the points in a grid of tiles with the same number of points.
+
+    The points are split in columns by x, then each column in rows by y.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        order (list[int]): The point indices sorted by x then y.
+        parts (int): The number of tiles.
+
+    Returns:
+        list[tuple[list[int], tuple[float, float, float, float]]]: The point
+            indices of each tile and the bounds (left, bottom, right, top) of
+            the open rectangle that holds no point of the other tiles.
+
+    """
+    columns = math.ceil(math.sqrt(parts))
+    rows = math.ceil(parts / columns)
+    column_size = math.ceil(len(order) / columns)
+    column_points = [
+        order[i : i + column_size] for i in range(0, len(order), column_size)
+    ]
+
+    tiles = []
+    for c, column in enumerate(column_points):
+        left = xs[column_points[c - 1][-1]] if c > 0 else -math.inf
+        right = xs[column_points[c + 1][0]] if c + 1 < len(column_points) else math.inf
+        column = sorted(column, key=lambda i: (ys[i], xs[i]))
+        row_size = math.ceil(len(column) / rows)
+        row_points = [column[i : i + row_size] for i in range(0, len(column), row_size)]
+        for r, tile in enumerate(row_points):
+            bottom = max(ys[i] for i in row_points[r - 1]) if r > 0 else -math.inf
+            top = (
+                min(ys[i] for i in row_points[r + 1])
+                if r + 1 < len(row_points)
+                else math.inf
+            )
+            tiles.append((tile, (left, bottom, right, top)))
+    return tiles
+
+
+def triangulate_tile(
+    name: str,
+    count: int,
+    start: int,
+    stop: int,
+    bounds: tuple[float, float, float, float],
+    engine: Engine,
+) -> tuple[array, array]:
+    """Triangule une tuile dans un processus worker.
+
+    Args:
+        name (str): The name of the shared memory block.
+        count (int): The total number of points.
+        start (int): The position of the first point of the tile.
+        stop (int): The position after the last point of the tile.
+        bounds (tuple[float, float, float, float]): The open rectangle that
+            holds no point of the other tiles.
+        engine (Engine): The serial triangulation function.
+
+    Returns:
+        tuple[array, array]: The sorted global indices of the kept triangles
+            and the global indices of the border vertices.
+
+    """
+    shm = SharedMemory(name=name)
+    try:
+        with shm.buf[16 * count : 20 * count].cast("I") as indices:
+            tile = indices[start:stop].tolist()
+        with shm.buf[: 16 * count].cast("d") as coords:
+            xs = [coords[i] for i in tile]
+            ys = [coords[count + i] for i in tile]
+    finally:
+        shm.close()
+
+    if len(tile) < 3 or all(
+        orient2d(xs[0], ys[0], xs[1], ys[1], x, y) == 0
+        for x, y in zip(xs, ys, strict=True)
+    ):
+        return array("I"), array("I", tile)  # Tuile dégénérée : tout en bordure
+
+    left, bottom, right, top = bounds
+    kept = array("I")
+    border = {
+        tile[i]
+        for i in hull_vertices(
+            xs, ys, sorted(range(len(tile)), key=lambda i: (xs[i], ys[i]))
+        )
+    }
+    for a, b, c in engine(xs, ys):
+        ux, uy, r2 = circumcircle(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c])
+        r = math.sqrt(r2)
+        r += SAFETY_MARGIN * (abs(ux) + abs(uy) + r)
+        if left < ux - r and ux + r < right and bottom < uy - r and uy + r < top:
+            kept.extend(sorted((tile[a], tile[b], tile[c])))
+        else:
+            border.update((tile[a], tile[b], tile[c]))
+    return kept, array("I", border)
+
+
+def merge_border(
+    xs: list[float],
+    ys: list[float],
+    border: list[int],
+    kept: set[tuple[int, int, int]],
+    engine: Engine,
+) -> set[tuple[int, int, int]]:
+    """Triangulate the border vertices and keep the missing Delaunay triangles.
+
+    Args:
+        xs (list[float]): The x-coordinates of all the points.
+        ys (list[float]): The y-coordinates of all the points.
+        border (list[int]): The indices of the border vertices.
+        kept (set[tuple[int, int, int]]): The triangles kept by the tiles.
+        engine (Engine): The serial triangulation function.
+
+    Returns:
+        set[tuple[int, int, int]]: The sorted vertex indices of the new
+            triangles whose circumcircle holds no point.
+
+    """
+    grid = PointGrid(xs, ys)
+    triangles = set()
+    for a, b, c in engine([xs[i] for i in border], [ys[i] for i in border]):
+        triangle = tuple(sorted((border[a], border[b], border[c])))
+        if triangle not in kept and grid.is_empty_circle(*triangle):
+            triangles.add(triangle)
+    return triangles
+
+
+class PointGrid:
+    """Represents a uniform grid of buckets used to find points in a circle.
+
+    Attributes:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        columns (int): The number of cells on each side of the grid.
+        cells (list[list[int]]): The indices of the points of each cell.
+
+    """
+
+    def __init__(self, xs: list[float], ys: list[float]) -> None:
+        """Initialize a PointGrid with about 2 points per cell.
+
+        Args:
+            xs (list[float]): The x-coordinates of the points.
+            ys (list[float]): The y-coordinates of the points.
+
+        """
+        self.xs = xs
+        self.ys = ys
+        self.min_x, self.min_y = min(xs), min(ys)
+        extent = max(max(xs) - self.min_x, max(ys) - self.min_y) or 1.0
+        self.columns = max(1, math.isqrt(len(xs) // 2))
+        self.scale = self.columns / extent
+        self.cells: list[list[int]] = [[] for _ in range(self.columns**2)]
+        for i, (x, y) in enumerate(zip(xs, ys, strict=True)):
+            column, row = self._cell(x, y)
+            self.cells[row * self.columns + column].append(i)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        """Return the cell coordinates of a point, clamped to the grid."""
+        last = self.columns - 1
+        column = min(max(int((x - self.min_x) * self.scale), 0), last)
+        row = min(max(int((y - self.min_y) * self.scale), 0), last)
+        return column, row
+
+    def is_empty_circle(self, a: int, b: int, c: int) -> bool:
+        """Check that no other point lies inside or on the circumcircle of a triangle.
+
+        Args:
+            a (int): The index of the first vertex.
+            b (int): The index of the second vertex.
+            c (int): The index of the third vertex.
+
+        Returns:
+            bool: True if the circumcircle holds no other point.
+
+        """
+        xs, ys = self.xs, self.ys
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+        if orient2d(ax, ay, bx, by, cx, cy) < 0:
+            bx, by, cx, cy = cx, cy, bx, by  # incircle attend un triangle direct
+        ux, uy, r2 = circumcircle(ax, ay, bx, by, cx, cy)
+        r = math.sqrt(r2)
+        r += SAFETY_MARGIN * (abs(ux) + abs(uy) + r)
+        min_column, min_row = self._cell(ux - r, uy - r)
+        max_column, max_row = self._cell(ux + r, uy + r)
+
+        # Les points cocirculaires comptent comme intérieurs : le triangle
+        # n'est alors pas retenu et le contrôle d'Euler s'en aperçoit
+        for row in range(min_row, max_row + 1):
+            for cell in self.cells[
+                row * self.columns + min_column : row * self.columns + max_column + 1
+            ]:
+                for i in cell:
+                    if (
+                        i != a
+                        and i != b
+                        and i != c
+                        and incircle(ax, ay, bx, by, cx, cy, xs[i], ys[i]) >= 0
+                    ):
+                        return False
+        return True
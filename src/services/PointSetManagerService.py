@@ -0,0 +1,628 @@
+"""Service for fetching PointSets from the PointSet Manager.
+
+This module provides an HTTP client that keeps a pool of persistent
+(keep-alive) connections to the PointSet Manager, bounds the time spent
+connecting and reading, retries transient failures with an exponential
+backoff and stops calling the manager for a while once it looks down
+(circuit breaker). A PointSet can be decoded while it is received, so that
+the body is never held in memory next to the decoded coordinates.
+
+An asyncio variant of the client serves the asynchronous API with the same
+pooling, timeouts, retries and circuit breaker.
+"""
+
+import asyncio
+import contextlib
+import http.client
+import queue
+import threading
+import time
+import urllib.parse
+from collections.abc import Awaitable, Callable
+from typing import BinaryIO, TypeVar
+
+from classes.pointset import PointSet, PointSetDecoder
+from services.CacheService import TriangulationCache
+
+# Réponses du manager qui méritent une nouvelle tentative
+RETRY_STATUSES = (502, 503, 504)
+
+# Taille des lectures d'un pointset décodé à la volée
+READ_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+class PointSetNotFoundError(Exception):
+    """Raised when the PointSet Manager does not know a PointSet."""
+
+
+class ManagerResponseError(Exception):
+    """Raised when the PointSet Manager answers with an unexpected status."""
+
+    def __init__(self, status: int) -> None:
+        """Initialize a ManagerResponseError.
+
+        Args:
+            status (int): The HTTP status of the response.
+
+        """
+        super().__init__(f"PointSet Manager answered with status {status}")
+        self.status = status
+
+
+class ManagerUnavailableError(Exception):
+    """Raised when the PointSet Manager cannot be reached."""
+
+
+class CircuitOpenError(ManagerUnavailableError):
+    """Raised without calling the PointSet Manager while it is considered down."""
+
+
+class CircuitBreaker:
+    """Represents the circuit breaker of a PointSet Manager client.
+
+    The circuit opens after a number of failed fetches in a row and rejects
+    requests for a while; once the reset timeout has elapsed, a single
+    trial request is let through (half-open circuit) and its outcome closes
+    or reopens it. All methods are thread-safe and never block.
+
+    Attributes:
+        failure_threshold (int): The number of failed fetches in a row
+            that opens the circuit.
+        reset_timeout (float): The time in seconds during which an open
+            circuit rejects requests before letting one through.
+        failures (int): The number of failed fetches in a row.
+
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed CircuitBreaker.
+
+        Args:
+            failure_threshold (int): The number of failed fetches in a row
+                that opens the circuit.
+            reset_timeout (float): The time in seconds an open circuit
+                rejects requests.
+            clock (Callable[[], float]): The time source, in seconds.
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    def before_request(self) -> bool:
+        """Reject the request while the circuit is open.
+
+        Returns:
+            bool: True if the request is the trial of a half-open circuit,
+                which must end with record_success, record_failure or
+                abandon_trial.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                trial request still running.
+
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._trial or self._clock() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError("PointSet Manager is unavailable")
+            self._trial = True
+            return True
+
+    def abandon_trial(self) -> None:
+        """Let another request try after a trial interrupted without outcome."""
+        with self._lock:
+            self._trial = False
+
+    def record_success(self) -> None:
+        """Close the circuit after an answer of the manager."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        """Count a failed fetch and open the circuit over the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial = False
+
+
+class PointSetManagerClient:
+    """Represents a pooled HTTP client of the PointSet Manager.
+
+    Attributes:
+        base_url (str): The URL of the PointSet Manager.
+        connect_timeout (float): The connection timeout in seconds.
+        read_timeout (float): The timeout of each socket read in seconds.
+        retries (int): The number of retries after a failed attempt.
+        backoff (float): The delay before the first retry in seconds,
+            doubled at each retry.
+        breaker (CircuitBreaker): The circuit breaker of the client.
+
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 8,
+        connect_timeout: float = 2.0,
+        read_timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.1,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize a PointSetManagerClient.
+
+        Args:
+            base_url (str): The URL of the PointSet Manager
+                (e.g. 'http://localhost:5000').
+            pool_size (int): The maximum number of idle connections kept.
+            connect_timeout (float): The connection timeout in seconds.
+            read_timeout (float): The timeout of each socket read in seconds.
+            retries (int): The number of retries after a failed attempt.
+            backoff (float): The delay before the first retry in seconds.
+            failure_threshold (int): The number of failed fetches in a row
+                that opens the circuit.
+            reset_timeout (float): The time in seconds an open circuit
+                rejects requests.
+            clock (Callable[[], float]): The time source, in seconds.
+            sleep (Callable[[float], None]): The function used to wait.
+
+        Raises:
+            ValueError: If the URL is not an http or https URL.
+
+        """
+        url = urllib.parse.urlsplit(base_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"Invalid PointSet Manager URL: {base_url}")
+        self.base_url = base_url
+        self._connection_class = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._host = url.hostname
+        self._port = url.port
+        self._base_path = url.path.rstrip("/")
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(
+            maxsize=pool_size
+        )
+
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, clock)
+        self._sleep = sleep
+
+    def fetch_pointset(self, pointset_id: str) -> bytes:
+        """Fetch the serialized PointSet with the given ID.
+
+        Args:
+            pointset_id (str): The ID of the PointSet.
+
+        Returns:
+            bytes: The byte representation of the PointSet.
+
+        Raises:
+            PointSetNotFoundError: If the manager answers 404.
+            ManagerResponseError: If the manager answers another status.
+            CircuitOpenError: If the manager is considered down.
+            ManagerUnavailableError: If every attempt failed.
+
+        """
+        return self._fetch(pointset_id, http.client.HTTPResponse.read)
+
+    def fetch_decoded_pointset(self, pointset_id: str) -> tuple[PointSet, bytes]:
+        """Fetch the PointSet with the given ID, decoding it while it is received.
+
+        Args:
+            pointset_id (str): The ID of the PointSet.
+
+        Returns:
+            tuple[PointSet, bytes]: The PointSet and the content digest of
+                its bytes (see TriangulationCache.digest).
+
+        Raises:
+            PointSetNotFoundError: If the manager answers 404.
+            ManagerResponseError: If the manager answers another status.
+            CircuitOpenError: If the manager is considered down.
+            ManagerUnavailableError: If every attempt failed.
+            ValueError: If the body does not match its point count.
+
+        """
+        return self._fetch(pointset_id, decode_response)
+
+    def _fetch(
+        self, pointset_id: str, read: Callable[[http.client.HTTPResponse], T]
+    ) -> T:
+        """Fetch a PointSet with retries, reading a 200 body with a function."""
+        trial = self.breaker.before_request()
+        try:
+            return self._fetch_with_retries(pointset_id, read)
+        except BaseException:
+            # Une erreur imprévue ne doit pas bloquer le circuit à moitié ouvert
+            if trial:
+                self.breaker.abandon_trial()
+            raise
+
+    def _fetch_with_retries(
+        self, pointset_id: str, read: Callable[[http.client.HTTPResponse], T]
+    ) -> T:
+        """Try to fetch a PointSet and record the outcome in the breaker."""
+        path = f"{self._base_path}/pointset/{pointset_id}"
+
+        last_error = ""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                status, body = self._get(path, read)
+            except (OSError, http.client.HTTPException) as error:
+                last_error = str(error) or type(error).__name__
+                continue
+            except ValueError:
+                # Le manager a répondu, mais un pointset invalide
+                self.breaker.record_success()
+                raise
+            if status in RETRY_STATUSES:
+                last_error = f"status {status}"
+                continue
+
+            # Le manager a répondu : il est disponible, même pour une erreur
+            self.breaker.record_success()
+            if status == 200:
+                return body
+            if status == 404:
+                raise PointSetNotFoundError(pointset_id)
+            raise ManagerResponseError(status)
+
+        self.breaker.record_failure()
+        raise ManagerUnavailableError(f"PointSet Manager unreachable: {last_error}")
+
+    def close(self) -> None:
+        """Close every idle connection of the pool."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _get(
+        self, path: str, read: Callable[[http.client.HTTPResponse], T]
+    ) -> tuple[int, T | bytes]:
+        """Send a GET request on a pooled connection.
+
+        The body of a 200 response is read with the given function, any
+        other body is read whole. A connection closed by the manager while
+        idle is replaced by a new one without counting as a failed attempt.
+        """
+        try:
+            connection, reused = self._idle.get_nowait(), True
+        except queue.Empty:
+            connection, reused = self._connect(), False
+
+        while True:
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                body = read(response) if response.status == 200 else response.read()
+                break
+            except (
+                http.client.RemoteDisconnected,
+                ConnectionResetError,
+                BrokenPipeError,
+            ):
+                connection.close()
+                if not reused:
+                    raise
+                connection, reused = self._connect(), False
+            except BaseException:
+                connection.close()
+                raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                self._idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+        return response.status, body
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Open a new connection with the connect then the read timeout."""
+        connection = self._connection_class(
+            self._host, self._port, timeout=self.connect_timeout
+        )
+        connection.connect()
+        connection.sock.settimeout(self.read_timeout)
+        return connection
+
+
+def decode_pointset(stream: BinaryIO, length: int | None) -> tuple[PointSet, bytes]:
+    """Decode and hash a PointSet body by chunks while it is received.
+
+    Args:
+        stream (BinaryIO): The body, read until its end.
+        length (int | None): The announced length of the body, or None if
+            it is unknown.
+
+    Returns:
+        tuple[PointSet, bytes]: The PointSet and the content digest of its
+            bytes.
+
+    Raises:
+        ValueError: If the body does not match its point count.
+
+    """
+    decoder = PointSetDecoder(length)
+    hasher = TriangulationCache.hasher()
+    while chunk := stream.read(READ_SIZE):
+        decoder.feed(chunk)
+        hasher.update(chunk)
+    return decoder.finish(), hasher.digest()
+
+
+def decode_response(response: http.client.HTTPResponse) -> tuple[PointSet, bytes]:
+    """Decode and hash the PointSet body of a response of the manager."""
+    return decode_pointset(response, response.length)  # None si le corps est découpé
+
+
+class AsyncPointSetManagerClient:
+    """Represents a pooled asyncio HTTP client of the PointSet Manager.
+
+    It speaks HTTP/1.1 over asyncio streams, so that waiting for the
+    manager never blocks the event loop. The client must be used from a
+    single event loop.
+
+    Attributes:
+        base_url (str): The URL of the PointSet Manager.
+        pool_size (int): The maximum number of idle connections kept.
+        connect_timeout (float): The connection timeout in seconds.
+        read_timeout (float): The timeout of each read in seconds.
+        retries (int): The number of retries after a failed attempt.
+        backoff (float): The delay before the first retry in seconds,
+            doubled at each retry.
+        breaker (CircuitBreaker): The circuit breaker of the client.
+
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 8,
+        connect_timeout: float = 2.0,
+        read_timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.1,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize an AsyncPointSetManagerClient.
+
+        Args:
+            base_url (str): The URL of the PointSet Manager
+                (e.g. 'http://localhost:5000').
+            pool_size (int): The maximum number of idle connections kept.
+            connect_timeout (float): The connection timeout in seconds.
+            read_timeout (float): The timeout of each read in seconds.
+            retries (int): The number of retries after a failed attempt.
+            backoff (float): The delay before the first retry in seconds.
+            failure_threshold (int): The number of failed fetches in a row
+                that opens the circuit.
+            reset_timeout (float): The time in seconds an open circuit
+                rejects requests.
+            clock (Callable[[], float]): The time source, in seconds.
+            sleep (Callable[[float], Awaitable[None]]): The coroutine
+                function used to wait.
+
+        Raises:
+            ValueError: If the URL is not an http or https URL.
+
+        """
+        url = urllib.parse.urlsplit(base_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"Invalid PointSet Manager URL: {base_url}")
+        self.base_url = base_url
+        self._ssl = url.scheme == "https"
+        self._host = url.hostname
+        self._port = url.port or (443 if self._ssl else 80)
+        self._netloc = url.netloc
+        self._base_path = url.path.rstrip("/")
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, clock)
+        self._sleep = sleep
+
+    async def fetch_pointset(self, pointset_id: str) -> bytes:
+        """Fetch the serialized PointSet with the given ID.
+
+        Args:
+            pointset_id (str): The ID of the PointSet.
+
+        Returns:
+            bytes: The byte representation of the PointSet.
+
+        Raises:
+            PointSetNotFoundError: If the manager answers 404.
+            ManagerResponseError: If the manager answers another status.
+            CircuitOpenError: If the manager is considered down.
+            ManagerUnavailableError: If every attempt failed.
+
+        """
+        trial = self.breaker.before_request()
+        try:
+            return await self._fetch_with_retries(pointset_id)
+        except BaseException:
+            # Une annulation pendant l'essai ne doit pas bloquer le circuit
+            if trial:
+                self.breaker.abandon_trial()
+            raise
+
+    async def _fetch_with_retries(self, pointset_id: str) -> bytes:
+        """Try to fetch a PointSet and record the outcome in the breaker."""
+        path = f"{self._base_path}/pointset/{pointset_id}"
+
+        last_error = ""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await self._sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                status, body = await self._get(path)
+            except (
+                OSError,
+                EOFError,
+                ValueError,  # Longueur ou taille de morceau illisible
+                asyncio.LimitOverrunError,
+                http.client.HTTPException,
+            ) as error:
+                last_error = str(error) or type(error).__name__
+                continue
+            if status in RETRY_STATUSES:
+                last_error = f"status {status}"
+                continue
+
+            # Le manager a répondu : il est disponible, même pour une erreur
+            self.breaker.record_success()
+            if status == 200:
+                return body
+            if status == 404:
+                raise PointSetNotFoundError(pointset_id)
+            raise ManagerResponseError(status)
+
+        self.breaker.record_failure()
+        raise ManagerUnavailableError(f"PointSet Manager unreachable: {last_error}")
+
+    async def close(self) -> None:
+        """Close every idle connection of the pool."""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    async def _get(self, path: str) -> tuple[int, bytes]:
+        """Send a GET request on a pooled connection.
+
+        A connection closed by the manager while idle is replaced by a new
+        one without counting as a failed attempt.
+        """
+        if self._idle:
+            (reader, writer), reused = self._idle.pop(), True
+        else:
+            (reader, writer), reused = await self._connect(), False
+
+        while True:
+            try:
+                status, body, will_close = await self._exchange(reader, writer, path)
+                break
+            except (
+                asyncio.IncompleteReadError,
+                ConnectionResetError,
+                BrokenPipeError,
+            ):
+                writer.close()
+                if not reused:
+                    raise
+                (reader, writer), reused = await self._connect(), False
+            except BaseException:
+                writer.close()
+                raise
+
+        if will_close or len(self._idle) >= self.pool_size:
+            writer.close()
+        else:
+            self._idle.append((reader, writer))
+        return status, body
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open a new connection within the connect timeout."""
+        return await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port, ssl=self._ssl or None),
+            self.connect_timeout,
+        )
+
+    async def _exchange(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str
+    ) -> tuple[int, bytes, bool]:
+        """Send a request and read its response.
+
+        Returns:
+            tuple[int, bytes, bool]: The status, the body and whether the
+                manager closes the connection after the response.
+
+        """
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {self._netloc}\r\n\r\n".encode("latin-1")
+        )
+        await writer.drain()
+
+        # Ligne de statut puis en-têtes, jusqu'à la ligne vide
+        head = await self._read(reader.readuntil(b"\r\n\r\n"))
+        status_line, *lines = head.decode("latin-1").split("\r\n")
+        version, _, rest = status_line.partition(" ")
+        status = rest[:3]
+        if not version.startswith("HTTP/1.") or not status.isdigit():
+            raise http.client.BadStatusLine(status_line)
+        headers = {}
+        for line in lines:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip().lower()
+
+        connection = headers.get("connection", "")
+        will_close = connection == "close" or (
+            version == "HTTP/1.0" and connection != "keep-alive"
+        )
+        if headers.get("transfer-encoding") == "chunked":
+            body = await self._read_chunks(reader)
+        elif "content-length" in headers:
+            body = await self._read(reader.readexactly(int(headers["content-length"])))
+        else:  # Corps délimité par la fermeture de la connexion
+            body = await self._read(reader.read())
+            will_close = True
+        return int(status), body, will_close
+
+    async def _read_chunks(self, reader: asyncio.StreamReader) -> bytes:
+        """Read a chunked body, ignoring chunk extensions and trailers."""
+        chunks = []
+        while True:
+            size_line = await self._read(reader.readuntil(b"\r\n"))
+            size = int(size_line.split(b";")[0], 16)
+            if size == 0:
+                break
+            chunk = await self._read(reader.readexactly(size + 2))
+            chunks.append(chunk[:-2])
+        while await self._read(reader.readuntil(b"\r\n")) != b"\r\n":
+            pass
+        return b"".join(chunks)
+
+    async def _read(self, read: Awaitable[bytes]) -> bytes:
+        """Wait for a read of the connection within the read timeout."""
+        return await asyncio.wait_for(read, self.read_timeout)
@@ -0,0 +1,122 @@
+"""Service for spatial sorting of points.
+
+This module provides the insertion orders used before the Bowyer-Watson
+loop: consecutive points in a Hilbert order are close to each other, which
+keeps the walks short, and the biased randomized insertion order (BRIO)
+adds randomness to avoid large cavities on adversarial input.
+"""
+
+import math
+import random
+
+ORDERS = ("input", "hilbert", "brio")
+
+
+def hilbert_keys(xs: list[float], ys: list[float]) -> list[int]:
+    """Compute the position of each point along a Hilbert curve.
+
+    The bounding box is divided in a grid of 2^k x 2^k cells, with k chosen
+    so that there is about one point per cell.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+
+    Returns:
+        list[int]: The Hilbert index of the cell of each point.
+
+    """
+    count = len(xs)
+    order = max(1, math.ceil(math.log(max(count, 2), 4)) + 1)
+    side = 1 << order
+    min_x, min_y = min(xs), min(ys)
+    extent = max(max(xs) - min_x, max(ys) - min_y) or 1.0
+    scale = (side - 1) / extent
+
+    keys = []
+    for x, y in zip(xs, ys, strict=True):
+        # Coordonnées entières dans la grille, puis parcours des niveaux
+        # de la courbe du plus grossier au plus fin
+        cx = int((x - min_x) * scale)
+        cy = int((y - min_y) * scale)
+        key = 0
+        s = side >> 1
+        while s:
+            rx = 1 if cx & s else 0
+            ry = 1 if cy & s else 0
+            key += s * s * ((3 * rx) ^ ry)
+            if not ry:  # Rotation du quadrant
+                if rx:
+                    cx = side - 1 - cx
+                    cy = side - 1 - cy
+                cx, cy = cy, cx
+            s >>= 1
+        keys.append(key)
+    return keys
+
+
+def hilbert_order(xs: list[float], ys: list[float]) -> list[int]:
+    """Return the point indices sorted along a Hilbert curve."""
+    keys = hilbert_keys(xs, ys)
+    return sorted(range(len(xs)), key=keys.__getitem__)
+
+
+def brio_order(xs: list[float], ys: list[float], seed: int = 0) -> list[int]:
+    """Return the point indices in a biased randomized insertion order.
+
+    The points are shuffled and split in rounds of doubling size (the last
+    round holds about half of the points); each round is sorted along a
+    Hilbert curve and the rounds are inserted from the smallest to the
+    largest.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        seed (int): Seed of the shuffle, so that the order is reproducible.
+
+    Returns:
+        list[int]: The point indices in insertion order.
+
+    """
+    keys = hilbert_keys(xs, ys)
+    shuffled = list(range(len(xs)))
+    random.Random(seed).shuffle(shuffled)
+
+    order = []
+    start = 0
+    end = len(shuffled)
+    rounds = []
+    while end - start > 1:
+        middle = (start + end) // 2
+        rounds.append(shuffled[middle:end])
+        end = middle
+    rounds.append(shuffled[start:end])
+    for round_indices in reversed(rounds):
+        order.extend(sorted(round_indices, key=keys.__getitem__))
+    return order
+
+
+def insertion_order(xs: list[float], ys: list[float], order: str) -> list[int]:
+    """Return the point indices in the requested insertion order.
+
+    Args:
+        xs (list[float]): The x-coordinates of the points.
+        ys (list[float]): The y-coordinates of the points.
+        order (str): 'input', 'hilbert' or 'brio'.
+
+    Returns:
+        list[int]: The point indices in insertion order.
+
+    Raises:
+        ValueError: If the order is unknown.
+
+    """
+    match order:
+        case "input":
+            return list(range(len(xs)))
+        case "hilbert":
+            return hilbert_order(xs, ys)
+        case "brio":
+            return brio_order(xs, ys)
+        case _:
+            raise ValueError(f"Unknown insertion order: {order}")
@@ -1,12 +1,28 @@
 """Unit tests for the triangulator api."""
 
-from unittest.mock import Mock, patch
-from urllib.error import HTTPError
+import asyncio
+import io
+import json
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 
-from classes.pointset import Point, PointSet
+import AsyncTriangulator
+import Triangulator
+from AsyncTriangulator import AsyncTriangulator as AsyncApp
+from classes.pointset import Point, PointSet, constrained_to_bytes
+from services.CacheService import DiskCache, TriangulationCache
+from services.PointSetManagerService import (
+    AsyncPointSetManagerClient,
+    CircuitOpenError,
+    ManagerUnavailableError,
+    PointSetNotFoundError,
+)
 from Triangulator import app as flask_app
+from Triangulator import cache
 
 
 # Helper pour avoir un PointSetValide
@@ -15,8 +31,15 @@ def get_valid_pointset() -> PointSet:
     return PointSet([Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0)])
 
 
-# Mock le chemin pour urlopen de urllib afin d'éviter les appels réseau réels
-URLOPEN_PATH = "urllib.request.urlopen"
+# Mock la récupération du pointset afin d'éviter les appels réseau réels
+FETCH_PATH = "Triangulator.manager.fetch_decoded_pointset"
+
+
+def fetched(point_set_bytes: bytes) -> tuple[PointSet, bytes]:
+    """Return what the manager client returns for a PointSet body."""
+    return PointSet.from_bytes(point_set_bytes), TriangulationCache.digest(
+        point_set_bytes
+    )
 
 
 class TestTriangulatorApi:
@@ -27,6 +50,7 @@ class TestTriangulatorApi:
     def client(self):
         """Fixture to provide a Flask test client."""
         flask_app.config["TESTING"] = True
+        cache.clear()  # Chaque test part d'un cache vide
         with flask_app.test_client() as client:
             yield client
 
@@ -37,22 +61,400 @@ class TestTriangulatorApi:
         valid_point_set_bytes = valid_point_set.to_bytes()
         expected_triangles = valid_point_set.triangulate()
 
-        # Mock du call API vers le PointSetManager
-        mock_response = Mock()
-        mock_response.read.return_value = valid_point_set_bytes
-        mock_response.getcode.return_value = 200
-        # Sécurité dans le cas ou getcode n'est pas utilisé
-        # dans ma future implémentation
-        mock_response.status = 200
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-
-        with patch(URLOPEN_PATH, return_value=mock_response):
+        with patch(FETCH_PATH, return_value=fetched(valid_point_set_bytes)):
             response = client.get("/triangulation/123e4567-e89b-12d3-a456-426614174000")
             assert response.status_code == 200
             assert response.content_type == "application/octet-stream"
             assert response.data == expected_triangles.to_bytes()
 
+    def test_api_200_triangulation_engine_selection(self, client):
+        """Test that the engine query parameter selects the algorithm."""
+        valid_point_set = get_valid_pointset()
+        expected_triangles = valid_point_set.triangulate(engine="divide-and-conquer")
+        point_set_bytes = valid_point_set.to_bytes()
+
+        with patch(FETCH_PATH, return_value=fetched(point_set_bytes)):
+            response = client.get(
+                "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+                "?engine=divide-and-conquer"
+            )
+            assert response.status_code == 200
+            assert response.data == expected_triangles.to_bytes()
+
+    def test_api_400_unknown_engine(self, client):
+        """Test request with an unknown triangulation engine (400 Bad Request)."""
+        with patch(FETCH_PATH) as mock_fetch:
+            response = client.get(
+                "/triangulation/123e4567-e89b-12d3-a456-426614174000?engine=unknown"
+            )
+            assert response.status_code == 400
+            mock_fetch.assert_not_called()
+
+    def test_api_200_merged_duplicated_points(self, client):
+        """Test that the tolerance query parameter merges duplicated points."""
+        point_set = PointSet([*get_valid_pointset().points, Point(1.0, 1.0)])
+        point_set_bytes = point_set.to_bytes()
+
+        url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+        with patch(FETCH_PATH, return_value=fetched(point_set_bytes)):
+            rejected = client.get(url)
+            merged = client.get(url + "?tolerance=0")
+        assert rejected.status_code == 500
+        assert merged.status_code == 200
+        assert merged.data == point_set.triangulate(merge_tolerance=0).to_bytes()
+
+    def test_api_400_invalid_tolerance(self, client):
+        """Test request with an invalid merge tolerance (400 Bad Request)."""
+        with patch(FETCH_PATH) as mock_fetch:
+            for tolerance in ("-1", "nan", "abc"):
+                response = client.get(
+                    "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+                    f"?tolerance={tolerance}"
+                )
+                assert response.status_code == 400
+            mock_fetch.assert_not_called()
+
+    def test_api_200_decimated_triangulation(self, client):
+        """Test that the maxPoints query parameter decimates the PointSet."""
+        point_set = PointSet(
+            [Point(float(x), float(y)) for x in range(20) for y in range(20)]
+        )
+
+        url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+        with patch(FETCH_PATH, return_value=fetched(point_set.to_bytes())):
+            response = client.get(url + "?maxPoints=50")
+        assert response.status_code == 200
+        assert 3 <= struct.unpack_from("<L", response.data)[0] <= 50
+        decimated, _ = point_set.decimate(50)
+        assert response.data == decimated.triangulate().to_bytes()
+
+    def test_api_400_invalid_max_points(self, client):
+        """Test request with an invalid maximum number of points (400)."""
+        with patch(FETCH_PATH) as mock_fetch:
+            for max_points in ("2", "-5", "abc"):
+                response = client.get(
+                    "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+                    f"?maxPoints={max_points}"
+                )
+                assert response.status_code == 400
+            mock_fetch.assert_not_called()
+
+    def test_api_200_cached_triangulation_by_id(self, client):
+        """Test that a known PointSet ID is served without refetching."""
+        valid_point_set = get_valid_pointset()
+        point_set_bytes = valid_point_set.to_bytes()
+
+        url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+        with patch(FETCH_PATH, return_value=fetched(point_set_bytes)) as mock_fetch:
+            first = client.get(url)
+            second = client.get(url)
+            assert mock_fetch.call_count == 1
+        assert second.status_code == 200
+        assert second.data == first.data
+        assert cache.stats()["hits"] == 1
+        # La première requête manque par id, puis par contenu
+        assert cache.stats()["misses"] == 2
+
+    def test_api_200_cached_triangulation_by_content(self, client):
+        """Test that the same PointSet under another ID shares the result."""
+        valid_point_set = get_valid_pointset()
+        point_set_bytes = valid_point_set.to_bytes()
+
+        with (
+            patch(FETCH_PATH, return_value=fetched(point_set_bytes)),
+            patch.object(
+                PointSet, "triangulate", wraps=valid_point_set.triangulate
+            ) as mock_triangulate,
+        ):
+            first = client.get("/triangulation/123e4567-e89b-12d3-a456-426614174000")
+            second = client.get("/triangulation/223e4567-e89b-12d3-a456-426614174000")
+            assert mock_triangulate.call_count == 1
+        assert second.data == first.data
+
+    def test_api_200_disk_cached_triangulation(self, client, tmp_path):
+        """Test that a result stored on disk survives the memory cache."""
+        valid_point_set = get_valid_pointset()
+        point_set_bytes = valid_point_set.to_bytes()
+
+        url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+        with (
+            patch.object(Triangulator, "disk_cache", DiskCache(str(tmp_path), 1024)),
+            patch(FETCH_PATH, return_value=fetched(point_set_bytes)),
+            patch.object(
+                PointSet, "triangulate", wraps=valid_point_set.triangulate
+            ) as mock_triangulate,
+        ):
+            first = client.get(url)
+            cache.clear()  # Simule un redémarrage du worker
+            second = client.get(url)
+            assert mock_triangulate.call_count == 1
+        assert second.status_code == 200
+        assert second.headers["Content-Length"] == str(len(first.data))
+        assert second.data == first.data
+
+    def test_api_200_streamed_triangulation_too_large_for_cache(self, client, tmp_path):
+        """Test that a result larger than the memory cache is streamed."""
+        valid_point_set = get_valid_pointset()
+        expected = valid_point_set.triangulate().to_bytes()
+
+        url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+        with (
+            patch.object(cache, "max_bytes", 8),
+            patch(FETCH_PATH, return_value=fetched(valid_point_set.to_bytes())),
+        ):
+            response = client.get(url)
+            assert response.is_streamed
+            assert response.headers["Content-Length"] == str(len(expected))
+            assert response.data == expected
+            assert cache.stats()["entries"] == 0
+
+            # Avec le cache disque, le résultat y est écrit par morceaux
+            disk_cache = DiskCache(str(tmp_path), 1024)
+            with patch.object(Triangulator, "disk_cache", disk_cache):
+                response = client.get(url)
+            assert response.data == expected
+            assert disk_cache.get(
+                cache.digest(valid_point_set.to_bytes()), "bowyer-watson"
+            )
+
+    def test_api_200_concurrent_requests_share_one_computation(self, client):
+        """Test that a burst of identical requests fetches and triangulates once."""
+        valid_point_set = get_valid_pointset()
+        point_set_bytes = valid_point_set.to_bytes()
+        release = threading.Event()
+
+        # Le premier fetch bloque jusqu'à ce que toutes les requêtes soient lancées
+        def slow_fetch(pointset_id):
+            release.wait(timeout=5)
+            return fetched(point_set_bytes)
+
+        url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+        responses = []
+
+        def get():
+            with flask_app.test_client() as thread_client:
+                responses.append(thread_client.get(url))
+
+        with (
+            patch(FETCH_PATH, side_effect=slow_fetch) as mock_fetch,
+            patch.object(
+                PointSet, "triangulate", wraps=valid_point_set.triangulate
+            ) as mock_triangulate,
+        ):
+            shared = Triangulator.in_flight.shared
+            threads = [threading.Thread(target=get) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            while Triangulator.in_flight.shared < shared + len(threads) - 1:
+                threading.Event().wait(0.01)
+            release.set()
+            for thread in threads:
+                thread.join()
+            assert mock_fetch.call_count == 1
+            assert mock_triangulate.call_count == 1
+        assert len({response.data for response in responses}) == 1
+        assert all(response.status_code == 200 for response in responses)
+
+    def test_api_200_uploaded_pointset(self, client):
+        """Test the triangulation of a PointSet sent in the body."""
+        valid_point_set = get_valid_pointset()
+        expected = valid_point_set.triangulate().to_bytes()
+
+        with (
+            patch(FETCH_PATH) as mock_fetch,
+            patch.object(
+                PointSet, "triangulate", wraps=valid_point_set.triangulate
+            ) as mock_triangulate,
+        ):
+            first = client.post("/triangulation", data=valid_point_set.to_bytes())
+            second = client.post("/triangulation", data=valid_point_set.to_bytes())
+            mock_fetch.assert_not_called()
+            assert mock_triangulate.call_count == 1  # Mis en cache par contenu
+        assert first.status_code == 200
+        assert first.content_type == "application/octet-stream"
+        assert first.data == second.data == expected
+
+    def test_api_400_invalid_uploaded_pointset(self, client):
+        """Test uploads that cannot be decoded or triangulated (400)."""
+        point_set_bytes = get_valid_pointset().to_bytes()
+        for body in (b"", point_set_bytes[:-1], point_set_bytes + b"\0"):
+            response = client.post("/triangulation", data=body)
+            assert response.status_code == 400
+            assert response.content_type == "application/json"
+
+        collinear = PointSet([Point(0.0, 0.0), Point(1.0, 1.0), Point(2.0, 2.0)])
+        response = client.post("/triangulation", data=collinear.to_bytes())
+        assert response.status_code == 400
+
+    def test_api_chunked_upload_with_lying_point_count(self, client):
+        """Test chunked uploads, whose point count is not known in advance."""
+        chunked = {
+            "headers": {"Transfer-Encoding": "chunked"},
+            "environ_overrides": {"wsgi.input_terminated": True},
+        }
+        valid_point_set = get_valid_pointset()
+        response = client.post(
+            "/triangulation",
+            input_stream=io.BytesIO(valid_point_set.to_bytes()),
+            **chunked,
+        )
+        assert response.status_code == 200
+        assert response.data == valid_point_set.triangulate().to_bytes()
+
+        # L'en-tête annonce 100 millions de points pour un corps de 4 octets
+        response = client.post(
+            "/triangulation",
+            input_stream=io.BytesIO(struct.pack("<L", 100_000_000)),
+            **chunked,
+        )
+        assert response.status_code == 400
+        assert "shorter than the point count" in response.get_json()["error"]
+
+    def test_api_200_constrained_triangulation(self, client):
+        """Test the triangulation of a PointSet sent with segments."""
+        point_set = PointSet(
+            [Point(0.0, 0.0), Point(4.0, 0.0), Point(2.0, 1.0), Point(2.0, -1.0)]
+        )
+        expected = point_set.triangulate(segments=[(0, 1)]).to_bytes()
+
+        body = constrained_to_bytes(point_set, [(0, 1)])
+        response = client.post("/triangulation/constrained", data=body)
+        assert response.status_code == 200
+        assert response.data == expected
+        assert response.data != point_set.triangulate().to_bytes()
+
+    def test_api_400_invalid_constrained_pointset(self, client):
+        """Test constrained bodies that cannot be decoded or triangulated."""
+        point_set = get_valid_pointset()
+        for body in (
+            point_set.to_bytes(),
+            constrained_to_bytes(point_set, [(0, 3)]),
+            constrained_to_bytes(point_set, [(0, 1)])[:-1],
+        ):
+            response = client.post("/triangulation/constrained", data=body)
+            assert response.status_code == 400
+            assert response.content_type == "application/json"
+
+    @staticmethod
+    def parse_batch(data: bytes) -> list[tuple[int, bytes]]:
+        """Split a framed batch body into the status and payload of each item."""
+        (count,) = struct.unpack_from("<L", data, 0)
+        items, offset = [], 4
+        for _ in range(count):
+            status, length = struct.unpack_from("<LL", data, offset)
+            offset += 8
+            items.append((status, data[offset : offset + length]))
+            offset += length
+        assert offset == len(data)
+        return items
+
+    def test_api_200_batch_triangulation(self, client):
+        """Test a batch with per-item results and statuses."""
+        valid_point_set = get_valid_pointset()
+        expected = valid_point_set.triangulate().to_bytes()
+        missing_id = "323e4567-e89b-12d3-a456-426614174000"
+
+        def fetch(pointset_id):
+            if pointset_id == missing_id:
+                raise PointSetNotFoundError(pointset_id)
+            return fetched(valid_point_set.to_bytes())
+
+        ids = [
+            "123e4567-e89b-12d3-a456-426614174000",
+            "NotAValidUUID",
+            missing_id,
+            "223e4567-e89b-12d3-a456-426614174000",
+        ]
+        processes = Triangulator.batch_processes
+        with (
+            patch(FETCH_PATH, side_effect=fetch),
+            patch.object(processes, "submit", wraps=processes.submit) as mock_submit,
+        ):
+            response = client.post("/triangulation/batch", json={"pointSetIds": ids})
+            # Les triangulations tournent dans les processus, pas les threads
+            assert mock_submit.call_count >= 1
+        assert response.status_code == 200
+        assert response.content_type == "application/octet-stream"
+        assert response.headers["Content-Length"] == str(len(response.data))
+        items = self.parse_batch(response.data)
+        assert [status for status, _ in items] == [200, 400, 404, 200]
+        assert items[0][1] == items[3][1] == expected
+        assert json.loads(items[2][1]) == {"error": "PointSet not found"}
+
+    def test_api_200_concurrent_batches(self, client):
+        """Test batches posted by several threads at once, one per content."""
+        point_sets = {
+            f"{n:08x}-e89b-12d3-a456-426614174000": PointSet(
+                [Point(x + n, y * (n + 1)) for x, y in ((0, 0), (1, 0), (0, 1), (1, 1))]
+            )
+            for n in range(12)
+        }
+        ids = list(point_sets)
+        responses = []
+
+        def fetch(pointset_id):
+            return fetched(point_sets[pointset_id].to_bytes())
+
+        def post(batch):
+            with flask_app.test_client() as thread_client:
+                response = thread_client.post(
+                    "/triangulation/batch", json={"pointSetIds": batch}
+                )
+                responses.append((batch, response))
+
+        with patch(FETCH_PATH, side_effect=fetch):
+            threads = [
+                threading.Thread(target=post, args=(ids[start : start + 3],))
+                for start in range(0, len(ids), 3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=60)
+        assert len(responses) == len(threads)
+        for batch, response in responses:
+            assert response.status_code == 200
+            items = self.parse_batch(response.data)
+            assert items == [
+                (200, point_sets[pointset_id].triangulate().to_bytes())
+                for pointset_id in batch
+            ]
+
+    def test_api_400_invalid_batch(self, client):
+        """Test batch requests with an invalid body (400 Bad Request)."""
+        url = "/triangulation/batch"
+        assert client.post(url, data=b"not json").status_code == 400
+        assert client.post(url, json={"pointSetIds": "a"}).status_code == 400
+        assert client.post(url, json={"pointSetIds": [1]}).status_code == 400
+        too_many = {"pointSetIds": ["a"] * (Triangulator.BATCH_MAX_SIZE + 1)}
+        assert client.post(url, json=too_many).status_code == 400
+        response = client.post(f"{url}?engine=unknown", json={"pointSetIds": []})
+        assert response.status_code == 400
+
+    def test_api_200_convex_hull(self, client):
+        """Test that the hull route returns the packed hull indices."""
+        point_set = PointSet([*get_valid_pointset().points, Point(0.5, 0.2)])
+        url = "/hull/123e4567-e89b-12d3-a456-426614174000"
+
+        with (
+            patch(FETCH_PATH, return_value=fetched(point_set.to_bytes())) as mock_fetch,
+            patch.object(PointSet, "triangulate") as mock_triangulate,
+        ):
+            first = client.get(url)
+            second = client.get(url)
+            assert mock_fetch.call_count == 1
+            mock_triangulate.assert_not_called()
+        assert first.status_code == 200
+        assert first.content_type == "application/octet-stream"
+        assert first.data == second.data == struct.pack("<4L", 3, 0, 1, 2)
+
+    def test_api_hull_errors(self, client):
+        """Test invalid UUID (400) and missing PointSet (404) on the hull route."""
+        assert client.get("/hull/123").status_code == 400
+        with patch(FETCH_PATH, side_effect=PointSetNotFoundError()):
+            response = client.get("/hull/123e4567-e89b-12d3-a456-426614174000")
+        assert response.status_code == 404
+
     def test_api_400_invalid_pointset_id(self, client):
         """Test request with invalid UUID (400 Bad Request)."""
         invalid_id = "NotAValidUUID"
@@ -65,15 +467,7 @@ class TestTriangulatorApi:
         valid_uuid = "123e4567-e89b-12d3-a456-426614174000"
 
         # Mock du call API qui retourne une erreur 404
-        mock_http_error = HTTPError(
-            url=f"http://localhost:5000/pointset/{valid_uuid}",
-            code=404,
-            msg="Not Found",
-            hdrs={},
-            fp=None,
-        )
-
-        with patch(URLOPEN_PATH, side_effect=mock_http_error):
+        with patch(FETCH_PATH, side_effect=PointSetNotFoundError(valid_uuid)):
             response = client.get(f"/triangulation/{valid_uuid}")
             assert response.status_code == 404
             assert response.content_type == "application/json"
@@ -84,17 +478,9 @@ class TestTriangulatorApi:
         valid_point_set = get_valid_pointset()
         valid_point_set_bytes = valid_point_set.to_bytes()
 
-        # Mock du call API réussi
-        mock_response = Mock()
-        mock_response.read.return_value = valid_point_set_bytes
-        mock_response.getcode.return_value = 200
-        mock_response.status = 200
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-
         # Mock de la méthode triangulate pour simuler une erreur interne
         with (
-            patch(URLOPEN_PATH, return_value=mock_response),
+            patch(FETCH_PATH, return_value=fetched(valid_point_set_bytes)),
             patch.object(
                 PointSet, "triangulate", side_effect=ValueError("Triangulation error")
             ),
@@ -108,7 +494,198 @@ class TestTriangulatorApi:
         valid_uuid = "123e4567-e89b-12d3-a456-426614174000"
 
         # Mock du call API qui lève une exception réseau (timeout, connection error)
-        with patch(URLOPEN_PATH, side_effect=ConnectionError("Network timeout")):
+        with patch(FETCH_PATH, side_effect=ManagerUnavailableError("Network timeout")):
             response = client.get(f"/triangulation/{valid_uuid}")
             assert response.status_code == 500
             assert response.content_type == "application/json"
+
+    def test_api_503_manager_circuit_open(self, client):
+        """Test that an open circuit answers 503 without waiting."""
+        valid_uuid = "123e4567-e89b-12d3-a456-426614174000"
+
+        with patch(FETCH_PATH, side_effect=CircuitOpenError("Manager down")):
+            response = client.get(f"/triangulation/{valid_uuid}")
+            assert response.status_code == 503
+            assert response.content_type == "application/json"
+            assert "Retry-After" in response.headers
+
+
+async def asgi_get(app, path: str, query: bytes = b"", method: str = "GET"):
+    """Send a request to an ASGI application and return its response."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "query_string": query}
+    await app(scope, receive, send)
+    start, *body = messages
+    headers = {name.decode(): value.decode() for name, value in start["headers"]}
+    return start["status"], headers, b"".join(message["body"] for message in body)
+
+
+class TestAsyncTriangulatorApi:
+    """Test suite for the asynchronous Triangulator API."""
+
+    URL = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+
+    @pytest.fixture
+    def async_app(self):
+        """Fixture to provide the ASGI application with a thread pool."""
+        executor = ThreadPoolExecutor(max_workers=2)
+        yield AsyncApp(
+            AsyncPointSetManagerClient("http://localhost:5000"),
+            TriangulationCache(1024 * 1024, 300.0),
+            executor=executor,
+        )
+        executor.shutdown()
+
+    def test_async_api_200_triangulation_in_process_pool(self):
+        """Test a successful triangulation computed by a worker process."""
+        valid_point_set = get_valid_pointset()
+        expected = valid_point_set.triangulate().to_bytes()
+        async_app = AsyncApp(
+            AsyncPointSetManagerClient("http://localhost:5000"),
+            TriangulationCache(1024 * 1024, 300.0),
+        )
+
+        async def scenario():
+            try:
+                return await asgi_get(async_app, self.URL)
+            finally:
+                await async_app.close()
+
+        with patch.object(
+            async_app.manager, "fetch_pointset", return_value=valid_point_set.to_bytes()
+        ):
+            status, headers, body = asyncio.run(scenario())
+        assert status == 200
+        assert headers["content-type"] == "application/octet-stream"
+        assert headers["content-length"] == str(len(expected))
+        assert body == expected
+
+    def test_async_api_200_cached_triangulation_by_id(self, async_app):
+        """Test that a known PointSet ID is served without refetching."""
+        point_set_bytes = get_valid_pointset().to_bytes()
+
+        with patch.object(
+            async_app.manager, "fetch_pointset", return_value=point_set_bytes
+        ) as mock_fetch:
+            first = asyncio.run(asgi_get(async_app, self.URL))
+            second = asyncio.run(asgi_get(async_app, self.URL))
+            assert mock_fetch.await_count == 1
+        assert second == first
+
+    def test_async_api_200_disk_cache_off_the_event_loop(self, tmp_path):
+        """Test that the disk cache is used from threads, not the event loop."""
+        point_set_bytes = get_valid_pointset().to_bytes()
+        executor = ThreadPoolExecutor(max_workers=1)
+        disk_cache = DiskCache(str(tmp_path), 1024 * 1024)
+        async_app = AsyncApp(
+            AsyncPointSetManagerClient("http://localhost:5000"),
+            TriangulationCache(1024 * 1024, 300.0),
+            disk_cache,
+            executor=executor,
+        )
+        loop_threads, disk_threads = set(), []
+        put = disk_cache.put
+
+        def recording_put(*args):
+            disk_threads.append(threading.get_ident())
+            put(*args)
+
+        async def scenario():
+            loop_threads.add(threading.get_ident())
+            first = await asgi_get(async_app, self.URL)
+            async_app.cache.clear()  # Simule un redémarrage du worker
+            return first, await asgi_get(async_app, self.URL)
+
+        with (
+            patch.object(
+                async_app.manager, "fetch_pointset", return_value=point_set_bytes
+            ),
+            patch.object(disk_cache, "put", side_effect=recording_put),
+        ):
+            first, second = asyncio.run(scenario())
+        executor.shutdown()
+        assert first[0] == 200
+        assert second == first
+        assert disk_cache.hits == 1
+        assert len(disk_threads) == 1
+        assert loop_threads.isdisjoint(disk_threads)
+
+    def test_async_api_400_invalid_request(self, async_app):
+        """Test invalid UUID and unknown engine (400 Bad Request)."""
+        status, headers, _ = asyncio.run(asgi_get(async_app, "/triangulation/123"))
+        assert status == 400
+        assert headers["content-type"] == "application/json"
+        status, _, _ = asyncio.run(asgi_get(async_app, self.URL, b"engine=unknown"))
+        assert status == 400
+
+    def test_async_api_404_pointset_not_found(self, async_app):
+        """Test request for non-existent PointSet (404 Not Found)."""
+        with patch.object(
+            async_app.manager, "fetch_pointset", side_effect=PointSetNotFoundError()
+        ):
+            status, _, _ = asyncio.run(asgi_get(async_app, self.URL))
+        assert status == 404
+
+    def test_async_api_503_when_workers_are_saturated(self, async_app):
+        """Test that triangulations over the pending limit are shed with 503."""
+        point_set_bytes = get_valid_pointset().to_bytes()
+        async_app.max_pending = 1
+        release = threading.Event()
+
+        # La première triangulation occupe l'unique place jusqu'à la libération
+        def blocking_triangulation(point_set_bytes, engine, *options):
+            release.wait(timeout=5)
+            return b"triangles"
+
+        async def scenario():
+            first = asyncio.create_task(asgi_get(async_app, self.URL))
+            while async_app.pending == 0:
+                await asyncio.sleep(0.01)
+            second = await asgi_get(
+                async_app, "/triangulation/223e4567-e89b-12d3-a456-426614174000"
+            )
+            release.set()
+            return await first, second
+
+        with (
+            patch.object(
+                async_app.manager, "fetch_pointset", return_value=point_set_bytes
+            ),
+            patch.object(
+                AsyncTriangulator, "triangulate_bytes", blocking_triangulation
+            ),
+        ):
+            first, second = asyncio.run(scenario())
+        assert first[0] == 200
+        assert second[0] == 503
+        assert "retry-after" in second[1]
+        assert async_app.pending == 0
+
+    def test_async_api_concurrent_requests_share_one_computation(self, async_app):
+        """Test that a burst of identical requests fetches once."""
+        point_set_bytes = get_valid_pointset().to_bytes()
+
+        async def slow_fetch(pointset_id):
+            await asyncio.sleep(0.05)
+            return point_set_bytes
+
+        async def scenario():
+            return await asyncio.gather(
+                *(asgi_get(async_app, self.URL) for _ in range(8))
+            )
+
+        with patch.object(
+            async_app.manager, "fetch_pointset", side_effect=slow_fetch
+        ) as mock_fetch:
+            responses = asyncio.run(scenario())
+            assert mock_fetch.await_count == 1
+        assert async_app.in_flight.shared == 7
+        assert {status for status, _, _ in responses} == {200}
+        assert len({body for _, _, body in responses}) == 1
@@ -69,6 +69,12 @@ SIZES = [10, 100, 1000]  # 100000 peut être long, à tester
 AMPLITUDES = [(0, 10), (0, 100), (0, 1000)]
 AMPLITUDES_IDS = [f"{min}/{max}" for (min, max) in AMPLITUDES]
 DISTRIBUTIONS = ["uniform", "linear", "clustered"]
+LARGE_SIZES = [10000, 50000, 100000]
+SERIALIZATION_SIZES = SIZES + [1000000]
+TRIANGLES_SERIALIZATION_SIZES = SIZES + [10000, 100000]
+INSERTION_ORDERS = ["input", "hilbert", "brio"]
+ENGINES = PointSet.ENGINES
+WORKERS = [1, 2, 4, 8]
 
 
 @pytest.mark.parametrize("size", SIZES)
@@ -101,7 +107,97 @@ def test_triangulation_performance(size, amplitude, distribution, performance_tr
     # assert metrics.execution_time < (size * 0.01)
 
 
-@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("size", LARGE_SIZES)
+def test_triangulation_scaling_performance(size, performance_tracker):
+    """Benchmark triangulation on large uniform PointSets (near O(n log n))."""
+    # SETUP (Hors chrono)
+    pointset = generate_pointset(size, (0, 1000), "uniform")
+
+    # ACTION (Mesurée)
+    with performance_tracker as metrics:
+        pointset.triangulate()
+
+    print(f"\n{'-' * 60}")
+    print(f" Triangulation Scaling Performance test- Size: {size}")
+    print(f"  > Time:   {metrics.execution_time:.6f} s")
+    print(f"  > Time per point: {metrics.execution_time / size * 1e6:.2f} us")
+    print(f"  > CPU Time:    {metrics.cpu_time:.6f} s")
+    print(
+        f"  > Peak Memory: {metrics.memory_usage / 1024:.2f} KB "
+        f"({metrics.memory_usage / (1024 * 1024):.2f} MB)"
+    )
+    print(f"{'-' * 60}")
+
+
+@pytest.mark.parametrize("order", INSERTION_ORDERS)
+def test_triangulation_insertion_order_performance(order, performance_tracker):
+    """Benchmark insertion orders on a PointSet sorted by x (sensor sweep)."""
+    # SETUP (Hors chrono)
+    pointset = generate_pointset(5000, (0, 1000), "uniform")
+    pointset = PointSet(sorted(pointset.points, key=lambda point: point.x))
+
+    # ACTION (Mesurée)
+    with performance_tracker as metrics:
+        pointset.triangulate(order=order)
+
+    print(f"\n{'-' * 60}")
+    print(f" Insertion Order Performance test- Order: {order}, Size: 5000")
+    print(f"  > Time:   {metrics.execution_time:.6f} s")
+    print(f"  > CPU Time:    {metrics.cpu_time:.6f} s")
+    print(
+        f"  > Peak Memory: {metrics.memory_usage / 1024:.2f} KB "
+        f"({metrics.memory_usage / (1024 * 1024):.2f} MB)"
+    )
+    print(f"{'-' * 60}")
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_triangulation_engine_performance(engine, distribution, performance_tracker):
+    """Benchmark the triangulation engines on the same PointSets."""
+    # SETUP (Hors chrono)
+    pointset = generate_pointset(5000, (0, 1000), distribution)
+
+    # ACTION (Mesurée)
+    with performance_tracker as metrics:
+        pointset.triangulate(engine=engine)
+
+    print(f"\n{'-' * 60}")
+    print(
+        f" Engine Performance test- Engine: {engine}, "
+        f"Distribution: {distribution}, Size: 5000"
+    )
+    print(f"  > Time:   {metrics.execution_time:.6f} s")
+    print(f"  > CPU Time:    {metrics.cpu_time:.6f} s")
+    print(
+        f"  > Peak Memory: {metrics.memory_usage / 1024:.2f} KB "
+        f"({metrics.memory_usage / (1024 * 1024):.2f} MB)"
+    )
+    print(f"{'-' * 60}")
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_triangulation_parallel_performance(workers, performance_tracker):
+    """Benchmark the speedup of the parallel triangulation vs. worker count."""
+    # SETUP (Hors chrono)
+    pointset = generate_pointset(20000, (0, 1000), "uniform")
+
+    # ACTION (Mesurée)
+    with performance_tracker as metrics:
+        pointset.triangulate(workers=workers)
+
+    print(f"\n{'-' * 60}")
+    print(f" Parallel Performance test- Workers: {workers}, Size: 20000")
+    print(f"  > Time:   {metrics.execution_time:.6f} s")
+    print(f"  > CPU Time:    {metrics.cpu_time:.6f} s")
+    print(
+        f"  > Peak Memory: {metrics.memory_usage / 1024:.2f} KB "
+        f"({metrics.memory_usage / (1024 * 1024):.2f} MB)"
+    )
+    print(f"{'-' * 60}")
+
+
+@pytest.mark.parametrize("size", SERIALIZATION_SIZES)
 @pytest.mark.parametrize("amplitude", AMPLITUDES)
 def test_pointset_to_bytes_performance(size, amplitude, performance_tracker):
     """Benchmark PointSet.to_bytes performance."""
@@ -127,7 +223,7 @@ def test_pointset_to_bytes_performance(size, amplitude, performance_tracker):
     # assert metrics.execution_time < (size * 0.01)
 
 
-@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("size", SERIALIZATION_SIZES)
 @pytest.mark.parametrize("amplitude", AMPLITUDES)
 def test_pointset_from_bytes_performance(size, amplitude, performance_tracker):
     """Benchmark PointSet.from_bytes performance."""
@@ -154,7 +250,7 @@ def test_pointset_from_bytes_performance(size, amplitude, performance_tracker):
     # assert metrics.execution_time < (size * 0.01)
 
 
-@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("size", TRIANGLES_SERIALIZATION_SIZES)
 @pytest.mark.parametrize("amplitude", AMPLITUDES)
 def test_triangles_to_bytes_performance(size, amplitude, performance_tracker):
     """Benchmark Triangles.to_bytes performance."""
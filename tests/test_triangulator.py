@@ -1,11 +1,43 @@
 """Unit tests for the triangulator module."""
 
+import asyncio
+import itertools
+import os
+import random
+import socket
 import struct
+import threading
+import tracemalloc
+from array import array
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
-from classes.pointset import Point, PointSet
-from classes.triangles import Triangles
+from classes.mesh import NO_NEIGHBOR, Mesh
+from classes.pointset import (
+    Point,
+    PointSet,
+    PointSetDecoder,
+    constrained_from_bytes,
+    constrained_to_bytes,
+)
+from classes.triangles import Triangle, Triangles
+from services.BowerWatsonService import (
+    IncrementalTriangulation,
+    bounding_box,
+    insert_vertices,
+    start_mesh,
+)
+from services.CacheService import DiskCache, TriangulationCache
+from services.CoalescingService import AsyncSingleFlight, SingleFlight
+from services.GeometryService import incircle, orient2d
+from services.PointSetManagerService import (
+    AsyncPointSetManagerClient,
+    CircuitOpenError,
+    ManagerUnavailableError,
+    PointSetManagerClient,
+    PointSetNotFoundError,
+)
 
 
 class TestTriangulate:
@@ -49,6 +81,110 @@ class TestTriangulate:
         ):
             duplicated_point_point_set.triangulate()
 
+    def test_validate_with_coincident_first_points(self):
+        """Test that a duplicated first point is not reported as collinear."""
+        point_set = PointSet(
+            [Point(0.0, 0.0), Point(0.0, 0.0), Point(1.0, 1.0), Point(2.0, 0.0)]
+        )
+        with pytest.raises(ValueError, match="duplicated points"):
+            point_set.validate()
+
+    def test_validate_with_signed_zeros(self):
+        """Test that 0.0 and -0.0 are the same coordinate for duplicates."""
+        point_set = PointSet(
+            [Point(0.0, 1.0), Point(-0.0, 1.0), Point(1.0, 1.0), Point(2.0, 0.0)]
+        )
+        with pytest.raises(ValueError, match="duplicated points"):
+            point_set.validate()
+
+    def test_validate_returns_bounding_box(self):
+        """Test that validate returns the bounding box of the points."""
+        point_set = PointSet([Point(1.0, -2.0), Point(4.0, 0.5), Point(-3.0, 6.0)])
+        assert point_set.validate() == (-3.0, -2.0, 4.0, 6.0)
+
+    def test_deduplicate_exact_float32_points(self):
+        """Test that exact duplicates, signed zeros included, are merged."""
+        coords = array("f", [0.0, 1.0, 2.0, 0.0, -0.0, 1.0, 2.0, 0.0, 1.0, 1.0])
+        unique, kept = PointSet.from_coords(coords).deduplicate()
+        assert list(kept) == [0, 1, 4]
+        assert unique.coords.tolist() == [0.0, 1.0, 2.0, 0.0, 1.0, 1.0]
+
+    def test_deduplicate_with_tolerance(self):
+        """Test that points closer than the tolerance are merged."""
+        point_set = PointSet(
+            [Point(0.0, 0.0), Point(0.3, 0.4), Point(0.31, 0.4), Point(-0.3, -0.4)]
+        )
+        assert list(point_set.deduplicate(0.5)[1]) == [0, 2]
+        assert list(point_set.deduplicate(0.49)[1]) == [0, 1, 3]
+        with pytest.raises(ValueError, match="Invalid merge tolerance"):
+            point_set.deduplicate(-1.0)
+
+    def test_decimate_keeps_at_most_max_points(self):
+        """Test that decimation thins a point set down to the given limit."""
+        point_set = PointSet(
+            [Point(float(x), float(y)) for x in range(40) for y in range(40)]
+        )
+        decimated, kept = point_set.decimate(100)
+        assert decimated.point_count == 100
+        assert list(kept) == sorted(set(kept))
+        assert decimated.coords.tolist() == [
+            value
+            for index in kept
+            for value in point_set.coords[2 * index : 2 * index + 2]
+        ]
+        assert point_set.decimate(1600)[0] is point_set
+        with pytest.raises(ValueError, match="at least 3"):
+            point_set.decimate(2)
+
+    def test_decimate_clustered_points_fills_the_limit(self):
+        """Test that clusters far apart keep max_points triangulable points."""
+        grid = [(float(x), float(y)) for x in range(40) for y in range(40)]
+        point_set = PointSet(
+            [Point(x, y) for x, y in grid] + [Point(x + 1e4, y + 1e4) for x, y in grid]
+        )
+        for max_points in (3, 10, 100, 1000):
+            decimated, _ = point_set.decimate(max_points)
+            assert decimated.point_count == max_points
+            assert decimated.triangulate().triangle_count >= 1
+
+    def test_decimate_nearly_collinear_points_stays_triangulable(self):
+        """Test that decimation keeps a point off the line of the others."""
+        rng = random.Random(3)
+        noisy = PointSet(
+            [
+                Point(x, 1.5 * x + rng.uniform(-1, 1))
+                for x in (rng.uniform(0, 1000) for _ in range(1000))
+            ]
+        )
+        # Une droite exacte et un seul point en dehors, en dernier
+        line = PointSet(
+            [Point(float(i), 2.0 * i) for i in range(100)] + [Point(50.0, 0.0)]
+        )
+        for point_set in (noisy, line):
+            for max_points in (3, 4, 10):
+                decimated, kept = point_set.decimate(max_points)
+                assert decimated.point_count == max_points
+                assert not decimated.check_colinearity()
+                assert decimated.triangulate().triangle_count >= 1
+        assert line.decimate(3)[1][-1] == 100
+
+    def test_triangulate_merging_duplicates(self):
+        """Test that merged triangles refer to the original point order."""
+        point_set = PointSet(
+            [
+                Point(0.0, 0.0),
+                Point(0.0, 0.0),
+                Point(1.0, 0.0),
+                Point(1.0, 0.0),
+                Point(0.0, 1.0),
+            ]
+        )
+        triangles = point_set.triangulate(merge_tolerance=0)
+        assert triangles.pointset is point_set
+        assert list(triangles.indices) == [0, 2, 4]
+        with pytest.raises(ValueError, match="duplicated points"):
+            point_set.triangulate()
+
     def test_triangulate_with_one_point(self):
         """Test that triangulate raises ValueError for single point."""
         point_set = PointSet([Point(1.0, 1.0)])
@@ -73,6 +209,410 @@ class TestTriangulate:
         triangulation = point_set.triangulate()
         assert triangulation.triangle_count == 2
 
+    def test_triangulate_random_points_respect_delaunay_condition(self):
+        """Test that no point lies inside the circumcircle of any triangle."""
+        rng = random.Random(42)
+        points = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(200)]
+        triangulation = PointSet(points).triangulate()
+
+        assert triangulation.triangle_count > 0
+        for triangle in triangulation.triangles:
+            vertices = (triangle.p1, triangle.p2, triangle.p3)
+            for point in points:
+                if point not in vertices:
+                    assert not triangle.is_point_in_circumcircle(point)
+
+
+class TestInsertionOrder:
+    """Test suite for the insertion order of the triangulation."""
+
+    @staticmethod
+    def triangle_set(triangulation: Triangles) -> set[tuple[int, ...]]:
+        """Return the triangles of a triangulation as a set of index triples."""
+        indices = triangulation.indices
+        return {tuple(indices[i : i + 3]) for i in range(0, len(indices), 3)}
+
+    @pytest.mark.parametrize("order", ["hilbert", "brio"])
+    def test_insertion_order_must_not_change_triangulation(self, order):
+        """Test that spatial orders give the same triangles as the input order."""
+        rng = random.Random(7)
+        # Points triés par x, comme un balayage de capteur
+        points = sorted(
+            (Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)),
+            key=lambda point: point.x,
+        )
+        point_set = PointSet(points)
+        expected = self.triangle_set(point_set.triangulate(order="input"))
+        assert self.triangle_set(point_set.triangulate(order=order)) == expected
+
+    def test_unknown_insertion_order_must_raise(self):
+        """Test that triangulate rejects an unknown order."""
+        point_set = PointSet([Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0)])
+        with pytest.raises(ValueError, match="Unknown insertion order"):
+            point_set.triangulate(order="zigzag")
+
+
+class TestEngines:
+    """Test suite for the triangulation engines."""
+
+    @pytest.mark.parametrize("size", [3, 4, 5, 17, 500])
+    def test_divide_and_conquer_must_match_bowyer_watson(self, size):
+        """Test that both engines give the same triangles on random points."""
+        rng = random.Random(size)
+        point_set = PointSet(
+            [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(size)]
+        )
+        expected = TestInsertionOrder.triangle_set(
+            point_set.triangulate(engine="bowyer-watson")
+        )
+        result = point_set.triangulate(engine="divide-and-conquer")
+        assert TestInsertionOrder.triangle_set(result) == expected
+
+    def test_divide_and_conquer_with_collinear_subsets(self):
+        """Test a grid, whose columns are collinear and cells cocircular."""
+        point_set = PointSet([Point(x, y) for x in range(10) for y in range(10)])
+        triangulation = point_set.triangulate(engine="divide-and-conquer")
+        # 2 triangles par cellule de la grille 9 x 9
+        assert triangulation.triangle_count == 162
+        for triangle in triangulation.triangles:
+            for point in point_set.points:
+                assert not triangle.is_point_in_circumcircle(point)
+
+    @pytest.mark.parametrize("workers", [2, 3])
+    def test_parallel_triangulation_must_match_serial(self, workers):
+        """Test that the tiles merge into the serial triangulation."""
+        rng = random.Random(workers)
+        point_set = PointSet(
+            [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(3000)]
+        )
+        expected = TestInsertionOrder.triangle_set(point_set.triangulate())
+        result = point_set.triangulate(workers=workers)
+        assert TestInsertionOrder.triangle_set(result) == expected
+
+    def test_parallel_triangulation_with_cocircular_points(self):
+        """Test a grid, whose cocircular cells may straddle two tiles."""
+        point_set = PointSet([Point(x, y) for x in range(50) for y in range(50)])
+        triangulation = point_set.triangulate(workers=2)
+        assert triangulation.triangle_count == 2 * 49 * 49
+
+    def test_invalid_workers_must_raise(self):
+        """Test that triangulate rejects a number of workers below 1."""
+        point_set = PointSet([Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0)])
+        with pytest.raises(ValueError, match="workers"):
+            point_set.triangulate(workers=0)
+
+    def test_unknown_engine_must_raise(self):
+        """Test that triangulate rejects an unknown engine."""
+        point_set = PointSet([Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0)])
+        with pytest.raises(ValueError, match="Unknown triangulation engine"):
+            point_set.triangulate(engine="quickhull")
+
+
+class TestIncrementalTriangulation:
+    """Test suite for the incremental triangulation."""
+
+    @staticmethod
+    def random_points(rng: random.Random, count: int, high: float) -> list[Point]:
+        """Return random points in the square [0, high]²."""
+        return [Point(rng.uniform(0, high), rng.uniform(0, high)) for _ in range(count)]
+
+    def test_insert_must_match_triangulation_from_scratch(self):
+        """Test that inserted batches give the triangulation of all points."""
+        rng = random.Random(19)
+        points = self.random_points(rng, 300, 100)
+        triangulation = IncrementalTriangulation(PointSet(points))
+        for _ in range(3):
+            batch = self.random_points(rng, 50, 100)
+            points += batch
+            result = triangulation.insert(batch)
+            expected = PointSet(points).triangulate()
+            assert result.pointset == PointSet(points)
+            assert TestInsertionOrder.triangle_set(
+                result
+            ) == TestInsertionOrder.triangle_set(expected)
+        assert triangulation.point_count == 450
+        assert triangulation.rebuilds == 0
+
+    def test_insert_outside_the_box_must_rebuild(self):
+        """Test that a point far from the others rebuilds the mesh."""
+        rng = random.Random(20)
+        points = self.random_points(rng, 100, 10)
+        triangulation = IncrementalTriangulation(PointSet(points))
+        result = triangulation.insert([Point(1000.0, 1000.0)])
+        expected = PointSet([*points, Point(1000.0, 1000.0)]).triangulate()
+        assert triangulation.rebuilds == 1
+        assert TestInsertionOrder.triangle_set(
+            result
+        ) == TestInsertionOrder.triangle_set(expected)
+
+    def test_insert_and_remove_empty_batches(self):
+        """Test that empty batches leave the triangulation unchanged."""
+        point_set = PointSet([Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0)])
+        triangulation = IncrementalTriangulation(point_set)
+        expected = point_set.triangulate().to_bytes()
+        assert triangulation.insert([]).to_bytes() == expected
+        assert triangulation.insert(PointSet([])).to_bytes() == expected
+        assert triangulation.remove([]).to_bytes() == expected
+        assert (triangulation.point_count, triangulation.rebuilds) == (3, 0)
+
+    def test_insert_duplicated_points_must_raise(self):
+        """Test that points already triangulated or given twice are rejected."""
+        point_set = PointSet([Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0)])
+        triangulation = IncrementalTriangulation(point_set)
+        with pytest.raises(ValueError, match="duplicated"):
+            triangulation.insert([Point(1.0, 0.0)])
+        with pytest.raises(ValueError, match="duplicated"):
+            triangulation.insert([Point(0.5, 0.2), Point(0.5, 0.2)])
+        assert triangulation.point_count == 3
+        assert (
+            triangulation.triangles().to_bytes() == point_set.triangulate().to_bytes()
+        )
+
+    def test_sliding_window_must_match_triangulation_from_scratch(self):
+        """Test that removing and inserting points keeps the Delaunay result."""
+        rng = random.Random(21)
+        window = self.random_points(rng, 300, 100)
+        triangulation = IncrementalTriangulation(PointSet(window))
+        for _ in range(5):
+            expired, window = window[:60], window[60:]
+            triangulation.remove(expired)
+            batch = self.random_points(rng, 60, 100)
+            window += batch
+            result = triangulation.insert(batch)
+            expected = PointSet(window).triangulate()
+            assert result.pointset == PointSet(window)
+            assert TestInsertionOrder.triangle_set(
+                result
+            ) == TestInsertionOrder.triangle_set(expected)
+        # Les points retirés ont fini par dépasser les points restants
+        assert triangulation.rebuilds == 1
+
+    def test_remove_from_cocircular_points_must_stay_delaunay(self):
+        """Test removals in a grid, whose holes have cocircular vertices."""
+        points = [Point(x, y) for x in range(6) for y in range(6)]
+        triangulation = IncrementalTriangulation(PointSet(points))
+        removed = [Point(2.0, 2.0), Point(3.0, 3.0), Point(0.0, 0.0)]
+        result = triangulation.remove(removed)
+        left = [point for point in points if point not in removed]
+        assert result.pointset == PointSet(left)
+        # Triangulation complète de l'enveloppe (19 points sur son bord),
+        # à cercles circonscrits vides
+        assert result.triangle_count == 2 * len(left) - 2 - 19
+        for triangle in result.triangles:
+            for point in left:
+                assert not triangle.is_point_in_circumcircle(point)
+
+    def test_remove_unknown_points_must_raise(self):
+        """Test that removing an unknown point or too many points fails."""
+        point_set = PointSet(
+            [Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0), Point(0.0, 1.0)]
+        )
+        triangulation = IncrementalTriangulation(point_set)
+        with pytest.raises(ValueError, match="not in the triangulation"):
+            triangulation.remove([Point(0.0, 0.0), Point(5.0, 5.0)])
+        with pytest.raises(ValueError, match="less than 3 points"):
+            triangulation.remove([Point(0.0, 0.0), Point(1.0, 1.0)])
+        assert triangulation.point_count == 4
+
+
+class TestConstrainedTriangulation:
+    """Test suite for the constrained Delaunay triangulation."""
+
+    # Le segment (0, 1) n'est pas une arête de Delaunay : (2, 3) la coupe
+    POINTS = [Point(0.0, 0.0), Point(4.0, 0.0), Point(2.0, 1.0), Point(2.0, -1.0)]
+
+    def test_segment_must_be_an_edge(self):
+        """Test that a segment replaces the Delaunay edges crossing it."""
+        point_set = PointSet(self.POINTS)
+        assert TestInsertionOrder.triangle_set(point_set.triangulate()) == {
+            (0, 2, 3),
+            (1, 2, 3),
+        }
+        triangles = point_set.triangulate(segments=[(1, 0)])
+        assert TestInsertionOrder.triangle_set(triangles) == {(0, 1, 2), (0, 1, 3)}
+
+    def test_long_segment_through_random_points(self):
+        """Test that a long segment is enforced without losing triangles."""
+        rng = random.Random(5)
+        points = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+        points += [Point(-1.0, -1.0), Point(101.0, 101.0)]
+        point_set = PointSet(points)
+        triangles = point_set.triangulate(segments=[(300, 301)])
+
+        assert triangles.triangle_count == point_set.triangulate().triangle_count
+        edges = {
+            frozenset(pair)
+            for triangle in TestInsertionOrder.triangle_set(triangles)
+            for pair in itertools.combinations(triangle, 2)
+        }
+        assert frozenset((300, 301)) in edges
+
+    def test_segment_through_a_point_is_split(self):
+        """Test that a segment through a point is made of two edges."""
+        point_set = PointSet([*self.POINTS, Point(1.0, 0.0)])
+        triangles = point_set.triangulate(segments=[(0, 1)])
+        edges = {
+            frozenset(pair)
+            for triangle in TestInsertionOrder.triangle_set(triangles)
+            for pair in itertools.combinations(triangle, 2)
+        }
+        assert {frozenset((0, 4)), frozenset((4, 1))} <= edges
+
+    def test_invalid_segments_must_raise(self):
+        """Test crossing, degenerate and unsupported segments."""
+        point_set = PointSet(self.POINTS)
+        with pytest.raises(ValueError, match="must not cross"):
+            point_set.triangulate(segments=[(0, 1), (2, 3)])
+        with pytest.raises(ValueError, match="missing point"):
+            point_set.triangulate(segments=[(0, 4)])
+        with pytest.raises(ValueError, match="distinct points"):
+            point_set.triangulate(segments=[(2, 2)])
+        with pytest.raises(ValueError, match="bowyer-watson"):
+            point_set.triangulate(engine="divide-and-conquer", segments=[(0, 1)])
+
+    def test_constrained_bytes_round_trip(self):
+        """Test the serialization of a PointSet with its segments."""
+        data = constrained_to_bytes(PointSet(self.POINTS), [(0, 1), (2, 3)])
+        assert len(data) == 4 + 8 * 4 + 4 + 8 * 2
+        point_set, segments = constrained_from_bytes(data)
+        assert point_set == PointSet(self.POINTS)
+        assert segments == [(0, 1), (2, 3)]
+        for body in (data[:-1], data + b"\0", data[:36]):
+            with pytest.raises(ValueError):
+                constrained_from_bytes(body)
+
+
+class TestConvexHull:
+    """Test suite for the convex hull and the boundary edges."""
+
+    def test_convex_hull_keeps_only_corners(self):
+        """Test that interior, collinear and duplicated points are left out."""
+        point_set = PointSet(
+            [
+                Point(1.0, 1.0),
+                Point(0.0, 0.0),
+                Point(2.0, 0.0),
+                Point(1.0, 0.0),
+                Point(2.0, 2.0),
+                Point(0.0, 2.0),
+                Point(2.0, 2.0),
+            ]
+        )
+        assert list(point_set.convex_hull()) == [1, 2, 4, 5]
+
+    def test_convex_hull_of_degenerate_sets(self):
+        """Test the hull of empty, coincident and collinear points."""
+        assert list(PointSet([]).convex_hull()) == []
+        assert list(PointSet([Point(1.0, 1.0)] * 3).convex_hull()) == [0]
+        collinear = PointSet([Point(2.0, 2.0), Point(0.0, 0.0), Point(1.0, 1.0)])
+        assert list(collinear.convex_hull()) == [1, 0]
+
+    def test_boundary_edges_follow_the_hull(self):
+        """Test that the boundary edges run counter-clockwise along the hull."""
+        rng = random.Random(3)
+        points = [Point(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(200)]
+        point_set = PointSet(points)
+        hull = list(point_set.convex_hull())
+
+        edges = point_set.triangulate().boundary_edges()
+        assert sorted(edges) == sorted(zip(hull, hull[1:] + hull[:1], strict=True))
+
+
+class TestPredicates:
+    """Test suite for the robust geometric predicates."""
+
+    # Point à 3 ulp de la droite y = x : le calcul flottant naïf donne 0
+    NEARLY_COLLINEAR = (0.5 + 3 * 2**-53, 0.5, 12.0, 12.0, 24.0, 24.0)
+
+    def test_orient2d_must_return_exact_sign(self):
+        """Test orient2d on points where the naive float determinant is 0."""
+        assert orient2d(*self.NEARLY_COLLINEAR) < 0
+        assert orient2d(0.0, 0.0, 1.0, 0.0, 0.0, 1.0) > 0
+        assert orient2d(1.0, 1.0, 2.0, 2.0, 3.0, 3.0) == 0
+
+    def test_incircle_must_return_zero_for_cocircular_points(self):
+        """Test incircle on the 4 corners of a square."""
+        assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0) == 0
+        assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.5, 0.5) > 0
+        assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 2.0, 2.0) < 0
+
+    def test_nearly_collinear_points_must_not_be_reported_collinear(self):
+        """Test check_colinearity on points where the naive determinant is 0."""
+        ax, ay, bx, by, cx, cy = self.NEARLY_COLLINEAR
+        point_set = PointSet([Point(ax, ay), Point(bx, by), Point(cx, cy)])
+        assert not point_set.check_colinearity()
+
+    def test_flat_convex_points_must_keep_all_hull_triangles(self):
+        """Test points in convex position on a very flat parabola."""
+        point_set = PointSet([Point(float(x), x * x * 1e-3) for x in range(30)])
+        assert point_set.triangulate().triangle_count == 28
+
+
+class TestMesh:
+    """Test suite for the flat adjacency Mesh."""
+
+    def test_mesh_must_reuse_removed_triangle_slots(self):
+        """Test that removed triangles go to the free list and are reused."""
+        mesh = Mesh([0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0])
+        first = mesh.add_triangle(0, 1, 2)
+        second = mesh.add_triangle(1, 3, 2)
+        mesh.neighbors[3 * first + 1] = second
+        mesh.remove_triangle(first)
+        assert not mesh.is_alive(first)
+        assert mesh.triangle_count == 1
+        assert mesh.triangles() == [(1, 3, 2)]
+
+        assert mesh.add_triangle(0, 1, 3) == first
+        assert mesh.free == []
+        assert len(mesh.vertices) == 6
+        assert mesh.neighbors[3 * first : 3 * first + 3] == [NO_NEIGHBOR] * 3
+        assert mesh.triangles() == [(0, 1, 3), (1, 3, 2)]
+
+    def test_mesh_neighbors_must_be_symmetric_after_insertions(self):
+        """Test that every shared edge is linked from both of its triangles."""
+        rng = random.Random(7)
+        xs = [rng.uniform(-10, 10) for _ in range(200)]
+        ys = [rng.uniform(-10, 10) for _ in range(200)]
+        mesh, locator = start_mesh(xs, ys, bounding_box(xs, ys))
+        insert_vertices(mesh, locator, list(range(200)))
+
+        vertices, neighbors = mesh.vertices, mesh.neighbors
+        assert len(vertices) // 3 == mesh.triangle_count + len(mesh.free)
+        border = 0
+        for t in range(len(vertices) // 3):
+            if not mesh.is_alive(t):
+                continue
+            for i in range(3):
+                a, b = vertices[3 * t + i], vertices[3 * t + (i + 1) % 3]
+                other = neighbors[3 * t + i]
+                if other == NO_NEIGHBOR:
+                    border += 1
+                    continue
+                assert mesh.is_alive(other)
+                # Le voisin porte la même arête dans l'autre sens et pointe vers t
+                j = vertices[3 * other : 3 * other + 3].index(b)
+                assert vertices[3 * other + (j + 1) % 3] == a
+                assert neighbors[3 * other + j] == t
+        # Seules les arêtes du super-triangle sont au bord
+        assert border == 3
+
+
+class TestTriangle:
+    """Test suite for the Triangle class."""
+
+    def test_triangle_circumcircle_must_be_centered_on_hypotenuse(self):
+        """Test the circumcircle of a right triangle."""
+        triangle = Triangle(Point(0.0, 0.0), Point(2.0, 0.0), Point(0.0, 2.0))
+        assert triangle.circumcenter == Point(1.0, 1.0)
+        assert triangle.circumradius == pytest.approx(2**0.5)
+
+    def test_triangle_is_point_in_circumcircle(self):
+        """Test points inside and outside the circumcircle."""
+        triangle = Triangle(Point(0.0, 0.0), Point(2.0, 0.0), Point(0.0, 2.0))
+        assert triangle.is_point_in_circumcircle(Point(1.5, 1.5))
+        assert not triangle.is_point_in_circumcircle(Point(2.1, 2.1))
+        assert not triangle.is_point_in_circumcircle(Point(2.0, 2.0))  # sur le cercle
+
 
 class TestSerialization:
     """Test suite for serialization functionality."""
@@ -116,6 +656,36 @@ class TestSerialization:
         assert triangles_bytes == valid_triangles_bytes
         assert isinstance(triangles_bytes, bytes)
 
+    def test_triangles_built_from_triangle_objects_must_return_same_bytes(self):
+        """Test that Triangles built from Triangle objects serialize like indices."""
+        points = [Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0), Point(0.0, 1.0)]
+        point_set = PointSet(points)
+        triangles = Triangles(
+            point_set,
+            [
+                Triangle(points[2], points[0], points[1]),
+                Triangle(points[3], points[2], points[0]),
+            ],
+        )
+        expected_bytes = point_set.to_bytes() + struct.pack(
+            "<LLLLLLL", 2, 0, 1, 2, 0, 2, 3
+        )
+        assert triangles.to_bytes() == expected_bytes
+
+    def test_triangles_iter_bytes_must_join_into_to_bytes(self):
+        """Test that chunked serialization gives the bytes of to_bytes."""
+        random.seed(3)
+        point_set = PointSet(
+            [Point(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(50)]
+        )
+        triangles = point_set.triangulate()
+        expected_bytes = triangles.to_bytes()
+        assert triangles.byte_length == len(expected_bytes)
+        for chunk_size in (1, 12, 100, 1 << 16):
+            chunks = list(triangles.iter_bytes(chunk_size))
+            assert b"".join(chunks) == expected_bytes
+            assert max(len(chunk) for chunk in chunks) <= max(chunk_size, 4)
+
 
 class TestDeserialization:
     """Test suite for deserialization functionality."""
@@ -138,3 +708,456 @@ class TestDeserialization:
         valid_point_set = PointSet([Point(5.0, 7.0), Point(3.0, 4.0)])
         assert point_set == valid_point_set
         assert isinstance(point_set, PointSet)
+
+    def test_pointset_from_bytes_then_to_bytes_must_return_same_bytes(self):
+        """Test that a decoded PointSet serializes back to the same bytes."""
+        point_set_bytes = struct.pack("<Lffffff", 3, 0.5, 1.25, -2.0, 3.0, 4.0, 0.1)
+        point_set = PointSet.from_bytes(point_set_bytes)
+        assert point_set.point_count == 3
+        assert point_set.to_bytes() == point_set_bytes
+
+    def test_pointset_from_truncated_bytes_must_raise(self):
+        """Test that PointSet.from_bytes rejects data shorter than announced."""
+        truncated_bytes = struct.pack("<Lfff", 2, 5.0, 7.0, 3.0)
+        with pytest.raises(ValueError, match="shorter than the point count"):
+            PointSet.from_bytes(truncated_bytes)
+
+    def test_pointset_decoder_must_match_from_bytes(self):
+        """Test that decoding by chunks of any size gives the same PointSet."""
+        point_set_bytes = struct.pack("<Lffffff", 3, 0.5, 1.25, -2.0, 3.0, 4.0, 0.1)
+        lengths = (len(point_set_bytes), None)  # None : corps découpé
+        for size, length in itertools.product((1, 3, 5, len(point_set_bytes)), lengths):
+            decoder = PointSetDecoder(length)
+            for start in range(0, len(point_set_bytes), size):
+                decoder.feed(point_set_bytes[start : start + size])
+            point_set = decoder.finish()
+            assert point_set == PointSet.from_bytes(point_set_bytes)
+            assert point_set.to_bytes() == point_set_bytes
+
+    def test_pointset_decoder_must_reject_mismatched_lengths(self):
+        """Test that truncated or oversized bodies are rejected early."""
+        point_set_bytes = struct.pack("<Lffff", 2, 5.0, 7.0, 3.0, 4.0)
+
+        # Longueur annoncée incohérente : refusée dès l'en-tête
+        with pytest.raises(ValueError, match="does not match the point count"):
+            PointSetDecoder(len(point_set_bytes) + 8).feed(point_set_bytes[:4])
+
+        decoder = PointSetDecoder()
+        with pytest.raises(ValueError, match="longer than the point count"):
+            decoder.feed(point_set_bytes + b"\0")
+
+        decoder = PointSetDecoder()
+        decoder.feed(point_set_bytes[:-1])
+        with pytest.raises(ValueError, match="shorter than the point count"):
+            decoder.finish()
+
+    def test_pointset_decoder_must_not_trust_count_of_chunked_body(self):
+        """Test that an unknown length grows the coordinates as bytes arrive."""
+        tracemalloc.start()
+        try:
+            decoder = PointSetDecoder()
+            decoder.feed(struct.pack("<L", 0xFFFFFFFF))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 1024 * 1024
+        with pytest.raises(ValueError, match="shorter than the point count"):
+            decoder.finish()
+
+
+class TestTriangulationCache:
+    """Test suite for the triangulation result cache."""
+
+    def test_cache_hit_by_id_and_by_content(self):
+        """Test that a stored result is found by ID and by content digest."""
+        cache = TriangulationCache(max_bytes=100, ttl=60.0)
+        digest = cache.digest(b"pointset")
+        assert cache.get(digest, "bowyer-watson", "a") is None
+        cache.put("a", digest, "bowyer-watson", b"result")
+
+        assert cache.get_by_id("a", "bowyer-watson") == b"result"
+        assert cache.get_by_id("b", "bowyer-watson") is None
+        assert cache.get(digest, "bowyer-watson", "b") == b"result"
+        assert cache.get_by_id("b", "bowyer-watson") == b"result"
+        assert cache.get(digest, "divide-and-conquer", "a") is None
+        assert cache.stats() == {"entries": 1, "size": 6, "hits": 3, "misses": 3}
+
+    def test_cache_must_evict_least_recently_used_entries(self):
+        """Test that the cache stays under its size bound."""
+        cache = TriangulationCache(max_bytes=10, ttl=60.0)
+        cache.put("a", b"a", "bowyer-watson", b"aaaa")
+        cache.put("b", b"b", "bowyer-watson", b"bbbb")
+        cache.get_by_id("a", "bowyer-watson")  # "a" devient le plus récent
+        cache.put("c", b"c", "bowyer-watson", b"cccc")
+
+        assert cache.size == 8
+        assert cache.get_by_id("b", "bowyer-watson") is None
+        assert cache.get_by_id("a", "bowyer-watson") == b"aaaa"
+        cache.put("d", b"d", "bowyer-watson", b"d" * 11)  # Plus grand que le cache
+        assert cache.get_by_id("d", "bowyer-watson") is None
+
+    def test_cache_entries_must_expire(self):
+        """Test that entries are not served after their time-to-live."""
+        now = [0.0]
+        cache = TriangulationCache(max_bytes=100, ttl=10.0, clock=lambda: now[0])
+        cache.put("a", b"a", "bowyer-watson", b"result")
+        now[0] = 9.0
+        assert cache.get_by_id("a", "bowyer-watson") == b"result"
+        now[0] = 10.0
+        assert cache.get_by_id("a", "bowyer-watson") is None
+        assert cache.size == 0
+
+
+class TestDiskCache:
+    """Test suite for the on-disk triangulation cache."""
+
+    def test_disk_cache_must_return_stored_payload(self, tmp_path):
+        """Test a round trip through the disk cache, with no temporary file left."""
+        cache = DiskCache(str(tmp_path), max_bytes=100)
+        digest = TriangulationCache.digest(b"pointset")
+        assert cache.get(digest, "bowyer-watson") is None
+        cache.put(digest, "bowyer-watson", b"result")
+
+        # Une autre instance (un autre worker) voit le même fichier
+        mapped = DiskCache(str(tmp_path), max_bytes=100).get(digest, "bowyer-watson")
+        assert mapped is not None
+        assert mapped[:] == b"result"
+        mapped.close()
+        assert [path.suffix for path in tmp_path.iterdir()] == [DiskCache.SUFFIX]
+
+    def test_disk_cache_must_evict_over_size_bound(self, tmp_path):
+        """Test that the oldest payloads are removed over the size bound."""
+        cache = DiskCache(str(tmp_path), max_bytes=10)
+        cache.put(b"a", "bowyer-watson", b"aaaa")
+        os.utime(tmp_path / f"61-bowyer-watson{DiskCache.SUFFIX}", (0, 0))
+        cache.put(b"b", "bowyer-watson", b"bbbb")
+        cache.put(b"c", "bowyer-watson", b"cccc")
+
+        assert cache.get(b"a", "bowyer-watson") is None
+        for digest in (b"b", b"c"):
+            mapped = cache.get(digest, "bowyer-watson")
+            assert mapped is not None
+            mapped.close()
+
+    def test_disk_cache_must_track_size_without_listing(self, tmp_path, monkeypatch):
+        """Test that writes under the size bound keep a running total."""
+        cache = DiskCache(str(tmp_path), max_bytes=100)
+        cache.put(b"a", "bowyer-watson", b"aaaa")
+
+        def scan():
+            raise AssertionError("The directory must not be listed")
+
+        monkeypatch.setattr(cache, "_scan", scan)
+        cache.put(b"b", "bowyer-watson", b"bbbb")
+        cache.put(b"b", "bowyer-watson", b"bbbbbb")  # Remplace le fichier
+        assert cache.size == 10
+        assert DiskCache(str(tmp_path), max_bytes=100).size == 10
+
+    def test_disk_cache_must_keep_counters_under_concurrent_use(self, tmp_path):
+        """Test the size estimate and the counters with many threads."""
+        cache = DiskCache(str(tmp_path), max_bytes=10_000)
+
+        def use(worker):
+            for i in range(50):
+                digest = bytes([worker, i % 10])
+                cache.put(digest, "bowyer-watson", b"x" * (i % 7 + 1))
+                mapped = cache.get(digest, "bowyer-watson")
+                if mapped is not None:
+                    mapped.close()
+
+        threads = [threading.Thread(target=use, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        on_disk = sum(path.stat().st_size for path in tmp_path.iterdir())
+        assert cache.size == on_disk
+        assert cache.hits + cache.misses == 8 * 50
+
+
+class TestSingleFlight:
+    """Test suite for the coalescing of concurrent computations."""
+
+    def test_single_flight_must_share_result_and_errors(self):
+        """Test that waiting callers get the leader's result or exception."""
+        group = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        results = []
+
+        def compute():
+            started.set()
+            release.wait(timeout=5)
+            return object()
+
+        def call():
+            results.append(group.do("key", compute))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(timeout=5)
+        followers = [threading.Thread(target=call) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        while group.shared < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+        assert (group.calls, group.shared) == (1, 3)
+
+        # La clé est libérée : un nouvel appel recalcule, et propage l'erreur
+        def fail():
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError, match="failed"):
+            group.do("key", fail)
+        assert group.calls == 2
+
+    def test_async_single_flight_must_share_result_and_errors(self):
+        """Test that waiting coroutines get the leader's result or exception."""
+        group = AsyncSingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            return object()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        async def scenario():
+            results = await asyncio.gather(
+                *(group.do("key", compute) for _ in range(4))
+            )
+            errors = await asyncio.gather(
+                *(group.do("key", fail) for _ in range(2)), return_exceptions=True
+            )
+            return results, errors
+
+        results, errors = asyncio.run(scenario())
+        assert all(result is results[0] for result in results)
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert (group.calls, group.shared) == (2, 4)
+
+    def test_async_single_flight_must_survive_first_caller_cancellation(self):
+        """Test that cancelling the first caller does not cancel the others."""
+        group = AsyncSingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def scenario():
+            first = asyncio.ensure_future(group.do("key", compute))
+            second = asyncio.ensure_future(group.do("key", compute))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            result = await second
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return result
+
+        assert asyncio.run(scenario()) == "result"
+        assert (group.calls, group.shared) == (1, 1)
+
+
+class FakeManagerHandler(BaseHTTPRequestHandler):
+    """PointSet Manager answering from the statuses queued on its server."""
+
+    protocol_version = "HTTP/1.1"  # Connexions persistantes
+
+    def do_GET(self):
+        """Answer with the next queued status, 200 when the queue is empty."""
+        self.server.paths.append(self.path)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = self.server.body if status == 200 else b""
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def setup(self):
+        """Count the connections opened by the client."""
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+class TestPointSetManagerClient:
+    """Test suite for the PointSet Manager HTTP client."""
+
+    @pytest.fixture
+    def server(self):
+        """Fixture to provide a local PointSet Manager."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeManagerHandler)
+        server.paths, server.statuses, server.connections = [], [], 0
+        server.body = b"pointset"
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def client_for(port: int, **options) -> PointSetManagerClient:
+        """Return a client of a local manager that never really sleeps."""
+        options.setdefault("sleep", lambda delay: None)
+        return PointSetManagerClient(f"http://127.0.0.1:{port}", **options)
+
+    def test_client_must_reuse_connections(self, server):
+        """Test that consecutive fetches share one keep-alive connection."""
+        client = self.client_for(server.server_address[1])
+        assert client.fetch_pointset("a") == b"pointset"
+        assert client.fetch_pointset("b") == b"pointset"
+        assert server.paths == ["/pointset/a", "/pointset/b"]
+        assert server.connections == 1
+        client.close()
+
+    def test_client_must_raise_not_found(self, server):
+        """Test that a 404 of the manager raises PointSetNotFoundError."""
+        server.statuses = [404]
+        client = self.client_for(server.server_address[1])
+        with pytest.raises(PointSetNotFoundError):
+            client.fetch_pointset("a")
+        client.close()
+
+    def test_client_must_retry_with_backoff(self, server):
+        """Test that transient errors are retried with a growing delay."""
+        server.statuses = [503, 502]
+        delays = []
+        client = self.client_for(
+            server.server_address[1], backoff=0.1, sleep=delays.append
+        )
+        assert client.fetch_pointset("a") == b"pointset"
+        assert delays == [0.1, 0.2]
+        client.close()
+
+    def test_client_must_decode_pointset_while_receiving(self, server):
+        """Test that a decoded fetch returns the PointSet and its digest."""
+        point_set = PointSet([Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 1.0)])
+        server.body = point_set.to_bytes()
+        client = self.client_for(server.server_address[1])
+        decoded, digest = client.fetch_decoded_pointset("a")
+        assert decoded == point_set
+        assert digest == TriangulationCache.digest(server.body)
+
+        # Un corps incohérent avec son nombre de points n'est pas retenté
+        server.body = server.body[:-4]
+        with pytest.raises(ValueError):
+            client.fetch_decoded_pointset("b")
+        assert server.paths == ["/pointset/a", "/pointset/b"]
+        client.close()
+
+    def test_client_circuit_must_open_when_manager_is_down(self):
+        """Test that the circuit fails fast, then lets a trial through."""
+        with socket.socket() as probe:  # Port libre sur lequel rien n'écoute
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        now = [0.0]
+        client = self.client_for(
+            port,
+            retries=0,
+            failure_threshold=2,
+            reset_timeout=30.0,
+            clock=lambda: now[0],
+        )
+        for _ in range(2):
+            with pytest.raises(ManagerUnavailableError):
+                client.fetch_pointset("a")
+        with pytest.raises(CircuitOpenError):
+            client.fetch_pointset("a")
+
+        now[0] = 30.0  # Demi-ouvert : une requête d'essai, qui échoue encore
+        with pytest.raises(ManagerUnavailableError) as error:
+            client.fetch_pointset("a")
+        assert not isinstance(error.value, CircuitOpenError)
+        with pytest.raises(CircuitOpenError):
+            client.fetch_pointset("a")
+
+    def test_client_circuit_must_survive_interrupted_trial(self, monkeypatch):
+        """Test that an unexpected error in the trial keeps the circuit usable."""
+        with socket.socket() as probe:  # Port libre sur lequel rien n'écoute
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        now = [0.0]
+        client = self.client_for(
+            port, retries=0, failure_threshold=1, clock=lambda: now[0]
+        )
+        with pytest.raises(ManagerUnavailableError):
+            client.fetch_pointset("a")
+
+        now[0] = 30.0
+        get = client._get
+
+        def interrupted(*args):
+            raise RuntimeError("interrupted")
+
+        monkeypatch.setattr(client, "_get", interrupted)
+        with pytest.raises(RuntimeError):
+            client.fetch_pointset("a")
+
+        # L'essai abandonné laisse passer la requête suivante
+        monkeypatch.setattr(client, "_get", get)
+        with pytest.raises(ManagerUnavailableError) as error:
+            client.fetch_pointset("a")
+        assert not isinstance(error.value, CircuitOpenError)
+
+
+class TestAsyncPointSetManagerClient:
+    """Test suite for the asyncio PointSet Manager HTTP client."""
+
+    server = TestPointSetManagerClient.server
+
+    @staticmethod
+    def client_for(port: int, **options) -> AsyncPointSetManagerClient:
+        """Return an asyncio client of a local manager."""
+        return AsyncPointSetManagerClient(f"http://127.0.0.1:{port}", **options)
+
+    @staticmethod
+    def run(client: AsyncPointSetManagerClient, *ids: str) -> list:
+        """Fetch PointSets one after the other, then close the client."""
+
+        async def scenario():
+            results = []
+            try:
+                for pointset_id in ids:
+                    try:
+                        results.append(await client.fetch_pointset(pointset_id))
+                    except Exception as error:
+                        results.append(error)
+            finally:
+                await client.close()
+            return results
+
+        return asyncio.run(scenario())
+
+    def test_async_client_must_reuse_connections(self, server):
+        """Test that consecutive fetches share one keep-alive connection."""
+        client = self.client_for(server.server_address[1])
+        assert self.run(client, "a", "b") == [b"pointset", b"pointset"]
+        assert server.paths == ["/pointset/a", "/pointset/b"]
+        assert server.connections == 1
+
+    def test_async_client_must_raise_not_found(self, server):
+        """Test that a 404 of the manager raises PointSetNotFoundError."""
+        server.statuses = [404]
+        client = self.client_for(server.server_address[1])
+        (error,) = self.run(client, "a")
+        assert isinstance(error, PointSetNotFoundError)
+
+    def test_async_client_must_retry_with_backoff(self, server):
+        """Test that transient errors are retried with a growing delay."""
+        server.statuses = [503, 502]
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        client = self.client_for(server.server_address[1], backoff=0.1, sleep=sleep)
+        assert self.run(client, "a") == [b"pointset"]
+        assert delays == [0.1, 0.2]